@@ -4,30 +4,115 @@ Uses environment variables for secure credential management.
 """
 
 import os
-from dotenv import load_dotenv
+from contextlib import contextmanager
+from functools import cache, lru_cache
+from urllib.parse import quote
+from dotenv import find_dotenv, dotenv_values
+from psycopg2.pool import ThreadedConnectionPool
+
+@cache
+def _load_env():
+    """
+    Load the .env file into os.environ once per process.
+
+    Mirrors load_dotenv(): values already present in os.environ win. The parsed
+    values are only held in memory, so credentials are never written to disk.
+    """
+    env_path = find_dotenv()
+    if not env_path:
+        return
+
+    for key, value in dotenv_values(env_path).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
 
 # Load environment variables from .env file
-load_dotenv()
+_load_env()
+
+# Required environment variables for a database connection
+REQUIRED_VARS = ['DB_HOST', 'DB_NAME', 'DB_USER', 'DB_PASSWORD']
+
+# Database configuration, populated once from an environment snapshot
+_ENV = {}
+DB_CONFIG = {}
+DB_CONNECTION_STRING = ''
+
+def _load_settings():
+    """Snapshot os.environ and resolve the database settings from it."""
+    global _ENV, DB_CONNECTION_STRING
+
+    _ENV = dict(os.environ)
+    DB_CONFIG.update({
+        'host': _ENV.get('DB_HOST', 'localhost'),
+        'port': int(_ENV.get('DB_PORT', '5432')),
+        'database': _ENV.get('DB_NAME', 'neondb'),
+        'user': _ENV.get('DB_USER', 'postgres'),
+        'password': _ENV.get('DB_PASSWORD', '')
+    })
+
+    get_connection_string.cache_clear()
+    DB_CONNECTION_STRING = get_connection_string()
 
-# Database configuration from environment variables
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'port': int(os.getenv('DB_PORT', '5432')),
-    'database': os.getenv('DB_NAME', 'neondb'),
-    'user': os.getenv('DB_USER', 'postgres'),
-    'password': os.getenv('DB_PASSWORD', '')
-}
+@lru_cache(maxsize=1)
+def get_connection_string() -> str:
+    """Build the connection string once, URL-encoding the credentials."""
+    user = quote(DB_CONFIG['user'], safe='')
+    password = quote(DB_CONFIG['password'], safe='')
+    return f"postgresql://{user}:{password}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
 
-# Construct the connection string
-DB_CONNECTION_STRING = f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
+_load_settings()
 
 # Validate required environment variables
+@cache
 def validate_config():
     """Validate that required environment variables are set."""
-    required_vars = ['DB_HOST', 'DB_NAME', 'DB_USER', 'DB_PASSWORD']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-    
+    missing_vars = [var for var in REQUIRED_VARS if not _ENV.get(var)]
+
     if missing_vars:
         raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
-    
-    return True 
\ No newline at end of file
+
+    return True
+
+def clear_cache():
+    """Re-read the environment and refresh the cached settings (e.g. in tests)."""
+    close_pool()
+    _load_settings()
+    validate_config.cache_clear()
+
+# Process-wide connection pool, created on first use
+_POOL = None
+
+def get_pool(minconn: int = 1, maxconn: int = 10) -> ThreadedConnectionPool:
+    """Return the shared connection pool for DB_CONNECTION_STRING."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadedConnectionPool(minconn, maxconn, dsn=DB_CONNECTION_STRING)
+    return _POOL
+
+@contextmanager
+def get_conn():
+    """
+    Borrow a connection from the shared pool and return it when done.
+
+    The transaction is committed if the block succeeds and rolled back if it
+    raises, so a connection always goes back to the pool idle; a connection
+    that was closed is discarded instead.
+    """
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
+
+def close_pool():
+    """Close all pooled connections."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.closeall()
+        _POOL = None
@@ -1,18 +1,476 @@
-so"""
+"""
 Data importer module for importing Lincoln student data from Excel file into Neon Postgres database.
 """
 
 import pandas as pd
+import numpy as np
 import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_batch, execute_values
 from datetime import datetime
-import chardet
+import codecs
 import logging
 from typing import List, Dict, Any, Optional
 import re
+import os
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import parent_process
+from itertools import repeat
+from collections import Counter
+from importlib.util import find_spec
 from pathlib import Path
+from pandas.api.types import union_categoricals
 from config import DB_CONNECTION_STRING
+from orphans_loader import bulk_load
+from functools import lru_cache
+from contextlib import contextmanager
 import unittest
 
+# Prefer the C implementations of encoding detection when installed
+try:
+    import cchardet as chardet
+except ImportError:
+    try:
+        import charset_normalizer as chardet
+    except ImportError:
+        import chardet
+
+# Parse well-formed CSV files with pyarrow's multithreaded reader when installed
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Number of leading bytes sampled for encoding detection
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Candidate CSV delimiters, in order of preference
+CSV_DELIMITERS = ('|', ',', '\t')
+
+# Number of leading bytes sampled for delimiter detection
+DELIMITER_SAMPLE_SIZE = 64 * 1024
+
+# Byte order marks that settle the encoding without running the detector;
+# the UTF-32 marks come first because they start with the UTF-16 ones
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+)
+
+# Rows per worker chunk when cleaning one large file in parallel
+CLEAN_CHUNK_ROWS = 50_000
+
+# Rows per INSERT statement when COPY is not available; each page costs one
+# round-trip, so N rows take N / INSERT_PAGE_SIZE round-trips instead of N
+INSERT_PAGE_SIZE = 1000
+# Sort memory for building the students indexes after a bulk load
+INDEX_MAINTENANCE_WORK_MEM = '512MB'
+
+# Range of Unix timestamps (seconds) accepted as dates
+MIN_TIMESTAMP = pd.Timestamp('1800-01-01').timestamp()
+MAX_TIMESTAMP = pd.Timestamp('2100-01-01').timestamp()
+
+# Run vectorized text cleaning on Arrow-backed strings when pyarrow is installed
+STRING_DTYPE = 'string[pyarrow]' if find_spec('pyarrow') else 'string'
+
+# Strings read as missing values, matching pandas.read_csv's defaults
+_CSV_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Use the Rust-based calamine Excel reader when installed
+EXCEL_ENGINE = 'calamine' if find_spec('python_calamine') else 'openpyxl'
+
+# Precompiled patterns used on the per-value cleaning path
+_YEAR_RE = re.compile(r'\d{4}')
+_RANGE_RE = re.compile(r'\d{4}-\d{4}')
+_FULL_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_SIMPLE_YEAR_RE = re.compile(r'\d{4}(?:\.0)?$')
+_AGE_RE = re.compile(r'age\s*(\d+)')
+_NAME_STRIP_RE = re.compile(r'[^\w\s\-\.]')
+# Y-M-D or Y/M/D | M/D/Y (or D/M/Y) | Y-M or Y/M | Y; as with strptime's %d,
+# a day may be padded with a space
+_DATE_RE = re.compile(r'(\d{4})([-/])(\d{1,2})\2([ \d]?\d)|(\d{1,2})/([ \d]?\d)/(\d{4})|(\d{4})[-/](\d{1,2})|(\d{4})')
+# No backreferences, so the pattern also runs on pyarrow's RE2 engine
+_PLAIN_DATE_PATTERN = r'\d{4}(?:-\d{1,2}(?:-\d{1,2})?|/\d{1,2}(?:/\d{1,2})?)?|\d{1,2}/\d{1,2}/\d{4}'
+_QUALIFIER_RE = re.compile(r'\b(?:about|circa|before|after|early|mid|late)\b|\bc\.', re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+# Date qualifiers, grouped by the uncertainty type they imply
+_QUAL_CLASSIFY_RE = re.compile(
+    r'(?P<approximate>about|c\.|circa)|(?P<before>before)|(?P<after>after)|(?P<period_qualifier>early|mid|late)'
+)
+# Raw column dtypes accepted by check_column_names
+_TEXT_DTYPES = ('object', 'string', 'str')
+_EXPECTED_DTYPES = {
+    'census_record_1900': _TEXT_DTYPES,
+    'indian_name': _TEXT_DTYPES,
+    'family_name': _TEXT_DTYPES,
+    'english_given_name': _TEXT_DTYPES,
+    'alias': _TEXT_DTYPES,
+    'sex': _TEXT_DTYPES,
+    'year_of_birth': ('int64', 'float64', 'Int64', 'Float64') + _TEXT_DTYPES,
+    'arrival_at_lincoln': ('datetime64[ns]',) + _TEXT_DTYPES,
+    'departure_from_lincoln': ('datetime64[ns]',) + _TEXT_DTYPES,
+    'nation': _TEXT_DTYPES,
+    'band': _TEXT_DTYPES,
+    'agency': _TEXT_DTYPES,
+    'trade': _TEXT_DTYPES,
+    'source': _TEXT_DTYPES,
+    'comments': _TEXT_DTYPES,
+    'cause_of_death': _TEXT_DTYPES,
+    'cemetery_burial': _TEXT_DTYPES,
+    'relevant_links': _TEXT_DTYPES
+}
+
+# Uncertainty type reported when a date has several qualifiers
+_QUALIFIER_PRIORITY = ('approximate', 'before', 'after', 'period_qualifier')
+
+# Column mappings for the different source file formats
+COLUMN_MAPPINGS = {
+    # Format 1: Spaces and proper capitalization
+    'spaced': {
+        'Census Record 1900': 'census_record_1900',
+        'Indian Name': 'indian_name',
+        'Tribal Name': 'indian_name',  # Added this mapping
+        'Family Name': 'family_name',
+        'English given name': 'english_given_name',
+        'Alias': 'alias',
+        'Sex': 'sex',
+        'Year of birth': 'year_of_birth',
+        'Arrival at Lincoln': 'arrival_at_lincoln',
+        'Departure from Lincoln': 'departure_from_lincoln',
+        'Nation': 'nation',
+        'Band': 'band',
+        'Agency': 'agency',
+        'Trade': 'trade',
+        'Source': 'source',
+        'Comments': 'comments',
+        'Cause of Death': 'cause_of_death',
+        'Cemetery / Burial': 'cemetery_burial',
+        'Cemetery / Burial with protective quotes': 'cemetery_burial',  # Added this mapping
+        'Relevant Links': 'relevant_links'
+    },
+    # Format 2: CamelCase without spaces
+    'camel': {
+        'censusRecord1900': 'census_record_1900',
+        'tribalName': 'indian_name',
+        'familyName': 'family_name',
+        'englishGivenName': 'english_given_name',
+        'alias': 'alias',
+        'sex': 'sex',
+        'yearOfBirth': 'year_of_birth',
+        'arrivalAtLincoln': 'arrival_at_lincoln',
+        'departureFromLincoln': 'departure_from_lincoln',
+        'nation': 'nation',
+        'band': 'band',
+        'agency': 'agency',
+        'trade': 'trade',
+        'source': 'source',
+        'comments': 'comments',
+        'causeOfDeath': 'cause_of_death',
+        'cemeteryBurial': 'cemetery_burial',
+        'relevantLinks': 'relevant_links'
+    },
+    # Format 3: Underscore separated
+    'underscore': {
+        'census_record_1900': 'census_record_1900',
+        'indian_name': 'indian_name',
+        'family_name': 'family_name',
+        'english_given_name': 'english_given_name',
+        'alias': 'alias',
+        'sex': 'sex',
+        'year_of_birth': 'year_of_birth',
+        'arrival_at_lincoln': 'arrival_at_lincoln',
+        'departure_from_lincoln': 'departure_from_lincoln',
+        'nation': 'nation',
+        'band': 'band',
+        'agency': 'agency',
+        'trade': 'trade',
+        'source': 'source',
+        'comments': 'comments',
+        'cause_of_death': 'cause_of_death',
+        'cemetery_burial': 'cemetery_burial',
+        'relevant_links': 'relevant_links'
+    },
+    # Format 4: Short names
+    'short': {
+        'census': 'census_record_1900',
+        'tribal': 'indian_name',
+        'family': 'family_name',
+        'english': 'english_given_name',
+        'alias': 'alias',
+        'sex': 'sex',
+        'birth': 'year_of_birth',
+        'arrival': 'arrival_at_lincoln',
+        'departure': 'departure_from_lincoln',
+        'nation': 'nation',
+        'band': 'band',
+        'agency': 'agency',
+        'trade': 'trade',
+        'source': 'source',
+        'comments': 'comments',
+        'death': 'cause_of_death',
+        'burial': 'cemetery_burial',
+        'links': 'relevant_links'
+    },
+    # Format 5: Rewritten_Data.csv format
+    'reworked': {
+        '0': 'indian_name',
+        '1': 'family_name',
+        '2': 'english_given_name',
+        '3': 'alias',
+        '4': 'sex',
+        '5': 'year_of_birth',
+        '6': 'arrival_at_lincoln',
+        '7': 'departure_from_lincoln',
+        '8': 'nation',
+        '9': 'band',
+        '10': 'agency',
+        '11': 'trade',
+        '12': 'source',
+        '13': 'comments',
+        '14': 'cause_of_death',
+        '15': 'cemetery_burial',
+        '16': 'relevant_links'
+    }
+}
+
+# Target columns of the students table, in source order
+STUDENT_COLUMNS = list(dict.fromkeys(COLUMN_MAPPINGS['spaced'].values()))
+
+# Columns recording how a year or date value was interpreted
+UNCERTAINTY_COLUMNS = [
+    f'{column}_{suffix}'
+    for column in ('year_of_birth', 'arrival_at_lincoln', 'departure_from_lincoln')
+    for suffix in ('uncertain', 'uncertainty_type', 'original_text')
+]
+
+# Columns written by import_to_db, in INSERT order
+STUDENT_INSERT_COLUMNS = [
+    'census_record_1900', 'indian_name', 'family_name',
+    'english_given_name', 'alias', 'sex',
+    'year_of_birth', 'year_of_birth_uncertain', 'year_of_birth_uncertainty_type', 'year_of_birth_original_text',
+    'arrival_at_lincoln', 'arrival_at_lincoln_uncertain', 'arrival_at_lincoln_uncertainty_type', 'arrival_at_lincoln_original_text',
+    'departure_from_lincoln', 'departure_from_lincoln_uncertain', 'departure_from_lincoln_uncertainty_type', 'departure_from_lincoln_original_text',
+    'nation', 'band', 'agency', 'trade', 'source',
+    'comments', 'cause_of_death', 'cemetery_burial',
+    'relevant_links'
+]
+
+# Columns written by import_orphans_to_db, in load order
+ORPHAN_INSERT_COLUMNS = [
+    'family_name', 'given_name', 'aliases', 'birth_date', 'arrival', 'departure',
+    'scholarships', 'assignments', 'situation_1878', 'assignment_scholarship_year',
+    'references', 'comments', 'birth_date_original_text', 'birth_date_uncertain',
+    'arrival_original_text', 'arrival_uncertain', 'arrival_at_lincoln',
+    'departure_original_text', 'departure_uncertain', 'departure_at_lincoln',
+    'departure_from_lincoln'
+]
+
+# Maximum lengths of the students table's VARCHAR/CHAR columns
+STRING_LIMITS = {
+    'census_record_1900': 100,
+    'indian_name': 500,
+    'family_name': 200,
+    'english_given_name': 200,
+    'alias': 200,
+    'sex': 1,
+    'nation': 200,
+    'band': 200,
+    'agency': 200,
+    'trade': 200,
+    'cemetery_burial': 500
+}
+
+def _canon(name: str) -> str:
+    """Reduce a column name to a lowercase alphanumeric key, e.g. 'Indian Name' -> 'indianname'."""
+    return _NON_ALNUM_RE.sub('', str(name).lower())
+
+# Every known column name spelling, keyed by its canonical form
+_CANONICAL_COLUMNS = {
+    _canon(name): column
+    for format_name, mapping in COLUMN_MAPPINGS.items() if format_name != 'reworked'
+    for name, column in mapping.items()
+}
+
+@lru_cache(maxsize=100_000)
+def _clean_date_text(date_str: str) -> tuple[Optional[datetime], bool, Optional[str]]:
+    """Clean a stripped, non-null date string; cached because source values repeat heavily."""
+    lowered = date_str.lower()
+    if not date_str or lowered in ['nan', 'none', 'null', '', 'nat']:
+        return None, False, None
+    
+    # Handle multiple dates
+    if date_str.find(';') != -1:
+        date_str = date_str.split(';')[0].strip()
+        return _parse_date(date_str, True, 'multiple_dates')
+    
+    # Handle date ranges
+    if _RANGE_RE.match(date_str):
+        date_str = date_str.split('-')[0]
+        return _parse_date(date_str, True, 'range')
+    
+    # Handle "about"/"c."/"circa", "before"/"after" and "early"/"mid"/"late"
+    # qualifiers, classifying all of them in a single scan
+    found = {match.lastgroup for match in _QUAL_CLASSIFY_RE.finditer(lowered)}
+    for uncertainty_type in _QUALIFIER_PRIORITY:
+        if uncertainty_type in found:
+            return _parse_date(date_str, True, uncertainty_type)
+    
+    # Try standard formats
+    return _parse_date(date_str, False, None)
+
+def _parse_date(date_str: str, is_uncertain: bool, uncertainty_type: Optional[str]) -> tuple[Optional[datetime], bool, Optional[str]]:
+    """Helper to parse dates with uncertainty tracking."""
+    # Clean the date string
+    date_str = str(date_str).strip()
+    
+    # Remove common qualifiers while preserving the date
+    cleaned_date_str = _QUALIFIER_RE.sub('', date_str).strip()
+    
+    # Try standard date formats, building the date from the matched fields
+    match = _DATE_RE.fullmatch(cleaned_date_str)
+    if match:
+        y, _, m, d, first, second, mdy_y, ym_y, ym_m, year = match.groups()
+        if y is not None:
+            candidates = [(y, m, d)]
+        elif mdy_y is not None:
+            # Month first, then day first; a space-padded second field can only be the day
+            candidates = [(mdy_y, first, second)]
+            if not second.startswith(' '):
+                candidates.append((mdy_y, second, first))
+        elif ym_y is not None:
+            candidates = [(ym_y, ym_m, 1)]
+        else:
+            candidates = [(year, 1, 1)]
+        
+        for y, m, d in candidates:
+            try:
+                parsed_date = datetime(int(y), int(m), int(d))
+            except ValueError:
+                continue
+            if 1800 <= parsed_date.year <= 2000:
+                return parsed_date, is_uncertain, uncertainty_type
+    
+    # Try to extract just the year
+    year_match = _YEAR_RE.search(cleaned_date_str)
+    if year_match:
+        year = int(year_match.group())
+        if 1800 <= year <= 2000:
+            return datetime(year, 1, 1), is_uncertain, uncertainty_type
+    
+    # Try pandas parsing for more flexible date formats
+    try:
+        parsed_date = pd.to_datetime(cleaned_date_str, errors='coerce')
+        if pd.isna(parsed_date):
+            return None, is_uncertain, uncertainty_type
+        if isinstance(parsed_date, pd.Timestamp):
+            parsed_date = parsed_date.to_pydatetime()
+        if 1800 <= parsed_date.year <= 2000:
+            return parsed_date, is_uncertain, uncertainty_type
+    except (ValueError, TypeError):
+        pass
+    
+    return None, False, None
+
+@lru_cache(maxsize=100_000)
+def _clean_year_text(year_str: str) -> tuple[Optional[int], bool]:
+    """
+    Clean a stripped, lowercased year string; cached because source values repeat heavily.
+    
+    Returns the year and whether the text was recognized, so the caller can log misses.
+    """
+    # Handle empty or invalid values
+    if not year_str or year_str == 'nan' or year_str in ['inf', '-inf', 'infinity', '-infinity']:
+        return None, True
+    
+    # Handle age-based entries
+    if 'age' in year_str:
+        # Try to extract year from combined entries
+        year_match = _YEAR_RE.search(year_str)
+        if year_match:
+            year_int = int(year_match.group())
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        
+        # If no year found, try to calculate from age
+        age_match = _AGE_RE.search(year_str)
+        if age_match:
+            age = int(age_match.group(1))
+            # Assume age is from 1900 census
+            estimated_year = 1900 - age
+            if 1800 <= estimated_year <= 2000:
+                return estimated_year, True
+        return None, True
+    
+    # Handle "about" or "c." approximations
+    if 'about' in year_str or 'c.' in year_str:
+        year_match = _YEAR_RE.search(year_str)
+        if year_match:
+            year_int = int(year_match.group())
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        return None, True
+    
+    # Handle ranges
+    if ' or ' in year_str:
+        years = year_str.split(' or ')
+        year_match = _YEAR_RE.search(years[0])
+        if year_match:
+            year_int = int(year_match.group())
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        return None, True
+    
+    # Handle year ranges with slash
+    if '/' in year_str:
+        base_year = year_str.split('/')[0]
+        if _YEAR_RE.match(base_year):
+            year_int = int(base_year)
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        return None, True
+    
+    # Handle full dates
+    if _FULL_DATE_RE.match(year_str):
+        year_int = int(year_str.split('-')[0])
+        if 1800 <= year_int <= 2000:
+            return year_int, True
+        return None, True
+    
+    # Handle simple year format (including floats like "1890.0")
+    if _SIMPLE_YEAR_RE.match(year_str):
+        year_int = int(float(year_str))
+        if 1800 <= year_int <= 2000:
+            return year_int, True
+    
+    return None, False
+
+def _map_prefix(file_path: str, size: int) -> bytes:
+    """Return up to the first size bytes of a file through a read-only memory map."""
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b''  # Empty files cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:size]
+
+def _clean_one(file_path: str, db_connection_string: str) -> pd.DataFrame:
+    """Read and clean one file in a worker process."""
+    # Bound methods cannot be sent to workers, so each worker builds its own importer
+    return DataImporter(db_connection_string).process_file(file_path)
+
+def _clean_chunk(df: pd.DataFrame, file_path: str, db_connection_string: str) -> pd.DataFrame:
+    """Validate and clean one row chunk of a file in a worker process."""
+    return DataImporter(db_connection_string).validate_and_clean_dataframe(df, file_path)
+
 class DataImporter:
     def __init__(self, db_connection_string: str = DB_CONNECTION_STRING):
         self.db_connection_string = db_connection_string
@@ -23,6 +481,10 @@ class DataImporter:
         logger = logging.getLogger('DataImporter')
         logger.setLevel(logging.INFO)
         
+        # Reuse the handlers of an earlier instance (e.g. one inherited by a worker process)
+        if logger.handlers:
+            return logger
+        
         # Create logs directory if it doesn't exist
         Path('logs').mkdir(exist_ok=True)
         
@@ -45,16 +507,65 @@ class DataImporter:
         
         return logger
 
-    def detect_encoding(self, file_path: str) -> str:
-        """Detect the encoding of a file."""
+    def detect_encoding(self, file_path: str, sample: Optional[bytes] = None) -> str:
+        """Detect the encoding of a file from a sample of its leading bytes (read if not given)."""
         try:
-            with open(file_path, 'rb') as file:
-                raw_data = file.read()
-                result = chardet.detect(raw_data)
-                return result['encoding']
-        except Exception as e:
+            if sample is None:
+                sample = _map_prefix(file_path, ENCODING_SAMPLE_SIZE)
+            raw_data = sample[:ENCODING_SAMPLE_SIZE]
+        except OSError as e:
             self.logger.error(f"Error detecting encoding for {file_path}: {str(e)}")
             return 'utf-8'  # Default to UTF-8
+        
+        # Fast paths: a byte order mark, or plain ASCII (read as UTF-8 in case
+        # non-ASCII text follows the sample)
+        for bom, encoding in _BOM_ENCODINGS:
+            if raw_data.startswith(bom):
+                return encoding
+        if raw_data.isascii():
+            return 'utf-8'
+        
+        encoding = chardet.detect(raw_data)['encoding']
+        try:
+            encoding = codecs.lookup(encoding).name
+        except (LookupError, TypeError):
+            self.logger.warning(f"Unknown encoding {encoding!r} detected for {file_path}, using utf-8")
+            return 'utf-8'
+        
+        # Never read as strict ASCII
+        if encoding == 'ascii':
+            return 'utf-8'
+        return encoding
+
+    def detect_delimiter(self, file_path: str, sample: Optional[bytes] = None) -> str:
+        """
+        Pick the CSV delimiter whose count is most consistent across the sampled lines.
+        
+        Delimiters inside quoted fields make a line's count deviate, so the most
+        common non-zero per-line count is scored by how many lines share it.
+        The leading bytes are read from file_path unless a sample is given.
+        """
+        try:
+            if sample is None:
+                sample = _map_prefix(file_path, DELIMITER_SAMPLE_SIZE)
+            sample = sample[:DELIMITER_SAMPLE_SIZE]
+        except OSError as e:
+            self.logger.error(f"Error detecting delimiter for {file_path}: {str(e)}")
+            return CSV_DELIMITERS[0]
+        
+        lines = sample.split(b'\n')
+        if len(sample) == DELIMITER_SAMPLE_SIZE and len(lines) > 1:
+            lines = lines[:-1]  # The last line may be cut off by the sample
+        
+        best_delimiter, best_score = CSV_DELIMITERS[0], 0
+        for delimiter in CSV_DELIMITERS:
+            counts = Counter(line.count(delimiter.encode()) for line in lines)
+            counts.pop(0, None)
+            score = max(counts.values(), default=0)
+            if score > best_score:
+                best_delimiter, best_score = delimiter, score
+        
+        return best_delimiter
 
     def clean_date(self, date_str: str) -> tuple[Optional[datetime], bool, Optional[str]]:
         """
@@ -73,37 +584,7 @@ class DataImporter:
             return None, False, None
         
         try:
-            date_str = str(date_str).strip()
-            
-            if not date_str or date_str.lower() in ['nan', 'none', 'null', '', 'nat']:
-                return None, False, None
-            
-            # Handle multiple dates
-            if ';' in date_str:
-                date_str = date_str.split(';')[0].strip()
-                return self._parse_date(date_str, True, 'multiple_dates')
-            
-            # Handle date ranges
-            if re.match(r'\d{4}-\d{4}', date_str):
-                date_str = date_str.split('-')[0]
-                return self._parse_date(date_str, True, 'range')
-            
-            # Handle "about" or "c." approximations
-            if 'about' in date_str.lower() or 'c.' in date_str.lower() or 'circa' in date_str.lower():
-                return self._parse_date(date_str, True, 'approximate')
-            
-            # Handle "before" or "after" dates
-            if 'before' in date_str.lower():
-                return self._parse_date(date_str, True, 'before')
-            if 'after' in date_str.lower():
-                return self._parse_date(date_str, True, 'after')
-            
-            # Handle "early", "mid", "late" qualifiers
-            if any(qualifier in date_str.lower() for qualifier in ['early', 'mid', 'late']):
-                return self._parse_date(date_str, True, 'period_qualifier')
-            
-            # Try standard formats
-            return self._parse_date(date_str, False, None)
+            return _clean_date_text(str(date_str).strip())
             
         except Exception as e:
             self.logger.warning(f"Error parsing date '{date_str}': {str(e)}")
@@ -111,62 +592,13 @@ class DataImporter:
         self.logger.warning(f"Could not parse date: {date_str}")
         return None, False, None
 
-    def _parse_date(self, date_str: str, is_uncertain: bool, uncertainty_type: Optional[str]) -> tuple[Optional[datetime], bool, Optional[str]]:
-        """Helper method to parse dates with uncertainty tracking."""
-        # Clean the date string
-        date_str = str(date_str).strip()
-        
-        # Remove common qualifiers while preserving the date
-        qualifiers = ['about', 'c.', 'circa', 'before', 'after', 'early', 'mid', 'late']
-        cleaned_date_str = date_str
-        for qualifier in qualifiers:
-            if qualifier in date_str.lower():
-                # Remove the qualifier and clean up
-                cleaned_date_str = re.sub(rf'\b{qualifier}\b', '', date_str, flags=re.IGNORECASE).strip()
-                break
-        
-        # Try standard date formats
-        date_formats = [
-            '%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y',
-            '%Y-%m', '%Y/%m', '%Y'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(cleaned_date_str, fmt)
-                if 1800 <= parsed_date.year <= 2000:
-                    return parsed_date, is_uncertain, uncertainty_type
-            except ValueError:
-                continue
-        
-        # Try to extract just the year
-        year_match = re.search(r'\d{4}', cleaned_date_str)
-        if year_match:
-            year = int(year_match.group())
-            if 1800 <= year <= 2000:
-                return datetime(year, 1, 1), is_uncertain, uncertainty_type
-        
-        # Try pandas parsing for more flexible date formats
-        try:
-            parsed_date = pd.to_datetime(cleaned_date_str, errors='coerce')
-            if pd.isna(parsed_date):
-                return None, is_uncertain, uncertainty_type
-            if isinstance(parsed_date, pd.Timestamp):
-                parsed_date = parsed_date.to_pydatetime()
-            if 1800 <= parsed_date.year <= 2000:
-                return parsed_date, is_uncertain, uncertainty_type
-        except (ValueError, TypeError):
-            pass
-        
-        return None, False, None
-
     def clean_name(self, name: str) -> Optional[str]:
         """Clean and standardize names."""
         if pd.isna(name):
             return None
             
         # Remove special characters but preserve spaces, hyphens, and periods
-        cleaned = re.sub(r'[^\w\s\-\.]', '', str(name))
+        cleaned = _NAME_STRIP_RE.sub('', str(name))
         return cleaned.strip() if cleaned else None
 
     def clean_year(self, year: Any) -> Optional[int]:
@@ -199,72 +631,9 @@ class DataImporter:
                 return None
             
             # Convert to string for consistent handling
-            year_str = str(year).strip().lower()
-            
-            # Handle empty or invalid values
-            if not year_str or year_str == 'nan' or year_str in ['inf', '-inf', 'infinity', '-infinity']:
-                return None
-            
-            # Handle age-based entries
-            if 'age' in year_str:
-                # Try to extract year from combined entries
-                year_match = re.search(r'\d{4}', year_str)
-                if year_match:
-                    year_int = int(year_match.group())
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                
-                # If no year found, try to calculate from age
-                age_match = re.search(r'age\s*(\d+)', year_str)
-                if age_match:
-                    age = int(age_match.group(1))
-                    # Assume age is from 1900 census
-                    estimated_year = 1900 - age
-                    if 1800 <= estimated_year <= 2000:
-                        self.logger.debug(f"Estimated birth year {estimated_year} from age {age}")
-                        return estimated_year
-                return None
-            
-            # Handle "about" or "c." approximations
-            if 'about' in year_str or 'c.' in year_str:
-                year_match = re.search(r'\d{4}', year_str)
-                if year_match:
-                    year_int = int(year_match.group())
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                return None
-            
-            # Handle ranges
-            if ' or ' in year_str:
-                years = year_str.split(' or ')
-                year_match = re.search(r'\d{4}', years[0])
-                if year_match:
-                    year_int = int(year_match.group())
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                return None
-            
-            # Handle year ranges with slash
-            if '/' in year_str:
-                base_year = year_str.split('/')[0]
-                if re.match(r'\d{4}', base_year):
-                    year_int = int(base_year)
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                return None
-            
-            # Handle full dates
-            if re.match(r'\d{4}-\d{2}-\d{2}', year_str):
-                year_int = int(year_str.split('-')[0])
-                if 1800 <= year_int <= 2000:
-                    return year_int
-                return None
-            
-            # Handle simple year format (including floats like "1890.0")
-            if re.match(r'\d{4}(?:\.0)?$', year_str):
-                year_int = int(float(year_str))
-                if 1800 <= year_int <= 2000:
-                    return year_int
+            year_int, recognized = _clean_year_text(str(year).strip().lower())
+            if recognized:
+                return year_int
             
         except (ValueError, AttributeError, TypeError) as e:
             self.logger.warning(f"Error parsing year '{year}': {str(e)}")
@@ -285,30 +654,12 @@ class DataImporter:
         Raises:
             ValueError: If required columns are missing or have incorrect names
         """
-        # Define column mapping from CSV to database
-        column_mapping = {
-            'Census Record 1900': 'census_record_1900',
-            'Indian Name': 'indian_name',
-            'Family Name': 'family_name',
-            'English given name': 'english_given_name',
-            'Alias': 'alias',
-            'Sex': 'sex',
-            'Year of birth': 'year_of_birth',
-            'Arrival at Lincoln': 'arrival_at_lincoln',
-            'Departure from Lincoln': 'departure_from_lincoln',
-            'Nation': 'nation',
-            'Band': 'band',
-            'Agency': 'agency',
-            'Trade': 'trade',
-            'Source': 'source',
-            'Comments': 'comments',
-            'Cause of Death': 'cause_of_death',  # Removed trailing space
-            'Cemetery / Burial': 'cemetery_burial',
-            'Relevant Links': 'relevant_links'
-        }
-        
-        # Check for missing columns
-        missing_columns = set(column_mapping.keys()) - set(df.columns)
+        # Column mapping from CSV to database, shared with validate_and_clean_dataframe
+        column_mapping = COLUMN_MAPPINGS['spaced']
+        
+        # Check for missing columns; alternative headers such as 'Tribal Name' count
+        found_columns = {column_mapping[col] for col in df.columns if col in column_mapping}
+        missing_columns = set(column_mapping.values()) - found_columns
         if missing_columns:
             self.logger.error(f"Missing required columns: {missing_columns}")
             raise ValueError(f"Missing required columns: {missing_columns}")
@@ -321,44 +672,19 @@ class DataImporter:
         # Rename columns according to mapping
         df.rename(columns=column_mapping, inplace=True)
         
-        # Define expected types for each column
-        expected_types = {
-            'census_record_1900': str,
-            'indian_name': str,
-            'family_name': str,
-            'english_given_name': str,
-            'alias': str,
-            'sex': str,
-            'year_of_birth': (int, float),
-            'arrival_at_lincoln': (str, pd.Timestamp),
-            'departure_from_lincoln': (str, pd.Timestamp),
-            'nation': str,
-            'band': str,
-            'agency': str,
-            'trade': str,
-            'source': str,
-            'comments': str,
-            'cause_of_death': str,
-            'cemetery_burial': str,
-            'relevant_links': str
-        }
-        
-        # Check column types after renaming
-        for column, expected_type in expected_types.items():
+        # Check column types after renaming; all-null columns carry no type information
+        for column, expected_dtypes in _EXPECTED_DTYPES.items():
             if column in df.columns:
-                # Handle nullable columns
-                non_null_values = df[column].dropna()
-                if len(non_null_values) > 0:
-                    actual_type = type(non_null_values.iloc[0])
-                    if not isinstance(actual_type, expected_type):
-                        self.logger.error(
-                            f"Column '{column}' has incorrect type. "
-                            f"Expected {expected_type}, got {actual_type}"
-                        )
-                        raise ValueError(
-                            f"Column '{column}' has incorrect type. "
-                            f"Expected {expected_type}, got {actual_type}"
-                        )
+                actual_dtype = str(df[column].dtype)
+                if actual_dtype not in expected_dtypes and df[column].notna().any():
+                    self.logger.error(
+                        f"Column '{column}' has incorrect type. "
+                        f"Expected one of {expected_dtypes}, got {actual_dtype}"
+                    )
+                    raise ValueError(
+                        f"Column '{column}' has incorrect type. "
+                        f"Expected one of {expected_dtypes}, got {actual_dtype}"
+                    )
         
         self.logger.info("Column name and type validation successful")
         return True
@@ -383,165 +709,26 @@ class DataImporter:
             # Clean column names - remove quotes and extra spaces
             df.columns = df.columns.str.strip().str.replace('"', '').str.replace("'", '')
             
-            # Remove unnamed columns
-            df = df.loc[:, ~df.columns.str.contains('^Unnamed:', na=False)].copy()
-            
-            # Define column mappings for different formats
-            column_mappings = {
-                # Format 1: Spaces and proper capitalization
-                'spaced': {
-                    'Census Record 1900': 'census_record_1900',
-                    'Indian Name': 'indian_name',
-                    'Tribal Name': 'indian_name',  # Added this mapping
-                    'Family Name': 'family_name',
-                    'English given name': 'english_given_name',
-                    'Alias': 'alias',
-                    'Sex': 'sex',
-                    'Year of birth': 'year_of_birth',
-                    'Arrival at Lincoln': 'arrival_at_lincoln',
-                    'Departure from Lincoln': 'departure_from_lincoln',
-                    'Nation': 'nation',
-                    'Band': 'band',
-                    'Agency': 'agency',
-                    'Trade': 'trade',
-                    'Source': 'source',
-                    'Comments': 'comments',
-                    'Cause of Death': 'cause_of_death',
-                    'Cemetery / Burial': 'cemetery_burial',
-                    'Cemetery / Burial with protective quotes': 'cemetery_burial',  # Added this mapping
-                    'Relevant Links': 'relevant_links'
-                },
-                # Format 2: CamelCase without spaces
-                'camel': {
-                    'censusRecord1900': 'census_record_1900',
-                    'tribalName': 'indian_name',
-                    'familyName': 'family_name',
-                    'englishGivenName': 'english_given_name',
-                    'alias': 'alias',
-                    'sex': 'sex',
-                    'yearOfBirth': 'year_of_birth',
-                    'arrivalAtLincoln': 'arrival_at_lincoln',
-                    'departureFromLincoln': 'departure_from_lincoln',
-                    'nation': 'nation',
-                    'band': 'band',
-                    'agency': 'agency',
-                    'trade': 'trade',
-                    'source': 'source',
-                    'comments': 'comments',
-                    'causeOfDeath': 'cause_of_death',
-                    'cemeteryBurial': 'cemetery_burial',
-                    'relevantLinks': 'relevant_links'
-                },
-                # Format 3: Underscore separated
-                'underscore': {
-                    'census_record_1900': 'census_record_1900',
-                    'indian_name': 'indian_name',
-                    'family_name': 'family_name',
-                    'english_given_name': 'english_given_name',
-                    'alias': 'alias',
-                    'sex': 'sex',
-                    'year_of_birth': 'year_of_birth',
-                    'arrival_at_lincoln': 'arrival_at_lincoln',
-                    'departure_from_lincoln': 'departure_from_lincoln',
-                    'nation': 'nation',
-                    'band': 'band',
-                    'agency': 'agency',
-                    'trade': 'trade',
-                    'source': 'source',
-                    'comments': 'comments',
-                    'cause_of_death': 'cause_of_death',
-                    'cemetery_burial': 'cemetery_burial',
-                    'relevant_links': 'relevant_links'
-                },
-                # Format 4: Short names
-                'short': {
-                    'census': 'census_record_1900',
-                    'tribal': 'indian_name',
-                    'family': 'family_name',
-                    'english': 'english_given_name',
-                    'alias': 'alias',
-                    'sex': 'sex',
-                    'birth': 'year_of_birth',
-                    'arrival': 'arrival_at_lincoln',
-                    'departure': 'departure_from_lincoln',
-                    'nation': 'nation',
-                    'band': 'band',
-                    'agency': 'agency',
-                    'trade': 'trade',
-                    'source': 'source',
-                    'comments': 'comments',
-                    'death': 'cause_of_death',
-                    'burial': 'cemetery_burial',
-                    'links': 'relevant_links'
-                },
-                # Format 5: Rewritten_Data.csv format
-                'reworked': {
-                    '0': 'indian_name',
-                    '1': 'family_name',
-                    '2': 'english_given_name',
-                    '3': 'alias',
-                    '4': 'sex',
-                    '5': 'year_of_birth',
-                    '6': 'arrival_at_lincoln',
-                    '7': 'departure_from_lincoln',
-                    '8': 'nation',
-                    '9': 'band',
-                    '10': 'agency',
-                    '11': 'trade',
-                    '12': 'source',
-                    '13': 'comments',
-                    '14': 'cause_of_death',
-                    '15': 'cemetery_burial',
-                    '16': 'relevant_links'
-                }
-            }
+            # Remove unnamed columns; drop() returns a new frame, so no extra copy is needed
+            df = df.drop(columns=df.columns[df.columns.str.contains('^Unnamed:', na=False)])
             
-            # Strip trailing spaces and convert to lowercase for comparison
+            # Strip trailing spaces before matching
             df.columns = df.columns.str.strip()
-            df_lower = df.copy()
-            df_lower.columns = df_lower.columns.str.lower()
-            
-            # Try to determine which format the file uses
-            current_mapping = None
-            format_used = None
-            best_match_count = 0
             
-            # First try the reworked format since we know it's from Rewritten_Data.csv
+            # The reworked file has positional column names
             if file_path.endswith('Rewritten_Data.csv'):
-                current_mapping = column_mappings['reworked']
+                current_mapping = COLUMN_MAPPINGS['reworked']
                 format_used = 'reworked'
-                best_match_count = len(df.columns)
             else:
-                for format_name, mapping in column_mappings.items():
-                    # Create lowercase version of mapping keys for comparison
-                    mapping_lower = {k.lower(): v for k, v in mapping.items()}
-                    
-                    # Count matches
-                    match_count = sum(1 for col in df_lower.columns if col in mapping_lower)
-                    
-                    if match_count > best_match_count:
-                        best_match_count = match_count
-                        current_mapping = mapping
-                        format_used = format_name
-            
-            if best_match_count == 0:
-                # If no matches found, try partial matching
-                for format_name, mapping in column_mappings.items():
-                    mapping_lower = {k.lower(): v for k, v in mapping.items()}
-                    partial_matches = {}
-                    
-                    for col in df_lower.columns:
-                        for map_key in mapping_lower:
-                            if map_key in col or col in map_key:
-                                partial_matches[col] = mapping_lower[map_key]
-                    
-                    if len(partial_matches) > best_match_count:
-                        best_match_count = len(partial_matches)
-                        current_mapping = {k: v for k, v in mapping.items() if v in partial_matches.values()}
-                        format_used = format_name
+                current_mapping = {
+                    col: _CANONICAL_COLUMNS[_canon(col)]
+                    for col in df.columns if _canon(col) in _CANONICAL_COLUMNS
+                }
+                format_used = 'canonical'
             
+            best_match_count = sum(1 for col in df.columns if col in current_mapping)
             if best_match_count == 0:
-                missing_columns = set(column_mappings['spaced'].keys()) - set(df.columns)
+                missing_columns = set(COLUMN_MAPPINGS['spaced'].keys()) - set(df.columns)
                 self.logger.error(f"Missing required columns: {missing_columns}")
                 raise ValueError(f"Missing required columns: {missing_columns}")
             
@@ -552,52 +739,33 @@ class DataImporter:
             # Rename columns according to mapping
             df = df.rename(columns=current_mapping)
             
-            # Add missing columns with default values
-            for col in column_mappings['spaced'].values():
-                if col not in df.columns:
-                    df[col] = None
-                    self.logger.warning(f"Added missing column: {col}")
-            
-            # Add uncertainty columns
-            df['year_of_birth_uncertain'] = False
-            df['year_of_birth_uncertainty_type'] = None
-            df['year_of_birth_original_text'] = None
-            df['arrival_at_lincoln_uncertain'] = False
-            df['arrival_at_lincoln_uncertainty_type'] = None
-            df['arrival_at_lincoln_original_text'] = None
-            df['departure_from_lincoln_uncertain'] = False
-            df['departure_from_lincoln_uncertainty_type'] = None
-            df['departure_from_lincoln_original_text'] = None
+            # Add missing columns and the uncertainty columns in a single reindex;
+            # the uncertainty columns are filled in when their source column is cleaned
+            missing_columns = [col for col in STUDENT_COLUMNS if col not in df.columns]
+            for col in missing_columns:
+                self.logger.warning(f"Added missing column: {col}")
+            df = df.reindex(columns=[*df.columns, *missing_columns, *UNCERTAINTY_COLUMNS])
             
-            # Define expected types and cleaning functions for each column
+            # Define expected dtypes and cleaning functions for each column
             column_specs = {
-                'census_record_1900': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'indian_name': {'type': str, 'clean': self.clean_name},
-                'family_name': {'type': str, 'clean': self.clean_name},
-                'english_given_name': {'type': str, 'clean': self.clean_name},
-                'alias': {'type': str, 'clean': self.clean_name},
-                'sex': {'type': str, 'clean': lambda x: str(x).strip().upper() if pd.notna(x) else None},
-                'year_of_birth': {
-                    'type': (int, float, pd.Int64Dtype),
-                    'clean': lambda x: self.clean_year(x) if pd.notna(x) else None
-                },
-                'arrival_at_lincoln': {
-                    'type': (str, pd.Timestamp, datetime),
-                    'clean': self.clean_date
-                },
-                'departure_from_lincoln': {
-                    'type': (str, pd.Timestamp, datetime),
-                    'clean': self.clean_date
-                },
-                'nation': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'band': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'agency': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'trade': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'source': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'comments': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'cause_of_death': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'cemetery_burial': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None},
-                'relevant_links': {'type': str, 'clean': lambda x: str(x).strip() if pd.notna(x) else None}
+                'census_record_1900': {'clean_column': self._clean_text_column},
+                'indian_name': {'clean_column': self._clean_name_column},
+                'family_name': {'clean_column': self._clean_name_column},
+                'english_given_name': {'clean_column': self._clean_name_column},
+                'alias': {'clean_column': self._clean_name_column},
+                'sex': {'clean_column': lambda values: self._clean_category_column(values, upper=True)},
+                'year_of_birth': {'dtype': 'Int64', 'clean': self._clean_year_with_uncertainty},
+                'arrival_at_lincoln': {'dtype': 'datetime64[ns]', 'clean': self.clean_date},
+                'departure_from_lincoln': {'dtype': 'datetime64[ns]', 'clean': self.clean_date},
+                'nation': {'clean_column': self._clean_category_column},
+                'band': {'clean_column': self._clean_category_column},
+                'agency': {'clean_column': self._clean_category_column},
+                'trade': {'clean_column': self._clean_category_column},
+                'source': {'clean_column': self._clean_text_column},
+                'comments': {'clean_column': self._clean_text_column},
+                'cause_of_death': {'clean_column': self._clean_text_column},
+                'cemetery_burial': {'clean_column': self._clean_category_column},
+                'relevant_links': {'clean_column': self._clean_text_column}
             }
             
             # Clean and validate each column
@@ -606,103 +774,43 @@ class DataImporter:
                     # Special handling for date columns to track uncertainty
                     if column in ['arrival_at_lincoln', 'departure_from_lincoln']:
                         # Apply date cleaning and track uncertainty
-                        cleaned_dates = []
-                        uncertainties = []
-                        uncertainty_types = []
-                        original_texts = []
-                        
-                        for value in df[column]:
-                            # Store original text before cleaning
-                            original_text = str(value) if pd.notna(value) else None
-                            original_texts.append(original_text)
-                            
-                            cleaned_date, is_uncertain, uncertainty_type = spec['clean'](value)
-                            cleaned_dates.append(cleaned_date)
-                            uncertainties.append(is_uncertain)
-                            uncertainty_types.append(uncertainty_type)
-                        
-                        df.loc[:, column] = cleaned_dates
-                        df.loc[:, f'{column}_uncertain'] = uncertainties
-                        df.loc[:, f'{column}_uncertainty_type'] = uncertainty_types
-                        df.loc[:, f'{column}_original_text'] = original_texts
+                        parsed = self._parse_plain_dates(df[column])
+                        self._clean_with_uncertainty(df, column, spec['clean'], parsed)
                     elif column == 'year_of_birth':
                         # Special handling for year of birth to track age-based estimates
-                        cleaned_years = []
-                        uncertainties = []
-                        uncertainty_types = []
-                        original_texts = []
-                        
-                        for value in df[column]:
-                            # Store original text before cleaning
-                            original_text = str(value) if pd.notna(value) else None
-                            original_texts.append(original_text)
-                            
-                            original_value = value
-                            cleaned_year = spec['clean'](value)
-                            is_uncertain = False
-                            uncertainty_type = None
-                            
-                            # Check if this was estimated from age
-                            if pd.notna(original_value) and 'age' in str(original_value).lower():
-                                is_uncertain = True
-                                uncertainty_type = 'estimated_from_age'
-                            
-                            cleaned_years.append(cleaned_year)
-                            uncertainties.append(is_uncertain)
-                            uncertainty_types.append(uncertainty_type)
-                        
-                        df.loc[:, column] = cleaned_years
-                        df.loc[:, f'{column}_uncertain'] = uncertainties
-                        df.loc[:, f'{column}_uncertainty_type'] = uncertainty_types
-                        df.loc[:, f'{column}_original_text'] = original_texts
+                        parsed = self._parse_plain_years(df[column])
+                        self._clean_with_uncertainty(df, column, spec['clean'], parsed)
                     else:
-                        # Clean the data for non-date columns
-                        df.loc[:, column] = df[column].apply(spec['clean'])
-                    
-                    # Skip type checking for string columns
-                    if spec['type'] == str:
-                        continue
-                    
-                    # Validate the type
-                    non_null_values = df[column].dropna()
-                    if len(non_null_values) > 0:
-                        actual_type = type(non_null_values.iloc[0])
-                        expected_type = spec['type']
-                        
-                        if isinstance(expected_type, tuple):
-                            if not any(isinstance(actual_type, t) for t in expected_type):
-                                try:
-                                    # Try to convert to the first expected type
-                                    df.loc[:, column] = pd.to_numeric(df[column], errors='coerce')
-                                except Exception as e:
-                                    self.logger.error(
-                                        f"Failed to convert column '{column}' to numeric: {str(e)}"
-                                    )
-                                    raise ValueError(
-                                        f"Column '{column}' has incorrect type and cannot be converted"
-                                    )
-                        elif not isinstance(actual_type, expected_type):
-                            self.logger.warning(
-                                f"Column '{column}' has type {actual_type}, "
-                                f"expected {expected_type}. Attempting conversion."
-                            )
-                            # Try to convert to the expected type
-                            try:
-                                df.loc[:, column] = df[column].astype(expected_type)
-                            except Exception as e:
-                                self.logger.error(
-                                    f"Failed to convert column '{column}' to {expected_type}: {str(e)}"
-                                )
-                                raise ValueError(
-                                    f"Column '{column}' has incorrect type and cannot be converted"
-                                )
+                        # Clean whole text columns with vectorized string operations
+                        cleaned = spec['clean_column'](df[column])
+                        if isinstance(cleaned.dtype, pd.CategoricalDtype):
+                            # Low-cardinality columns stay categorical
+                            df[column] = cleaned
+                        else:
+                            df[column] = cleaned.astype(object).where(cleaned.notna(), None)
+            
+            # Enforce the dtypes of typed columns in a single astype pass
+            dtype_map = {
+                column: spec['dtype'] for column, spec in column_specs.items()
+                if 'dtype' in spec and column in df.columns and str(df[column].dtype) != spec['dtype']
+            }
+            if dtype_map:
+                try:
+                    df = df.astype(dtype_map, copy=False)
+                except (TypeError, ValueError) as e:
+                    self.logger.error(
+                        f"Failed to convert columns {list(dtype_map)} to {list(dtype_map.values())}: {str(e)}"
+                    )
+                    raise ValueError(
+                        f"Columns {list(dtype_map)} have incorrect types and cannot be converted"
+                    )
             
             self.logger.info(f"Successfully validated and cleaned data from {file_path}")
             
             # Add data quality metrics
             quality_metrics = {
                 'total_rows': len(df),
-                'null_counts': df.isnull().sum().to_dict(),
+                'null_counts': (len(df) - df.count()).to_dict(),
                 'parsed_dates': {
                     'year_of_birth': df['year_of_birth'].notna().sum(),
                     'arrival_at_lincoln': df['arrival_at_lincoln'].notna().sum(),
@@ -721,6 +829,200 @@ class DataImporter:
             self.logger.error(f"Error validating and cleaning data from {file_path}: {str(e)}")
             raise
 
+    def _clean_text_column(self, values: pd.Series) -> pd.Series:
+        """Strip whitespace from a text column, treating empty strings as missing."""
+        cleaned = values.astype(STRING_DTYPE).str.strip()
+        return cleaned.where(cleaned.str.len() > 0)
+
+    def _clean_name_column(self, values: pd.Series) -> pd.Series:
+        """Vectorized clean_name: remove special characters, then strip whitespace."""
+        # Python-backed strings keep the Unicode-aware \w of _NAME_STRIP_RE (RE2's is ASCII-only)
+        text = values.astype('string[python]').str.replace(_NAME_STRIP_RE, '', regex=True)
+        return text.str.strip().where(text.str.len() > 0)
+
+    def _clean_category_column(self, values: pd.Series, upper: bool = False) -> pd.Series:
+        """Clean a low-cardinality text column once per category, returning a categorical column."""
+        categorical = values.astype('category')
+        cleaned = self._clean_text_column(pd.Series(categorical.cat.categories))
+        if upper:
+            cleaned = cleaned.str.upper()
+        
+        # Categories that clean to the same text are merged; empty ones become missing.
+        # The trailing -1 keeps missing values (code -1) missing.
+        inverse, categories = pd.factorize(cleaned.astype(object))
+        codes = np.append(inverse, -1)[categorical.cat.codes.to_numpy()]
+        return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=values.index)
+
+    def _clean_year_with_uncertainty(self, year: Any) -> tuple[Optional[int], bool, Optional[str]]:
+        """Clean a year value and flag it as uncertain if it was estimated from an age."""
+        if pd.isna(year):
+            return None, False, None
+        if 'age' in str(year).lower():
+            return self.clean_year(year), True, 'estimated_from_age'
+        return self.clean_year(year), False, None
+
+    def _parse_plain_dates(self, dates: pd.Series) -> pd.Series:
+        """
+        Parse plain numeric dates (e.g. 1890-02-27, 02/27/1890) in one vectorized pass.
+        
+        Args:
+            dates (pd.Series): Raw date values
+            
+        Returns:
+            pd.Series: Parsed dates in 1800-2000, NaT for values that need clean_date
+        """
+        text = dates.astype(STRING_DTYPE).str.strip()
+        plain = text.str.fullmatch(_PLAIN_DATE_PATTERN).fillna(False).astype(bool)
+        parsed = pd.to_datetime(text.where(plain), errors='coerce', format='mixed')
+        return parsed.where(parsed.dt.year.between(1800, 2000))
+
+    def _parse_plain_years(self, years: pd.Series) -> pd.Series:
+        """
+        Convert plain numeric years (e.g. 1874, 1874.0, "1874") in one vectorized pass.
+        
+        Args:
+            years (pd.Series): Raw year values
+            
+        Returns:
+            pd.Series: Years in 1800-2000 as Int64, NA for values that need clean_year
+        """
+        if pd.api.types.is_numeric_dtype(years) and not pd.api.types.is_bool_dtype(years):
+            numeric = years.where(years % 1 == 0)
+        else:
+            text = years.astype(STRING_DTYPE).str.strip()
+            plain = text.str.fullmatch(r'\d{4}(?:\.0)?').fillna(False).astype(bool)
+            numeric = pd.to_numeric(text.where(plain), errors='coerce')
+        return numeric.where(numeric.between(1800, 2000)).astype('Int64')
+
+    def _clean_with_uncertainty(self, df: pd.DataFrame, column: str, clean, parsed: Optional[pd.Series] = None) -> None:
+        """
+        Clean a column in place and fill in its uncertainty tracking columns.
+        
+        Each distinct value is cleaned once and the result is mapped back to
+        every row holding that value.
+        
+        Args:
+            df (pd.DataFrame): The DataFrame to update
+            column (str): The column to clean
+            clean: Function returning (value, is_uncertain, uncertainty_type)
+            parsed (Optional[pd.Series]): Values already parsed with certainty; 
+                only rows where this is null are passed to clean
+        """
+        original = df[column]
+        to_clean = original if parsed is None else original.where(parsed.isna())
+        codes, uniques = pd.factorize(to_clean)
+        
+        # Position -1 (the code factorize gives nulls) holds the null result
+        lookup = np.empty(len(uniques) + 1, dtype=object)
+        for i, value in enumerate(uniques):
+            lookup[i] = clean(value)
+        lookup[-1] = (None, False, None)
+        
+        cleaned = pd.DataFrame(
+            lookup[codes].tolist(),
+            index=df.index,
+            columns=['value', 'uncertain', 'uncertainty_type'],
+            dtype=object
+        )
+        if parsed is not None:
+            done = parsed.notna()
+            cleaned.loc[done, 'value'] = parsed[done].astype(object)
+        
+        # Store original text before cleaning
+        df[f'{column}_original_text'] = original.astype(str).where(original.notna(), None)
+        df[column] = cleaned['value']
+        df[f'{column}_uncertain'] = cleaned['uncertain'].astype(bool)
+        df[f'{column}_uncertainty_type'] = cleaned['uncertainty_type']
+
+    def read_excel_file(self, file_path: str) -> pd.DataFrame:
+        """
+        Read the first sheet of an Excel file with every column typed as text.
+        
+        Source columns mix numbers, dates and free text (e.g. "about 1890"), so
+        they are read as strings up front and typed by the cleaning step rather
+        than letting pandas infer a type per column first. Neither engine builds
+        the full cell tree: pandas opens openpyxl workbooks with read_only=True
+        and streams the rows.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            
+        Returns:
+            pd.DataFrame: The raw sheet contents
+        """
+        df = pd.read_excel(
+            file_path,
+            engine=EXCEL_ENGINE,
+            sheet_name=0,  # Read first sheet
+            dtype=str
+        )
+        
+        # calamine also returns formatted but empty trailing rows; drop them
+        has_data = df.notna().any(axis=1).to_numpy()
+        last_row = len(df) - has_data[::-1].argmax() if has_data.any() else 0
+        return df.iloc[:last_row]
+
+    def read_csv_file(self, file_path: str, encoding: str, delimiter: str) -> pd.DataFrame:
+        """
+        Read a CSV file, using pyarrow for well-formed files when it is installed.
+        
+        Files with ragged rows go through the pandas C parser, which pads short
+        rows and skips (with a warning) rows that have too many fields.
+        """
+        if pacsv is not None:
+            try:
+                return self._read_csv_arrow(file_path, encoding, delimiter)
+            except pa.ArrowInvalid as e:
+                self.logger.info(f"Falling back to the pandas CSV parser for {file_path}: {str(e)[:100]}")
+        
+        return pd.read_csv(
+            file_path,
+            encoding=encoding,
+            delimiter=delimiter,
+            quotechar='"',
+            on_bad_lines='warn',
+            skipinitialspace=True
+        )
+
+    def _read_csv_arrow(self, file_path: str, encoding: str, delimiter: str) -> pd.DataFrame:
+        """Parse a CSV file with pyarrow and convert it to the frame the pandas parser would build."""
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(encoding=encoding),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True,
+                null_values=_CSV_NULL_VALUES,
+                timestamp_parsers=[]
+            )
+        )
+        
+        # Keep dates as text, read empty columns as float NaN and skip spaces
+        # after the delimiter, as pandas does
+        columns = []
+        for column in table.columns:
+            if pa.types.is_temporal(column.type):
+                column = column.cast(pa.string())
+            elif pa.types.is_null(column.type):
+                column = column.cast(pa.float64())
+            if pa.types.is_string(column.type):
+                column = pc.utf8_ltrim(column, characters=' ')
+            columns.append(column)
+        
+        # Name blank and repeated headers the way pandas does
+        names = []
+        counts = {}
+        for position, name in enumerate(table.column_names):
+            name = name or f'Unnamed: {position}'
+            if name in counts:
+                counts[name] += 1
+                names.append(f'{name}.{counts[name]}')
+            else:
+                counts[name] = 0
+                names.append(name)
+        
+        return pa.table(columns, names=names).to_pandas()
+
     def process_file(self, file_path: str) -> pd.DataFrame:
         """Process a single file (CSV or Excel)."""
         try:
@@ -732,34 +1034,25 @@ class DataImporter:
             if file_extension == '.xlsx':
                 # Read Excel file
                 try:
-                    df = pd.read_excel(
-                        file_path,
-                        engine='openpyxl',
-                        sheet_name=0  # Read first sheet
-                    )
+                    df = self.read_excel_file(file_path)
                     self.logger.info(f"Successfully read Excel file: {file_path}")
                 except Exception as e:
                     self.logger.error(f"Failed to read Excel file {file_path}: {str(e)}")
                     raise ValueError(f"Could not read Excel file {file_path}: {str(e)}")
                     
             elif file_extension == '.csv':
-                # Detect encoding and delimiter for CSV files
-                encoding = self.detect_encoding(file_path)
+                # Detect encoding and delimiter for CSV files from one mapped sample
+                sample = _map_prefix(file_path, max(ENCODING_SAMPLE_SIZE, DELIMITER_SAMPLE_SIZE))
+                encoding = self.detect_encoding(file_path, sample)
                 
-                # Try to read the file with different delimiters
-                delimiters = ['|', ',', '\t']
+                # Try the detected delimiter first, then the others
+                delimiter = self.detect_delimiter(file_path, sample)
+                delimiters = [delimiter] + [d for d in CSV_DELIMITERS if d != delimiter]
                 df = None
                 
                 for delimiter in delimiters:
                     try:
-                        df = pd.read_csv(
-                            file_path,
-                            encoding=encoding,
-                            delimiter=delimiter,
-                            quotechar='"',
-                            on_bad_lines='warn',
-                            skipinitialspace=True
-                        )
+                        df = self.read_csv_file(file_path, encoding, delimiter)
                         # If we successfully read the file and got more than one column, use this delimiter
                         if len(df.columns) > 1:
                             self.logger.info(f"Successfully read CSV file with delimiter: {delimiter}")
@@ -774,7 +1067,7 @@ class DataImporter:
                 raise ValueError(f"Unsupported file format: {file_extension}. Only .xlsx and .csv files are supported.")
             
             # Validate and clean the DataFrame
-            df = self.validate_and_clean_dataframe(df, file_path)
+            df = self.clean_dataframe(df, file_path)
             
             return df
             
@@ -782,18 +1075,75 @@ class DataImporter:
             self.logger.error(f"Error processing file {file_path}: {str(e)}")
             raise
 
-    def create_database_schema(self) -> None:
-        """Create the database schema if it doesn't exist."""
+    def clean_files(self, file_paths: List[str]) -> List[pd.DataFrame]:
+        """Read and clean several files, one worker process per file."""
+        if len(file_paths) <= 1:
+            return [self.process_file(file_path) for file_path in file_paths]
+        
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        self.logger.info(f"Cleaning {len(file_paths)} files with {max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_clean_one, file_paths, repeat(self.db_connection_string)))
+
+    def clean_dataframe(self, df: pd.DataFrame, file_path: str) -> pd.DataFrame:
+        """
+        Validate and clean a raw DataFrame, spreading large frames over worker processes.
+        
+        Rows are cleaned independently, so a frame longer than CLEAN_CHUNK_ROWS is
+        split into row chunks that are cleaned in parallel and joined back in order.
+        Inside a worker (e.g. from clean_files) the frame is cleaned serially.
+        
+        Args:
+            df (pd.DataFrame): The raw DataFrame
+            file_path (str): Path to the file the DataFrame was read from
+            
+        Returns:
+            pd.DataFrame: Cleaned and validated DataFrame
+        """
+        max_workers = min(-(-len(df) // CLEAN_CHUNK_ROWS), os.cpu_count() or 1)
+        if max_workers <= 1 or parent_process() is not None:
+            return self.validate_and_clean_dataframe(df, file_path)
+        
+        chunks = [df.iloc[start:start + CLEAN_CHUNK_ROWS] for start in range(0, len(df), CLEAN_CHUNK_ROWS)]
+        self.logger.info(f"Cleaning {len(df)} rows in {len(chunks)} chunks with {max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            cleaned = list(executor.map(_clean_chunk, chunks, repeat(file_path), repeat(self.db_connection_string)))
+        
+        # Each chunk has its own categories, so categorical columns are joined
+        # with union_categoricals to stay categorical
+        columns = cleaned[0].columns
+        categorical = [col for col, dtype in cleaned[0].dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+        df = pd.concat([chunk.drop(columns=categorical) for chunk in cleaned])
+        for column in categorical:
+            df[column] = pd.Series(
+                union_categoricals([chunk[column] for chunk in cleaned], sort_categories=True),
+                index=df.index
+            )
+        return df[columns]
+
+    @contextmanager
+    def _connect(self, conn=None):
+        """Yield conn if one is given, otherwise a new connection that is closed afterwards."""
+        if conn is not None:
+            yield conn
+            return
+        
+        conn = psycopg2.connect(self.db_connection_string)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def create_database_schema(self, conn=None) -> None:
+        """Create the database schema if it doesn't exist, on conn if one is given."""
         try:
-            with psycopg2.connect(self.db_connection_string) as conn:
+            with self._connect(conn) as conn:
                 with conn.cursor() as cur:
-                    # Drop existing table and indexes
+                    # Drop and recreate the table and its indexes in a single round-trip
                     cur.execute("""
                         DROP TABLE IF EXISTS students CASCADE;
-                    """)
-                    
-                    # Create table with all required columns
-                    cur.execute("""
+                        
                         CREATE TABLE students (
                             id SERIAL PRIMARY KEY,
                             census_record_1900 VARCHAR(100),
@@ -826,12 +1176,6 @@ class DataImporter:
                             created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
                             updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
                         );
-                        
-                        CREATE INDEX idx_family_name ON students(family_name);
-                        CREATE INDEX idx_nation ON students(nation);
-                        CREATE INDEX idx_year_of_birth ON students(year_of_birth);
-                        CREATE INDEX idx_arrival_date ON students(arrival_at_lincoln);
-                        CREATE INDEX idx_departure_date ON students(departure_from_lincoln);
                     """)
                 conn.commit()
                 self.logger.info("Database schema recreated successfully")
@@ -840,207 +1184,148 @@ class DataImporter:
             self.logger.error(f"Error creating database schema: {str(e)}")
             raise
 
-    def import_to_db(self, df: pd.DataFrame) -> None:
-        """Import data to the database."""
+    def create_indexes(self, conn=None) -> None:
+        """Create the students indexes and refresh its statistics; run after loading so each index is built once in bulk."""
         try:
-            # Add uncertainty columns if they don't exist
-            if 'year_of_birth_uncertain' not in df.columns:
-                df['year_of_birth_uncertain'] = False
-            if 'year_of_birth_uncertainty_type' not in df.columns:
-                df['year_of_birth_uncertainty_type'] = None
-            if 'year_of_birth_original_text' not in df.columns:
-                df['year_of_birth_original_text'] = None
-            if 'arrival_at_lincoln_uncertain' not in df.columns:
-                df['arrival_at_lincoln_uncertain'] = False
-            if 'arrival_at_lincoln_uncertainty_type' not in df.columns:
-                df['arrival_at_lincoln_uncertainty_type'] = None
-            if 'arrival_at_lincoln_original_text' not in df.columns:
-                df['arrival_at_lincoln_original_text'] = None
-            if 'departure_from_lincoln_uncertain' not in df.columns:
-                df['departure_from_lincoln_uncertain'] = False
-            if 'departure_from_lincoln_uncertainty_type' not in df.columns:
-                df['departure_from_lincoln_uncertainty_type'] = None
-            if 'departure_from_lincoln_original_text' not in df.columns:
-                df['departure_from_lincoln_original_text'] = None
-
-            with psycopg2.connect(self.db_connection_string) as conn:
+            with self._connect(conn) as conn:
                 with conn.cursor() as cur:
-                    for index, row in df.iterrows():
-                        try:
-                            # Validate and clean year_of_birth before database insertion
-                            year_of_birth = row.get('year_of_birth')
-                            if pd.notna(year_of_birth):
-                                try:
-                                    # Ensure it's a valid integer in range
-                                    year_int = int(year_of_birth)
-                                    if not (1800 <= year_int <= 2000):
-                                        self.logger.warning(f"Year of birth {year_int} out of range (1800-2000), setting to None")
-                                        year_of_birth = None
-                                except (ValueError, TypeError, OverflowError):
-                                    self.logger.warning(f"Invalid year of birth value: {year_of_birth}, setting to None")
-                                    year_of_birth = None
-                            else:
-                                year_of_birth = None
-                            
-                            # Handle date columns properly - convert None to NULL for database
-                            arrival_date = row.get('arrival_at_lincoln')
-                            departure_date = row.get('departure_from_lincoln')
-                            
-                            # Truncate overly long strings to prevent database errors
-                            def truncate_string(value, max_length):
-                                if value is None or pd.isna(value):
-                                    return None
-                                str_value = str(value)
-                                if len(str_value) > max_length:
-                                    self.logger.warning(f"Truncating string from {len(str_value)} to {max_length} characters: {str_value[:50]}...")
-                                    return str_value[:max_length]
-                                return str_value
-                            
-                            # Truncate string fields according to database schema limits
-                            census_record_1900 = truncate_string(row.get('census_record_1900'), 100)
-                            indian_name = truncate_string(row.get('indian_name'), 500)
-                            family_name = truncate_string(row.get('family_name'), 200)
-                            english_given_name = truncate_string(row.get('english_given_name'), 200)
-                            alias = truncate_string(row.get('alias'), 200)
-                            sex = truncate_string(row.get('sex'), 1)
-                            nation = truncate_string(row.get('nation'), 200)
-                            band = truncate_string(row.get('band'), 200)
-                            agency = truncate_string(row.get('agency'), 200)
-                            trade = truncate_string(row.get('trade'), 200)
-                            cemetery_burial = truncate_string(row.get('cemetery_burial'), 500)
-                            
-                            # TEXT fields don't need truncation
-                            source = row.get('source')
-                            comments = row.get('comments')
-                            cause_of_death = row.get('cause_of_death')
-                            relevant_links = row.get('relevant_links')
-                            
-                            # Convert pandas NaT to None for proper NULL handling
-                            if pd.isna(arrival_date) or arrival_date == 'NaT' or str(arrival_date).lower() == 'nat':
-                                arrival_date = None
-                            elif isinstance(arrival_date, (int, float)):
-                                # Handle timestamp conversion (Unix timestamp)
-                                try:
-                                    # Validate timestamp range (reasonable dates between 1800-2100)
-                                    min_timestamp = pd.Timestamp('1800-01-01').timestamp()
-                                    max_timestamp = pd.Timestamp('2100-01-01').timestamp()
-                                    
-                                    if arrival_date > 1e10:  # Likely milliseconds
-                                        # Convert to seconds for validation
-                                        arrival_date_seconds = arrival_date / 1000
-                                        if min_timestamp <= arrival_date_seconds <= max_timestamp:
-                                            arrival_date = pd.to_datetime(arrival_date, unit='ms').date()
-                                        else:
-                                            self.logger.warning(f"Invalid arrival_date timestamp {arrival_date} (milliseconds) - out of range")
-                                            arrival_date = None
-                                    else:  # Likely seconds
-                                        if min_timestamp <= arrival_date <= max_timestamp:
-                                            arrival_date = pd.to_datetime(arrival_date, unit='s').date()
-                                        else:
-                                            self.logger.warning(f"Invalid arrival_date timestamp {arrival_date} (seconds) - out of range")
-                                            arrival_date = None
-                                except (ValueError, TypeError, OverflowError):
-                                    self.logger.warning(f"Could not convert arrival_date timestamp {arrival_date} to date")
-                                    arrival_date = None
-                            elif isinstance(arrival_date, datetime):
-                                arrival_date = arrival_date.date()
-                            elif isinstance(arrival_date, pd.Timestamp):
-                                arrival_date = arrival_date.date()
-                            elif isinstance(arrival_date, str):
-                                # Try to parse string date
-                                try:
-                                    arrival_date = pd.to_datetime(arrival_date).date()
-                                except (ValueError, TypeError):
-                                    self.logger.warning(f"Could not parse arrival_date string: {arrival_date}")
-                                    arrival_date = None
-                            
-                            if pd.isna(departure_date) or departure_date == 'NaT' or str(departure_date).lower() == 'nat':
-                                departure_date = None
-                            elif isinstance(departure_date, (int, float)):
-                                # Handle timestamp conversion (Unix timestamp)
-                                try:
-                                    # Validate timestamp range (reasonable dates between 1800-2100)
-                                    min_timestamp = pd.Timestamp('1800-01-01').timestamp()
-                                    max_timestamp = pd.Timestamp('2100-01-01').timestamp()
-                                    
-                                    if departure_date > 1e10:  # Likely milliseconds
-                                        # Convert to seconds for validation
-                                        departure_date_seconds = departure_date / 1000
-                                        if min_timestamp <= departure_date_seconds <= max_timestamp:
-                                            departure_date = pd.to_datetime(departure_date, unit='ms').date()
-                                        else:
-                                            self.logger.warning(f"Invalid departure_date timestamp {departure_date} (milliseconds) - out of range")
-                                            departure_date = None
-                                    else:  # Likely seconds
-                                        if min_timestamp <= departure_date <= max_timestamp:
-                                            departure_date = pd.to_datetime(departure_date, unit='s').date()
-                                        else:
-                                            self.logger.warning(f"Invalid departure_date timestamp {departure_date} (seconds) - out of range")
-                                            departure_date = None
-                                except (ValueError, TypeError, OverflowError):
-                                    self.logger.warning(f"Could not convert departure_date timestamp {departure_date} to date")
-                                    departure_date = None
-                            elif isinstance(departure_date, datetime):
-                                departure_date = departure_date.date()
-                            elif isinstance(departure_date, pd.Timestamp):
-                                departure_date = departure_date.date()
-                            elif isinstance(departure_date, str):
-                                # Try to parse string date
-                                try:
-                                    departure_date = pd.to_datetime(departure_date).date()
-                                except (ValueError, TypeError):
-                                    self.logger.warning(f"Could not parse departure_date string: {departure_date}")
-                                    departure_date = None
-                            
-                            cur.execute("""
-                                INSERT INTO students (
-                                    census_record_1900, indian_name, family_name, 
-                                    english_given_name, alias, sex, 
-                                    year_of_birth, year_of_birth_uncertain, year_of_birth_uncertainty_type, year_of_birth_original_text,
-                                    arrival_at_lincoln, arrival_at_lincoln_uncertain, arrival_at_lincoln_uncertainty_type, arrival_at_lincoln_original_text,
-                                    departure_from_lincoln, departure_from_lincoln_uncertain, departure_from_lincoln_uncertainty_type, departure_from_lincoln_original_text,
-                                    nation, band, agency, trade, source,
-                                    comments, cause_of_death, cemetery_burial,
-                                    relevant_links
-                                ) VALUES (
-                                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                                )
-                            """, (
-                                census_record_1900,
-                                indian_name,
-                                family_name,
-                                english_given_name,
-                                alias,
-                                sex,
-                                year_of_birth,
-                                row.get('year_of_birth_uncertain'),
-                                row.get('year_of_birth_uncertainty_type'),
-                                row.get('year_of_birth_original_text'),
-                                arrival_date,
-                                row.get('arrival_at_lincoln_uncertain'),
-                                row.get('arrival_at_lincoln_uncertainty_type'),
-                                row.get('arrival_at_lincoln_original_text'),
-                                departure_date,
-                                row.get('departure_from_lincoln_uncertain'),
-                                row.get('departure_from_lincoln_uncertainty_type'),
-                                row.get('departure_from_lincoln_original_text'),
-                                nation,
-                                band,
-                                agency,
-                                trade,
-                                source,
-                                comments,
-                                cause_of_death,
-                                cemetery_burial,
-                                relevant_links
-                            ))
-                        except Exception as e:
-                            self.logger.error(f"Error inserting row {index}: {str(e)}")
-                            self.logger.error(f"Row data: {row.to_dict()}")
-                            raise  # Re-raise to see the full error
-                    conn.commit()
-                    self.logger.info(f"Successfully imported {len(df)} records")
+                    cur.execute(sql.SQL("SET LOCAL maintenance_work_mem = {}").format(
+                        sql.Literal(INDEX_MAINTENANCE_WORK_MEM)))
+                    cur.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_family_name ON students(family_name);
+                        CREATE INDEX IF NOT EXISTS idx_nation ON students(nation);
+                        CREATE INDEX IF NOT EXISTS idx_year_of_birth ON students(year_of_birth);
+                        CREATE INDEX IF NOT EXISTS idx_arrival_date ON students(arrival_at_lincoln);
+                        CREATE INDEX IF NOT EXISTS idx_departure_date ON students(departure_from_lincoln);
+                        ANALYZE students;
+                    """)
+                conn.commit()
+                self.logger.info("Database indexes created successfully")
+                
+        except Exception as e:
+            self.logger.error(f"Error creating database indexes: {str(e)}")
+            raise
+
+    def copy_dataframe(self, df: pd.DataFrame, table: str, conn=None) -> None:
+        """
+        Bulk load a DataFrame into a table with a single COPY ... FROM STDIN.
+        
+        Falls back to multi-row INSERTs when the role may not run COPY.
+        
+        Args:
+            df (pd.DataFrame): Data to load; column names must match the table's
+                columns and values must already be in the column types
+            table (str): Name of the target table
+            conn: Open connection to load on; a new one is opened if not given
+        """
+        try:
+            with self._connect(conn) as conn:
+                try:
+                    bulk_load(conn, table, df)
+                except (psycopg2.errors.InsufficientPrivilege, psycopg2.errors.FeatureNotSupported) as e:
+                    conn.rollback()
+                    self.logger.warning("COPY into %s unavailable, falling back to INSERT: %s", table, e)
+                    with conn.cursor() as cur:
+                        cur.execute("SET LOCAL synchronous_commit TO OFF")
+                    self.insert_dataframe(conn, df, table)
+                conn.commit()
+                self.logger.info("Copied %d records into %s", len(df), table)
+                
+        except Exception as e:
+            self.logger.error("Error copying data into %s: %s", table, e)
+            raise
+
+    def insert_dataframe(self, conn, df: pd.DataFrame, table: str, per_row: bool = False) -> None:
+        """
+        Insert a DataFrame with paged INSERT statements on an open connection.
+        
+        Rows are folded into multi-row INSERTs unless per_row is set, in which
+        case each row gets its own INSERT and the statements are sent in pages.
+        """
+        columns = sql.SQL(', ').join(map(sql.Identifier, df.columns))
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        
+        with conn.cursor() as cur:
+            if per_row:
+                insert_sql = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
+                    sql.Identifier(table), columns, sql.SQL(', ').join(sql.Placeholder() * len(df.columns))
+                )
+                execute_batch(cur, insert_sql, rows, page_size=INSERT_PAGE_SIZE)
+            else:
+                insert_sql = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(sql.Identifier(table), columns)
+                execute_values(cur, insert_sql, rows, page_size=INSERT_PAGE_SIZE)
+
+    def _normalize_date_column(self, dates: pd.Series) -> pd.Series:
+        """
+        Convert a date column to datetime.date values for the database in one vectorized pass.
+        
+        Numeric values are Unix timestamps (milliseconds above 1e10, otherwise
+        seconds) and must fall between 1800 and 2100; strings are parsed.
+        
+        Args:
+            dates (pd.Series): Dates, timestamps or date strings
+            
+        Returns:
+            pd.Series: datetime.date values, None where missing or invalid
+        """
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            parsed = dates
+        elif pd.api.types.is_numeric_dtype(dates) and not pd.api.types.is_bool_dtype(dates):
+            seconds = dates.where(dates <= 1e10, dates / 1000)
+            in_range = seconds.between(MIN_TIMESTAMP, MAX_TIMESTAMP)
+            out_of_range = int((seconds.notna() & ~in_range).sum())
+            if out_of_range:
+                self.logger.warning(f"Ignored {out_of_range} {dates.name} timestamps out of range (1800-2100)")
+            parsed = pd.to_datetime(seconds.where(in_range), unit='s')
+        else:
+            parsed = pd.to_datetime(dates, errors='coerce', format='mixed')
+            text = dates.astype(str).str.strip().str.lower()
+            unparsed = int((dates.notna() & parsed.isna() & (text != 'nat')).sum())
+            if unparsed:
+                self.logger.warning(f"Could not parse {unparsed} {dates.name} values")
+        
+        return parsed.dt.date.astype(object).where(parsed.notna(), None)
+
+    def import_to_db(self, df: pd.DataFrame, conn=None) -> None:
+        """Import data to the database, on conn if one is given."""
+        try:
+            # Add any missing uncertainty columns with their defaults in one assign
+            missing = {
+                column: False if column.endswith('_uncertain') else None
+                for column in UNCERTAINTY_COLUMNS if column not in df.columns
+            }
+            if missing:
+                df = df.assign(**missing)
+
+            # Validate year_of_birth with a single range mask
+            records = df.reindex(columns=STUDENT_INSERT_COLUMNS)
+            years = pd.to_numeric(records['year_of_birth'], errors='coerce')
+            invalid = int((records['year_of_birth'].notna() & ~years.between(1800, 2000)).sum())
+            if invalid:
+                self.logger.warning(f"Setting {invalid} invalid or out of range (1800-2000) years of birth to None")
+            records['year_of_birth'] = np.trunc(years.where(years.between(1800, 2000))).astype('Int64')
+            
+            # Normalize the date columns in one vectorized pass each
+            for column in ('arrival_at_lincoln', 'departure_from_lincoln'):
+                records[column] = self._normalize_date_column(records[column])
+            
+            # Truncate overly long strings to the schema limits, one column at a time
+            for column, max_length in STRING_LIMITS.items():
+                values = records[column]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    # Categorical columns only need their few distinct values measured
+                    if not (values.cat.categories.astype(str).str.len() > max_length).any():
+                        continue
+                text = values.astype(STRING_DTYPE)
+                truncated = int((text.str.len() > max_length).sum())
+                if truncated:
+                    self.logger.warning(f"Truncating {truncated} {column} values to {max_length} characters")
+                text = text.str.slice(0, max_length)
+                records[column] = text.astype(object).where(text.notna(), None)
+            
+            # Load all rows with a single COPY
+            self.copy_dataframe(records, 'students', conn)
+            self.logger.info(f"Successfully imported {len(df)} records")
                 
         except Exception as e:
             self.logger.error(f"Error importing to database: {str(e)}")
@@ -1051,12 +1336,35 @@ class DataImporter:
         try:
             self.logger.info(f"Starting import process for: {file_path}")
             
-            # Create database schema
-            self.create_database_schema()
+            # Create the schema, load and index the table on one connection
+            with self._connect() as conn:
+                self.create_database_schema(conn)
+                
+                # Process the file, then index the loaded table
+                df = self.process_file(file_path)
+                self.import_to_db(df, conn)
+                self.create_indexes(conn)
             
-            # Process the file
-            df = self.process_file(file_path)
-            self.import_to_db(df)
+            self.logger.info("Import process completed successfully")
+                    
+        except Exception as e:
+            self.logger.error(f"Import process failed: {str(e)}")
+            raise
+
+    def run_import_files(self, file_paths: List[str]) -> None:
+        """Clean several Lincoln student data files in parallel and import them together."""
+        try:
+            self.logger.info(f"Starting import process for {len(file_paths)} files")
+            
+            # Create the schema, load and index the table on one connection
+            with self._connect() as conn:
+                self.create_database_schema(conn)
+                
+                # Clean the files in parallel, then write them in a single pass
+                frames = self.clean_files(file_paths)
+                df = pd.concat(frames, ignore_index=True)
+                self.import_to_db(df, conn)
+                self.create_indexes(conn)
             
             self.logger.info("Import process completed successfully")
                     
@@ -1064,41 +1372,38 @@ class DataImporter:
             self.logger.error(f"Import process failed: {str(e)}")
             raise
 
-    def create_orphans_database_schema(self) -> None:
-        """Create the civil war orphans database schema if it doesn't exist."""
+    def create_orphans_database_schema(self, conn=None) -> None:
+        """Create the civil war orphans database schema if it doesn't exist, on conn if one is given."""
         try:
-            with psycopg2.connect(self.db_connection_string) as conn:
+            with self._connect(conn) as conn:
                 with conn.cursor() as cur:
-                    # Drop existing table and indexes
+                    # Drop and recreate the table and its indexes in a single round-trip
                     cur.execute("""
                         DROP TABLE IF EXISTS civil_war_orphans CASCADE;
-                    """)
-                    
-                    # Create table with all required columns
-                    cur.execute("""
+                        
                         CREATE TABLE civil_war_orphans (
                             id SERIAL PRIMARY KEY,
                             family_name TEXT,
                             given_name TEXT,
                             aliases TEXT,
-                            birth_date DATETIME,
-                            arrival DATETIME,
-                            departure DATETIME,
+                            birth_date DATE,
+                            arrival DATE,
+                            departure DATE,
                             scholarships TEXT,
                             assignments TEXT,
                             situation_1878 TEXT,
                             assignment_scholarship_year TEXT,
-                            references TEXT,
+                            "references" TEXT,  -- Reserved word, so always quoted
                             comments TEXT,
                             birth_date_original_text TEXT,
                             birth_date_uncertain BOOLEAN DEFAULT FALSE,
                             arrival_original_text TEXT,
                             arrival_uncertain BOOLEAN DEFAULT FALSE,
-                            arrival_at_lincoln DATETIME,
+                            arrival_at_lincoln DATE,
                             departure_original_text TEXT,
                             departure_uncertain BOOLEAN DEFAULT FALSE,
-                            departure_at_lincoln DATETIME,
-                            departure_from_lincoln DATETIME,
+                            departure_at_lincoln DATE,
+                            departure_from_lincoln DATE,
                             created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
                             updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
                         );
@@ -1113,7 +1418,7 @@ class DataImporter:
                 self.logger.info("Civil war orphans database schema created successfully")
                 
         except Exception as e:
-            self.logger.error(f"Error creating civil war orphans database schema: {str(e)}")
+            self.logger.error("Error creating civil war orphans database schema: %s", e)
             raise
 
     def process_orphans_file(self, file_path: str) -> pd.DataFrame:
@@ -1121,11 +1426,11 @@ class DataImporter:
         try:
             # Detect file encoding
             encoding = self.detect_encoding(file_path)
-            self.logger.info(f"Detected encoding: {encoding}")
+            self.logger.info("Detected encoding: %s", encoding)
             
             # Read the CSV file
-            df = pd.read_csv(file_path, encoding=encoding)
-            self.logger.info(f"Loaded {len(df)} records from {file_path}")
+            df = pd.read_csv(file_path, encoding=encoding, dtype=str, engine='c')
+            self.logger.info("Loaded %d records from %s", len(df), file_path)
             
             # Clean column names
             df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_').str.replace('/', '_')
@@ -1137,39 +1442,24 @@ class DataImporter:
             if 'assignment_/_scholarship_year' in df.columns:
                 df = df.rename(columns={'assignment_/_scholarship_year': 'assignment_scholarship_year'})
             
+            # Keep only the columns that are loaded, so nothing below cleans or copies the rest
+            df = df.loc[:, df.columns.isin(ORPHAN_INSERT_COLUMNS)]
+            
             # Process date columns
             date_columns = ['birth_date', 'arrival', 'departure', 'arrival_at_lincoln', 'departure_at_lincoln', 'departure_from_lincoln']
             
             for col in date_columns:
                 if col in df.columns:
-                    df[f'{col}_original_text'] = df[col].astype(str)
-                    df[f'{col}_uncertain'] = False
-                    
-                    # Clean dates
-                    cleaned_dates = []
-                    uncertainties = []
-                    
-                    for date_str in df[col]:
-                        cleaned_date, is_uncertain, uncertainty_type = self.clean_date(date_str)
-                        cleaned_dates.append(cleaned_date)
-                        uncertainties.append(is_uncertain)
-                    
-                    df[col] = cleaned_dates
-                    df[f'{col}_uncertain'] = uncertainties
+                    # Parse plain dates in one vectorized pass; only the rest go through clean_date
+                    parsed = self._parse_plain_dates(df[col])
+                    self._clean_with_uncertainty(df, col, self.clean_date, parsed)
+                    df = df.drop(columns=f'{col}_uncertainty_type')  # Not tracked for orphans
             
-            # Ensure all required columns exist
-            required_columns = [
-                'family_name', 'given_name', 'aliases', 'birth_date', 'arrival', 'departure',
-                'scholarships', 'assignments', 'situation_1878', 'assignment_scholarship_year',
-                'references', 'comments', 'birth_date_original_text', 'birth_date_uncertain',
-                'arrival_original_text', 'arrival_uncertain', 'arrival_at_lincoln',
-                'departure_original_text', 'departure_uncertain', 'departure_at_lincoln',
-                'departure_from_lincoln'
-            ]
-            
-            for col in required_columns:
+            # Ensure all required columns exist, dropping the uncertainty columns cleaning added
+            for col in ORPHAN_INSERT_COLUMNS:
                 if col not in df.columns:
                     df[col] = None
+            df = df[ORPHAN_INSERT_COLUMNS]
             
             # Convert text columns to string type
             text_columns = ['family_name', 'given_name', 'aliases', 'scholarships', 'assignments', 
@@ -1178,67 +1468,57 @@ class DataImporter:
             
             for col in text_columns:
                 if col in df.columns:
-                    df[col] = df[col].astype(str).replace('nan', None)
+                    df[col] = df[col].astype(str).where(df[col].notna(), None)
             
-            self.logger.info(f"Processed {len(df)} records successfully")
+            self.logger.info("Processed %d records successfully", len(df))
             return df
             
         except Exception as e:
-            self.logger.error(f"Error processing orphans file: {str(e)}")
+            self.logger.error("Error processing orphans file: %s", e)
             raise
 
-    def import_orphans_to_db(self, df: pd.DataFrame) -> None:
-        """Import civil war orphans data to the database."""
+    def import_orphans_to_db(self, df: pd.DataFrame, per_row_inserts: bool = False, conn=None) -> None:
+        """
+        Import civil war orphans data to the database.
+        
+        Args:
+            df (pd.DataFrame): Cleaned orphans data
+            per_row_inserts (bool): Load with one INSERT per row (sent in pages)
+                instead of COPY, for when each row needs its own statement
+            conn: Open connection to load on; a new one is opened if not given
+        """
         try:
-            with psycopg2.connect(self.db_connection_string) as conn:
-                with conn.cursor() as cur:
-                    # Prepare data for insertion
-                    for index, row in df.iterrows():
-                        cur.execute("""
-                            INSERT INTO civil_war_orphans (
-                                family_name, given_name, aliases, birth_date, arrival, departure,
-                                scholarships, assignments, situation_1878, assignment_scholarship_year,
-                                references, comments, birth_date_original_text, birth_date_uncertain,
-                                arrival_original_text, arrival_uncertain, arrival_at_lincoln,
-                                departure_original_text, departure_uncertain, departure_at_lincoln,
-                                departure_from_lincoln
-                            ) VALUES (
-                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                            )
-                        """, (
-                            row.get('family_name'), row.get('given_name'), row.get('aliases'),
-                            row.get('birth_date'), row.get('arrival'), row.get('departure'),
-                            row.get('scholarships'), row.get('assignments'), row.get('situation_1878'),
-                            row.get('assignment_scholarship_year'), row.get('references'), row.get('comments'),
-                            row.get('birth_date_original_text'), row.get('birth_date_uncertain'),
-                            row.get('arrival_original_text'), row.get('arrival_uncertain'), row.get('arrival_at_lincoln'),
-                            row.get('departure_original_text'), row.get('departure_uncertain'), row.get('departure_at_lincoln'),
-                            row.get('departure_from_lincoln')
-                        ))
-                    
-                conn.commit()
-                self.logger.info(f"Successfully imported {len(df)} civil war orphans records")
+            # Select the table's columns in load order; a no-op for process_orphans_file output
+            records = df.reindex(columns=ORPHAN_INSERT_COLUMNS)
+            if per_row_inserts:
+                with self._connect(conn) as conn:
+                    self.insert_dataframe(conn, records, 'civil_war_orphans', per_row=True)
+                    conn.commit()
+            else:
+                self.copy_dataframe(records, 'civil_war_orphans', conn)
+            self.logger.info("Successfully imported %d civil war orphans records", len(df))
                 
         except Exception as e:
-            self.logger.error(f"Error importing civil war orphans to database: {str(e)}")
+            self.logger.error("Error importing civil war orphans to database: %s", e)
             raise
 
     def run_orphans_import(self, file_path: str) -> None:
         """Run the import process for the civil war orphans data file."""
         try:
-            self.logger.info(f"Starting civil war orphans import process for: {file_path}")
+            self.logger.info("Starting civil war orphans import process for: %s", file_path)
             
-            # Create civil war orphans database schema
-            self.create_orphans_database_schema()
-            
-            # Process the file
-            df = self.process_orphans_file(file_path)
-            self.import_orphans_to_db(df)
+            # Create the schema and load the table on one connection
+            with self._connect() as conn:
+                self.create_orphans_database_schema(conn)
+                
+                # Process the file
+                df = self.process_orphans_file(file_path)
+                self.import_orphans_to_db(df, conn=conn)
             
             self.logger.info("Civil war orphans import process completed successfully")
                     
         except Exception as e:
-            self.logger.error(f"Civil war orphans import process failed: {str(e)}")
+            self.logger.error("Civil war orphans import process failed: %s", e)
             raise
 
 def main():
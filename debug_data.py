@@ -1,13 +1,15 @@
 import pandas as pd
 import numpy as np
 from data_importer import DataImporter
+from frame_cache import read_csv_cached
 
 def debug_year_values():
     """Debug script to identify problematic year_of_birth values."""
     importer = DataImporter()
     
-    # Read the CSV file
-    df = pd.read_csv('data/Lincoln_student_data.csv')
+    # Read only the year column, as text, so nothing is lost to type inference;
+    # the parsed column is cached between runs
+    df = read_csv_cached('data/Lincoln_student_data.csv', usecols=['Year of birth'], dtype={'Year of birth': 'string'}, engine='c')
     
     print("Original year_of_birth column info:")
     print(f"Data type: {df['Year of birth'].dtype}")
@@ -19,63 +21,55 @@ def debug_year_values():
     
     print("\nChecking for problematic values:")
     
+    # Parse the plain numeric values (digits with '.' or '-') once for both range checks
+    values = year_col.dropna()
+    plain = values.str.replace('.', '', regex=False).str.replace('-', '', regex=False).str.isdigit()
+    numeric = pd.to_numeric(values.where(plain), errors='coerce')
+    
     # Check for very large numbers (as strings)
-    large_values = []
-    for val in year_col.dropna():
-        try:
-            if isinstance(val, str) and val.replace('.', '').replace('-', '').isdigit():
-                num_val = float(val)
-                if num_val > 10000:
-                    large_values.append(val)
-        except:
-            pass
+    large_values = values[(numeric > 10000).fillna(False)].tolist()
     
     if large_values:
         print(f"Found {len(large_values)} very large values (>10000)")
         print(f"Large values: {large_values[:10]}")  # Show first 10
     
     # Check for negative numbers
-    neg_values = []
-    for val in year_col.dropna():
-        try:
-            if isinstance(val, str) and val.replace('.', '').replace('-', '').isdigit():
-                num_val = float(val)
-                if num_val < 0:
-                    neg_values.append(val)
-        except:
-            pass
+    neg_values = values[(numeric < 0).fillna(False)].tolist()
     
     if neg_values:
         print(f"Found {len(neg_values)} negative values")
         print(f"Negative values: {neg_values[:10]}")  # Show first 10
     
-    # Test the clean_year function on all values
+    # Test the clean_year function on all values: plain four-digit years are parsed
+    # in one vectorized pass, and clean_year runs once per distinct remaining value
     print("\nTesting clean_year function on all values:")
-    cleaned_values = []
-    problematic_values = []
+    cleaned = importer._parse_plain_years(values).astype(object)
+    rest = cleaned.isna()
+    codes, uniques = pd.factorize(values[rest])
+    # Position -1 (the code factorize gives nulls) holds the null result
+    lookup = np.array([importer.clean_year(val) for val in uniques] + [None], dtype=object)
+    cleaned[rest] = lookup[codes]
+    cleaned_values = cleaned.dropna()
     
-    for val in year_col.dropna():
-        cleaned = importer.clean_year(val)
-        if cleaned is not None:
-            cleaned_values.append(cleaned)
-            # Check if the cleaned value is out of PostgreSQL integer range
-            if cleaned > 2147483647 or cleaned < -2147483648:
-                problematic_values.append((val, cleaned))
+    # Check if the cleaned values are out of PostgreSQL integer range
+    cleaned_numbers = pd.to_numeric(cleaned_values)
+    out_of_range = (cleaned_numbers > 2147483647) | (cleaned_numbers < -2147483648)
+    problematic_index = out_of_range.index[out_of_range]
+    problematic_values = list(zip(values[problematic_index], cleaned_values[problematic_index]))
     
-    print(f"Total non-null values: {len(year_col.dropna())}")
+    print(f"Total non-null values: {len(values)}")
     print(f"Successfully cleaned values: {len(cleaned_values)}")
     print(f"Problematic values (out of PostgreSQL range): {len(problematic_values)}")
     
     if problematic_values:
         print("Problematic values:")
-        for original, cleaned in problematic_values[:10]:  # Show first 10
-            print(f"  Original: {original} -> Cleaned: {cleaned}")
+        for original, cleaned_value in problematic_values[:10]:  # Show first 10
+            print(f"  Original: {original} -> Cleaned: {cleaned_value}")
     
     # Check for any values that might cause issues
     print("\nChecking for any values that might cause database issues:")
-    for val in year_col.dropna().head(20):
-        cleaned = importer.clean_year(val)
-        print(f"Original: {val} (type: {type(val)}) -> Cleaned: {cleaned} (type: {type(cleaned)})")
+    for val, cleaned_value in zip(values.head(20), cleaned.head(20)):
+        print(f"Original: {val} (type: {type(val)}) -> Cleaned: {cleaned_value} (type: {type(cleaned_value)})")
 
 if __name__ == "__main__":
     debug_year_values() 
\ No newline at end of file
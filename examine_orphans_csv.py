@@ -3,8 +3,8 @@ Simple script to examine the cleaned_orphans_sept1.csv file structure and conten
 This helps you understand the data before importing.
 """
 
-import pandas as pd
 from pathlib import Path
+from frame_cache import read_csv_cached
 
 def examine_csv_file(file_path):
     """Examine the CSV file structure and content."""
@@ -12,8 +12,9 @@ def examine_csv_file(file_path):
         print(f"Examining file: {file_path}")
         print("=" * 60)
         
-        # Read the CSV file
-        df = pd.read_csv(file_path)
+        # Read the CSV file; types are left to inference since reporting them is the point,
+        # and the parsed frame is cached between runs
+        df = read_csv_cached(file_path, engine='c')
         
         print(f"Total records: {len(df)}")
         print(f"Total columns: {len(df.columns)}")
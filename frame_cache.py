@@ -0,0 +1,44 @@
+"""
+Cache parsed CSV files so the debugging scripts do not re-parse them on every run.
+Parsed frames are pickled, keyed by the source file and the read_csv arguments.
+"""
+
+import hashlib
+import os
+import pickle
+import pandas as pd
+from pathlib import Path
+
+# Parsed frames are cached here and reused while the source file is unchanged
+FRAME_CACHE_DIR = Path.home() / '.cache' / 'lincoln_frames'
+
+def read_csv_cached(file_path, **read_kwargs):
+    """
+    Read a CSV with pd.read_csv, reusing the parsed frame from a previous run.
+
+    The cache entry is reused while the file's size and mtime are unchanged and
+    the same read_csv arguments are given; otherwise the file is parsed again.
+    """
+    source = Path(file_path).resolve()
+    stat = os.stat(source)
+    key = hashlib.sha1(repr((str(source), sorted(read_kwargs.items()))).encode()).hexdigest()
+    cache_file = FRAME_CACHE_DIR / f"{source.stem}-{key[:16]}.pkl"
+    stamp = (stat.st_size, stat.st_mtime_ns)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['stamp'] == stamp:
+            return cached['frame']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError, AttributeError):
+        pass
+
+    df = pd.read_csv(source, **read_kwargs)
+    try:
+        FRAME_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'stamp': stamp, 'frame': df}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return df
@@ -4,10 +4,13 @@ This preserves the original data exactly as it appears in the CSV.
 """
 
 import pandas as pd
-import psycopg2
 import logging
 from pathlib import Path
-from config import DB_CONNECTION_STRING, validate_config
+from config import close_pool, get_conn, validate_config
+from orphans_loader import ORPHAN_CSV_COLUMNS, ORPHAN_MAX_LENGTHS, bulk_load
+
+# Rows read from the CSV and loaded per COPY
+CHUNK_SIZE = 10_000
 
 def setup_logging():
     """Set up logging configuration."""
@@ -22,9 +25,13 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 def create_orphans_table(cursor):
-    """Create the civil_war_orphans table if it doesn't exist."""
+    """Create the civil_war_orphans table if it doesn't exist.
+    
+    It is a reloadable staging copy of the CSV, so it is UNLOGGED: loads skip the
+    WAL, and the table is emptied after a crash.
+    """
     create_table_sql = """
-    CREATE TABLE IF NOT EXISTS civil_war_orphans_no_cleaning (
+    CREATE UNLOGGED TABLE IF NOT EXISTS civil_war_orphans_no_cleaning (
         id SERIAL PRIMARY KEY,
         family_name VARCHAR(200),
         given_name VARCHAR(200),
@@ -36,7 +43,7 @@ def create_orphans_table(cursor):
         assignments VARCHAR(500),
         situation_1878 VARCHAR(500),
         assignment_scholarship_year VARCHAR(100),
-        references TEXT,
+        "references" TEXT,  -- Reserved word, so always quoted
         comments TEXT,
         birth_date_original_text TEXT,
         birth_date_uncertain VARCHAR(10),
@@ -56,88 +63,36 @@ def create_orphans_table(cursor):
 def import_orphans_without_cleaning(file_path, logger):
     """Import the orphans data without any cleaning or processing."""
     try:
-        # Read the CSV file
-        logger.info(f"Reading file: {file_path}")
-        df = pd.read_csv(file_path)
-        logger.info(f"Loaded {len(df)} records from CSV")
-        
-        # Log column information
-        logger.info(f"Columns found: {list(df.columns)}")
-        
         # Connect to database
         logger.info("Connecting to database...")
-        with psycopg2.connect(DB_CONNECTION_STRING) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cursor:
                 # Create table
                 create_orphans_table(cursor)
                 logger.info("Created/verified civil_war_orphans_no_cleaning table")
                 
-                # Clear existing data (optional - remove this line if you want to keep existing data)
-                cursor.execute("DELETE FROM civil_war_orphans_no_cleaning")
+                # Clear existing data without per-row WAL (optional - remove this line if you want to keep existing data)
+                cursor.execute("TRUNCATE civil_war_orphans_no_cleaning")
                 logger.info("Cleared existing data from table")
                 
-                # Insert data - using the exact column names from the CSV
-                insert_sql = """
-                INSERT INTO civil_war_orphans_no_cleaning (
-                    family_name, given_name, aliases, birth_date, arrival, departure,
-                    scholarships, assignments, situation_1878, assignment_scholarship_year,
-                    references, comments, birth_date_original_text, birth_date_uncertain,
-                    birth_date_clean, arrival_original_text, arrival_uncertain, arrival_at_lincoln,
-                    departure_original_text, departure_uncertain, departure_at_lincoln,
-                    departure_from_lincoln
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-                """
-                
-                # Insert each row without any processing
-                successful_inserts = 0
-                for index, row in df.iterrows():
-                    try:
-                        # Convert all values to strings and handle NaN values
-                        values = []
-                        for col in [
-                            'family_name', 'given_name', 'aliases', 'birth_date', 'arrival', 'departure',
-                            'scholarships', 'assignments', 'situation,_1878', 'assignment_/_scholarship_year',
-                            'references', 'comments', 'birth_date_original_text', 'birth_date_uncertain',
-                            'birth_date', 'arrival_original_text', 'arrival_uncertain', 'arrival_at_lincoln',
-                            'departure_original_text', 'departure_uncertain', 'departure_at_lincoln',
-                            'departure_from_lincoln'
-                        ]:
-                            if col in df.columns and pd.notna(row[col]):
-                                # Truncate to appropriate length based on column
-                                value = str(row[col])
-                                if col in ['family_name', 'given_name']:
-                                    value = value[:200]
-                                elif col in ['aliases', 'scholarships', 'assignments', 'situation,_1878']:
-                                    value = value[:500]
-                                elif col in ['birth_date', 'arrival', 'departure', 'assignment_/_scholarship_year', 'birth_date_clean', 'arrival_at_lincoln', 'departure_at_lincoln', 'departure_from_lincoln']:
-                                    value = value[:100]
-                                elif col in ['birth_date_uncertain', 'arrival_uncertain', 'departure_uncertain']:
-                                    value = value[:10]
-                                elif col in ['references', 'comments', 'birth_date_original_text', 'arrival_original_text', 'departure_original_text']:
-                                    value = value[:1000]
-                                values.append(value)
-                            else:
-                                values.append(None)
-                        
-                        cursor.execute(insert_sql, values)
-                        successful_inserts += 1
-                        
-                        if (index + 1) % 50 == 0:
-                            logger.info(f"Processed {index + 1} records...")
-                            
-                    except Exception as e:
-                        logger.warning(f"Error inserting row {index + 1}: {str(e)}")
-                        logger.warning(f"Row data: {dict(row)}")
-                        continue
+                # Read and load the CSV in chunks so only one chunk is in memory at a time
+                logger.info("Reading file: %s", file_path)
+                total_records = 0
+                for df in pd.read_csv(file_path, dtype=str, engine='c', chunksize=CHUNK_SIZE):
+                    if total_records == 0:
+                        # Log column information
+                        logger.info("Columns found: %s", list(df.columns))
+                    
+                    # Truncate and send the chunk's rows in a single COPY
+                    total_records += bulk_load(conn, 'civil_war_orphans_no_cleaning', df, ORPHAN_CSV_COLUMNS, ORPHAN_MAX_LENGTHS)
+                    logger.info("Loaded %d records from CSV", total_records)
                 
                 # Commit the transaction
                 conn.commit()
-                logger.info(f"Successfully imported {successful_inserts} out of {len(df)} records to civil_war_orphans_no_cleaning table")
+                logger.info("Successfully imported %d records to civil_war_orphans_no_cleaning table", total_records)
                 
     except Exception as e:
-        logger.error(f"Import failed: {str(e)}")
+        logger.error("Import failed: %s", e)
         raise
 
 def main():
@@ -158,11 +113,11 @@ def main():
         
         # Check if file exists
         if not Path(file_path).exists():
-            logger.error(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             print(f"Error: {file_path} not found!")
             return
         
-        logger.info(f"Starting no-cleaning import of {file_path}")
+        logger.info("Starting no-cleaning import of %s", file_path)
         print(f"Importing {file_path} without any data cleaning...")
         
         # Import the data
@@ -173,9 +128,11 @@ def main():
         print("Check logs/no_cleaning_import.log for detailed information")
         
     except Exception as e:
-        logger.error(f"Import process failed: {str(e)}")
+        logger.error("Import process failed: %s", e)
         print(f"Import failed: {str(e)}")
         print("Check logs/no_cleaning_import.log for more details")
+    finally:
+        close_pool()
 
 if __name__ == '__main__':
     main()
@@ -4,10 +4,13 @@ This imports the data exactly as it appears in the CSV file.
 """
 
 import pandas as pd
-import psycopg2
 import logging
 from pathlib import Path
-from config import DB_CONNECTION_STRING, validate_config
+from config import close_pool, get_conn, validate_config
+from orphans_loader import ORPHAN_CSV_COLUMNS, ORPHAN_MAX_LENGTHS, bulk_load
+
+# Rows read from the CSV and loaded per COPY
+CHUNK_SIZE = 10_000
 
 def setup_logging():
     """Set up logging configuration."""
@@ -22,9 +25,13 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 def create_orphans_table(cursor):
-    """Create the civil_war_orphans table if it doesn't exist."""
+    """Create the civil_war_orphans table if it doesn't exist.
+    
+    It is a reloadable staging copy of the CSV, so it is UNLOGGED: loads skip the
+    WAL, and the table is emptied after a crash.
+    """
     create_table_sql = """
-    CREATE TABLE IF NOT EXISTS civil_war_orphans_raw (
+    CREATE UNLOGGED TABLE IF NOT EXISTS civil_war_orphans_raw (
         id SERIAL PRIMARY KEY,
         family_name VARCHAR(200),
         given_name VARCHAR(200),
@@ -36,7 +43,7 @@ def create_orphans_table(cursor):
         assignments VARCHAR(500),
         situation_1878 VARCHAR(500),
         assignment_scholarship_year VARCHAR(100),
-        references TEXT,
+        "references" TEXT,  -- Reserved word, so always quoted
         comments TEXT,
         birth_date_original_text TEXT,
         birth_date_uncertain VARCHAR(10),
@@ -56,74 +63,32 @@ def create_orphans_table(cursor):
 def import_orphans_data(file_path, logger):
     """Import the orphans data without any cleaning."""
     try:
-        # Read the CSV file
-        logger.info(f"Reading file: {file_path}")
-        df = pd.read_csv(file_path)
-        logger.info(f"Loaded {len(df)} records from CSV")
-        
         # Connect to database
         logger.info("Connecting to database...")
-        with psycopg2.connect(DB_CONNECTION_STRING) as conn:
+        with get_conn() as conn:
             with conn.cursor() as cursor:
                 # Create table
                 create_orphans_table(cursor)
                 logger.info("Created/verified civil_war_orphans_raw table")
                 
-                # Clear existing data (optional - remove this line if you want to keep existing data)
-                cursor.execute("DELETE FROM civil_war_orphans_raw")
+                # Clear existing data without per-row WAL (optional - remove this line if you want to keep existing data)
+                cursor.execute("TRUNCATE civil_war_orphans_raw")
                 logger.info("Cleared existing data from table")
                 
-                # Insert data
-                insert_sql = """
-                INSERT INTO civil_war_orphans_raw (
-                    family_name, given_name, aliases, birth_date, arrival, departure,
-                    scholarships, assignments, situation_1878, assignment_scholarship_year,
-                    references, comments, birth_date_original_text, birth_date_uncertain,
-                    birth_date_clean, arrival_original_text, arrival_uncertain, arrival_at_lincoln,
-                    departure_original_text, departure_uncertain, departure_at_lincoln,
-                    departure_from_lincoln
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-                """
-                
-                # Insert each row
-                for index, row in df.iterrows():
-                    try:
-                        cursor.execute(insert_sql, (
-                            str(row.get('family_name', ''))[:200] if pd.notna(row.get('family_name')) else None,
-                            str(row.get('given_name', ''))[:200] if pd.notna(row.get('given_name')) else None,
-                            str(row.get('aliases', ''))[:500] if pd.notna(row.get('aliases')) else None,
-                            str(row.get('birth_date', ''))[:100] if pd.notna(row.get('birth_date')) else None,
-                            str(row.get('arrival', ''))[:100] if pd.notna(row.get('arrival')) else None,
-                            str(row.get('departure', ''))[:100] if pd.notna(row.get('departure')) else None,
-                            str(row.get('scholarships', ''))[:500] if pd.notna(row.get('scholarships')) else None,
-                            str(row.get('assignments', ''))[:500] if pd.notna(row.get('assignments')) else None,
-                            str(row.get('situation,_1878', ''))[:500] if pd.notna(row.get('situation,_1878')) else None,
-                            str(row.get('assignment_/_scholarship_year', ''))[:100] if pd.notna(row.get('assignment_/_scholarship_year')) else None,
-                            str(row.get('references', ''))[:1000] if pd.notna(row.get('references')) else None,
-                            str(row.get('comments', ''))[:1000] if pd.notna(row.get('comments')) else None,
-                            str(row.get('birth_date_original_text', ''))[:1000] if pd.notna(row.get('birth_date_original_text')) else None,
-                            str(row.get('birth_date_uncertain', ''))[:10] if pd.notna(row.get('birth_date_uncertain')) else None,
-                            str(row.get('birth_date', ''))[:100] if pd.notna(row.get('birth_date')) else None,
-                            str(row.get('arrival_original_text', ''))[:1000] if pd.notna(row.get('arrival_original_text')) else None,
-                            str(row.get('arrival_uncertain', ''))[:10] if pd.notna(row.get('arrival_uncertain')) else None,
-                            str(row.get('arrival_at_lincoln', ''))[:100] if pd.notna(row.get('arrival_at_lincoln')) else None,
-                            str(row.get('departure_original_text', ''))[:1000] if pd.notna(row.get('departure_original_text')) else None,
-                            str(row.get('departure_uncertain', ''))[:10] if pd.notna(row.get('departure_uncertain')) else None,
-                            str(row.get('departure_at_lincoln', ''))[:100] if pd.notna(row.get('departure_at_lincoln')) else None,
-                            str(row.get('departure_from_lincoln', ''))[:100] if pd.notna(row.get('departure_from_lincoln')) else None
-                        ))
-                    except Exception as e:
-                        logger.warning(f"Error inserting row {index + 1}: {str(e)}")
-                        continue
+                # Read and load the CSV in chunks so only one chunk is in memory at a time
+                logger.info("Reading file: %s", file_path)
+                total_records = 0
+                for df in pd.read_csv(file_path, dtype=str, engine='c', chunksize=CHUNK_SIZE):
+                    # Truncate and send the chunk's rows in a single COPY
+                    total_records += bulk_load(conn, 'civil_war_orphans_raw', df, ORPHAN_CSV_COLUMNS, ORPHAN_MAX_LENGTHS)
+                    logger.info("Loaded %d records from CSV", total_records)
                 
                 # Commit the transaction
                 conn.commit()
-                logger.info(f"Successfully imported {len(df)} records to civil_war_orphans_raw table")
+                logger.info("Successfully imported %d records to civil_war_orphans_raw table", total_records)
                 
     except Exception as e:
-        logger.error(f"Import failed: {str(e)}")
+        logger.error("Import failed: %s", e)
         raise
 
 def main():
@@ -144,11 +109,11 @@ def main():
         
         # Check if file exists
         if not Path(file_path).exists():
-            logger.error(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             print(f"Error: {file_path} not found!")
             return
         
-        logger.info(f"Starting raw import of {file_path}")
+        logger.info("Starting raw import of %s", file_path)
         print(f"Importing {file_path} without data cleaning...")
         
         # Import the data
@@ -159,9 +124,11 @@ def main():
         print("Check logs/raw_import.log for detailed information")
         
     except Exception as e:
-        logger.error(f"Import process failed: {str(e)}")
+        logger.error("Import process failed: %s", e)
         print(f"Import failed: {str(e)}")
         print("Check logs/raw_import.log for more details")
+    finally:
+        close_pool()
 
 if __name__ == '__main__':
     main()
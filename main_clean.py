@@ -33,15 +33,19 @@ def main():
         # Create importer instance
         importer = LincolnImporter(DB_CONNECTION_STRING)
         
-        # Import Lincoln student data
-        print(f"Processing Lincoln student data: {lincoln_data_file.name}")
-        importer.import_lincoln_data(str(lincoln_data_file))
-        print("Lincoln student data import completed successfully!")
-        
-        # Import orphans data
-        print(f"Processing civil war orphans data: {orphans_data_file.name}")
-        importer.import_orphans_data(str(orphans_data_file))
-        print("Civil war orphans data import completed successfully!")
+        # Both imports share the importer's database connection
+        try:
+            # Import Lincoln student data
+            print(f"Processing Lincoln student data: {lincoln_data_file.name}")
+            importer.import_lincoln_data(str(lincoln_data_file))
+            print("Lincoln student data import completed successfully!")
+            
+            # Import orphans data
+            print(f"Processing civil war orphans data: {orphans_data_file.name}")
+            importer.import_orphans_data(str(orphans_data_file))
+            print("Civil war orphans data import completed successfully!")
+        finally:
+            importer.close()
         
         print("\nAll imports completed successfully!")
         
@@ -0,0 +1,115 @@
+"""
+Shared bulk loader for the civil war orphans importers.
+Truncates columns to their widths and sends a DataFrame in one COPY.
+"""
+
+import io
+import pandas as pd
+from psycopg2 import sql
+
+# Target columns of the orphans staging tables mapped to their CSV source columns, in COPY order
+ORPHAN_CSV_COLUMNS = {
+    'family_name': 'family_name',
+    'given_name': 'given_name',
+    'aliases': 'aliases',
+    'birth_date': 'birth_date',
+    'arrival': 'arrival',
+    'departure': 'departure',
+    'scholarships': 'scholarships',
+    'assignments': 'assignments',
+    'situation_1878': 'situation,_1878',
+    'assignment_scholarship_year': 'assignment_/_scholarship_year',
+    'references': 'references',
+    'comments': 'comments',
+    'birth_date_original_text': 'birth_date_original_text',
+    'birth_date_uncertain': 'birth_date_uncertain',
+    'birth_date_clean': 'birth_date',
+    'arrival_original_text': 'arrival_original_text',
+    'arrival_uncertain': 'arrival_uncertain',
+    'arrival_at_lincoln': 'arrival_at_lincoln',
+    'departure_original_text': 'departure_original_text',
+    'departure_uncertain': 'departure_uncertain',
+    'departure_at_lincoln': 'departure_at_lincoln',
+    'departure_from_lincoln': 'departure_from_lincoln',
+}
+
+# Column widths of the orphans staging tables
+ORPHAN_MAX_LENGTHS = {
+    'family_name': 200,
+    'given_name': 200,
+    'aliases': 500,
+    'birth_date': 100,
+    'arrival': 100,
+    'departure': 100,
+    'scholarships': 500,
+    'assignments': 500,
+    'situation_1878': 500,
+    'assignment_scholarship_year': 100,
+    'references': 1000,
+    'comments': 1000,
+    'birth_date_original_text': 1000,
+    'birth_date_uncertain': 10,
+    'birth_date_clean': 100,
+    'arrival_original_text': 1000,
+    'arrival_uncertain': 10,
+    'arrival_at_lincoln': 100,
+    'departure_original_text': 1000,
+    'departure_uncertain': 10,
+    'departure_at_lincoln': 100,
+    'departure_from_lincoln': 100,
+}
+
+def bulk_load(conn, table, df, col_map=None, max_lens=None):
+    """
+    Load a DataFrame into a table with a single COPY ... FROM STDIN.
+
+    Runs in the connection's current transaction; committing is left to the caller.
+
+    Args:
+        conn: Open connection to load on
+        table (str): Name of the target table
+        df (pd.DataFrame): Data to load
+        col_map (dict): Target column -> source column, in load order; source
+            columns missing from df load as nulls. Defaults to df's own columns.
+        max_lens (dict): Target column -> maximum length; these columns are
+            loaded as text truncated to that length
+
+    Returns:
+        int: Number of rows loaded
+    """
+    max_lens = max_lens or {}
+
+    if col_map is None:
+        records = df
+    else:
+        columns = {}
+        for target, source in col_map.items():
+            if source in df.columns:
+                columns[target] = df[source]
+            else:
+                columns[target] = pd.Series(None, index=df.index, dtype=object)
+        records = pd.DataFrame(columns, index=df.index)
+
+    # Truncate each bounded column in one vectorized pass, keeping nulls
+    if max_lens:
+        records = records.assign(**{
+            col: records[col].astype('string').str.slice(0, max_len)
+            for col, max_len in max_lens.items()
+        })
+
+    # Serialize once to an in-memory CSV, writing nulls as \N
+    buffer = io.StringIO()
+    records.to_csv(buffer, index=False, header=False, na_rep='\\N')
+    buffer.seek(0)
+
+    copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')").format(
+        sql.Identifier(table),
+        sql.SQL(', ').join(map(sql.Identifier, records.columns))
+    )
+
+    with conn.cursor() as cur:
+        # A rerunnable bulk load need not wait for the WAL flush on commit
+        cur.execute("SET LOCAL synchronous_commit TO OFF")
+        cur.copy_expert(copy_sql, buffer)
+
+    return len(records)
@@ -2,12 +2,205 @@
 Data processing utilities for cleaning and validating historical data.
 """
 
+import numpy as np
 import pandas as pd
 import re
+from functools import lru_cache
 from datetime import datetime
+from dateutil.parser import parser
 from typing import Optional, Tuple, Any
 import logging
 
+# Precompiled patterns used on the per-value cleaning path
+_YEAR_RE = re.compile(r'\d{4}')
+_RANGE_RE = re.compile(r'\d{4}-\d{4}')
+_FULL_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_SIMPLE_YEAR_RE = re.compile(r'\d{4}(?:\.0)?$')
+_PLAIN_YEAR_RE = re.compile(r'\d{4}(?:\.0)?')
+_AGE_RE = re.compile(r'age\s*(\d+)')
+_NAME_STRIP_RE = re.compile(r'[^\w\s\-\.]')
+
+# The ASCII characters _NAME_STRIP_RE removes, deleted with str.translate from
+# plain ASCII names; other names still need the Unicode-aware pattern
+_NAME_DELETE_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if _NAME_STRIP_RE.match(c)))
+
+# Date qualifiers stripped before parsing, matched in a single pass
+_QUALIFIER_RE = re.compile(r'\b(?:about|circa|before|after|early|mid|late)\b|\bc\.', re.IGNORECASE)
+
+# Date qualifiers that mark a date uncertain, matched anywhere in the lowercased
+# text, with their uncertainty type ranked by precedence
+_UNCERTAINTY_RE = re.compile(r'about|c\.|circa|before|after|early|mid|late')
+_UNCERTAINTY_TYPES = {
+    'about': (0, 'approximate'),
+    'c.': (0, 'approximate'),
+    'circa': (0, 'approximate'),
+    'before': (1, 'before'),
+    'after': (2, 'after'),
+    'early': (3, 'period_qualifier'),
+    'mid': (3, 'period_qualifier'),
+    'late': (3, 'period_qualifier')
+}
+
+# Standard date formats keyed by the shape of string they accept, so only a
+# matching format is tried; ambiguous day/month dates try month first
+_DATE_FORMATS = (
+    (re.compile(r'\d{4}-\d{1,2}-[ \d]?\d'), ('%Y-%m-%d',)),
+    (re.compile(r'\d{4}/\d{1,2}/[ \d]?\d'), ('%Y/%m/%d',)),
+    (re.compile(r'[ \d]?\d/[ \d]?\d/\d{4}'), ('%m/%d/%Y', '%d/%m/%Y')),
+    (re.compile(r'\d{4}-\d{1,2}'), ('%Y-%m',)),
+    (re.compile(r'\d{4}/\d{1,2}'), ('%Y/%m',)),
+    (re.compile(r'\d{4}'), ('%Y',))
+)
+
+# One flexible date parser shared by every fallback parse; fields missing from
+# the text default to the start of year 1
+_DATE_PARSER = parser()
+_DATE_DEFAULT = datetime(1, 1, 1)
+_NUMBER_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+def _parse_date(date_str: str, is_uncertain: bool, uncertainty_type: Optional[str]) -> Tuple[Optional[datetime], bool, Optional[str]]:
+    """Parse a date string with uncertainty tracking."""
+    # Clean the date string
+    date_str = str(date_str).strip()
+    
+    # Remove common qualifiers while preserving the date
+    cleaned_date_str = _QUALIFIER_RE.sub('', date_str).strip()
+    
+    # Try the standard date formats matching the string's shape
+    for pattern, date_formats in _DATE_FORMATS:
+        if pattern.fullmatch(cleaned_date_str):
+            for fmt in date_formats:
+                try:
+                    parsed_date = datetime.strptime(cleaned_date_str, fmt)
+                    if 1800 <= parsed_date.year <= 2000:
+                        return parsed_date, is_uncertain, uncertainty_type
+                except ValueError:
+                    continue
+            break
+    
+    # Try to extract just the year
+    year_match = _YEAR_RE.search(cleaned_date_str)
+    if year_match:
+        year = int(year_match.group())
+        if 1800 <= year <= 2000:
+            return datetime(year, 1, 1), is_uncertain, uncertainty_type
+    
+    # Fall back to dateutil for more flexible date formats. As with pd.to_datetime,
+    # numbers below 1000 are not dates, and neither is anything outside the
+    # Timestamp range, such as a date missing its year (given year 1 by default)
+    if not cleaned_date_str.startswith('0') and _NUMBER_RE.fullmatch(cleaned_date_str) and float(cleaned_date_str) < 1000:
+        return None, is_uncertain, uncertainty_type
+    try:
+        parsed_date = _DATE_PARSER.parse(cleaned_date_str, default=_DATE_DEFAULT)
+    except (ValueError, OverflowError, TypeError):
+        return None, is_uncertain, uncertainty_type
+    if not pd.Timestamp.min <= parsed_date.replace(tzinfo=None) <= pd.Timestamp.max:
+        return None, is_uncertain, uncertainty_type
+    if 1800 <= parsed_date.year <= 2000:
+        return parsed_date, is_uncertain, uncertainty_type
+    
+    return None, False, None
+
+@lru_cache(maxsize=100_000)
+def _clean_date_text(date_str: str) -> Tuple[Optional[datetime], bool, Optional[str]]:
+    """Clean a stripped date string; cached because source values repeat heavily."""
+    lowered = date_str.lower()
+    if not date_str or lowered in ['nan', 'none', 'null', '', 'nat']:
+        return None, False, None
+    
+    # Handle multiple dates
+    if ';' in date_str:
+        date_str = date_str.split(';')[0].strip()
+        return _parse_date(date_str, True, 'multiple_dates')
+    
+    # Handle date ranges
+    if _RANGE_RE.match(date_str):
+        date_str = date_str.split('-')[0]
+        return _parse_date(date_str, True, 'range')
+    
+    # Handle qualifiers ("about", "c.", "circa", "before", "after", "early", "mid", "late"),
+    # found in one scan; approximations win over before, after and period qualifiers
+    qualifiers = _UNCERTAINTY_RE.findall(lowered)
+    if qualifiers:
+        rank, uncertainty_type = min(_UNCERTAINTY_TYPES[qualifier] for qualifier in qualifiers)
+        return _parse_date(date_str, True, uncertainty_type)
+    
+    # Try standard formats
+    return _parse_date(date_str, False, None)
+
+@lru_cache(maxsize=100_000)
+def _clean_year_text(year_str: str) -> Tuple[Optional[int], bool]:
+    """
+    Clean a stripped, lowercased year string; cached because source values repeat heavily.
+    
+    Returns the year and whether the text was recognized, so the caller can log misses.
+    """
+    # Handle empty or invalid values
+    if not year_str or year_str == 'nan' or year_str in ['inf', '-inf', 'infinity', '-infinity']:
+        return None, True
+    
+    # Handle age-based entries
+    if 'age' in year_str:
+        # Try to extract year from combined entries
+        year_match = _YEAR_RE.search(year_str)
+        if year_match:
+            year_int = int(year_match.group())
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        
+        # If no year found, try to calculate from age
+        age_match = _AGE_RE.search(year_str)
+        if age_match:
+            age = int(age_match.group(1))
+            # Assume age is from 1900 census
+            estimated_year = 1900 - age
+            if 1800 <= estimated_year <= 2000:
+                return estimated_year, True
+        return None, True
+    
+    # Handle "about" or "c." approximations
+    if 'about' in year_str or 'c.' in year_str:
+        year_match = _YEAR_RE.search(year_str)
+        if year_match:
+            year_int = int(year_match.group())
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        return None, True
+    
+    # Handle ranges
+    if ' or ' in year_str:
+        years = year_str.split(' or ')
+        year_match = _YEAR_RE.search(years[0])
+        if year_match:
+            year_int = int(year_match.group())
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        return None, True
+    
+    # Handle year ranges with slash
+    if '/' in year_str:
+        base_year = year_str.split('/')[0]
+        if _YEAR_RE.match(base_year):
+            year_int = int(base_year)
+            if 1800 <= year_int <= 2000:
+                return year_int, True
+        return None, True
+    
+    # Handle full dates
+    if _FULL_DATE_RE.match(year_str):
+        year_int = int(year_str.split('-')[0])
+        if 1800 <= year_int <= 2000:
+            return year_int, True
+        return None, True
+    
+    # Handle simple year format (including floats like "1890.0")
+    if _SIMPLE_YEAR_RE.match(year_str):
+        year_int = int(float(year_str))
+        if 1800 <= year_int <= 2000:
+            return year_int, True
+    
+    return None, False
+
 class DataProcessor:
     """Handles data cleaning and validation operations."""
     
@@ -27,106 +220,71 @@ class DataProcessor:
                 - Boolean indicating if the date is uncertain
                 - String describing the type of uncertainty (if any)
         """
+        result, error = self._clean_date(date_str)
+        if error:
+            self.logger.warning(f"Error parsing date '{date_str}': {str(error)}")
+            self.logger.warning(f"Could not parse date: {date_str}")
+        return result
+
+    def _clean_date(self, date_str: Any) -> Tuple[Tuple[Optional[datetime], bool, Optional[str]], Optional[Exception]]:
+        """Clean a date like clean_date, returning the error instead of logging it."""
         if pd.isna(date_str):
-            return None, False, None
+            return (None, False, None), None
         
         try:
-            date_str = str(date_str).strip()
-            
-            if not date_str or date_str.lower() in ['nan', 'none', 'null', '', 'nat']:
-                return None, False, None
-            
-            # Handle multiple dates
-            if ';' in date_str:
-                date_str = date_str.split(';')[0].strip()
-                return self._parse_date(date_str, True, 'multiple_dates')
-            
-            # Handle date ranges
-            if re.match(r'\d{4}-\d{4}', date_str):
-                date_str = date_str.split('-')[0]
-                return self._parse_date(date_str, True, 'range')
-            
-            # Handle "about" or "c." approximations
-            if 'about' in date_str.lower() or 'c.' in date_str.lower() or 'circa' in date_str.lower():
-                return self._parse_date(date_str, True, 'approximate')
-            
-            # Handle "before" or "after" dates
-            if 'before' in date_str.lower():
-                return self._parse_date(date_str, True, 'before')
-            if 'after' in date_str.lower():
-                return self._parse_date(date_str, True, 'after')
-            
-            # Handle "early", "mid", "late" qualifiers
-            if any(qualifier in date_str.lower() for qualifier in ['early', 'mid', 'late']):
-                return self._parse_date(date_str, True, 'period_qualifier')
-            
-            # Try standard formats
-            return self._parse_date(date_str, False, None)
-            
+            return _clean_date_text(str(date_str).strip()), None
         except Exception as e:
-            self.logger.warning(f"Error parsing date '{date_str}': {str(e)}")
-        
-        self.logger.warning(f"Could not parse date: {date_str}")
-        return None, False, None
+            return (None, False, None), e
 
-    def _parse_date(self, date_str: str, is_uncertain: bool, uncertainty_type: Optional[str]) -> Tuple[Optional[datetime], bool, Optional[str]]:
-        """Helper method to parse dates with uncertainty tracking."""
-        # Clean the date string
-        date_str = str(date_str).strip()
-        
-        # Remove common qualifiers while preserving the date
-        qualifiers = ['about', 'c.', 'circa', 'before', 'after', 'early', 'mid', 'late']
-        cleaned_date_str = date_str
-        for qualifier in qualifiers:
-            if qualifier in date_str.lower():
-                # Remove the qualifier and clean up
-                cleaned_date_str = re.sub(rf'\b{qualifier}\b', '', date_str, flags=re.IGNORECASE).strip()
-                break
-        
-        # Try standard date formats
-        date_formats = [
-            '%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y',
-            '%Y-%m', '%Y/%m', '%Y'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(cleaned_date_str, fmt)
-                if 1800 <= parsed_date.year <= 2000:
-                    return parsed_date, is_uncertain, uncertainty_type
-            except ValueError:
-                continue
+    def clean_date_series(self, dates: pd.Series) -> pd.DataFrame:
+        """
+        Clean a whole column of dates, giving the same results as clean_date.
         
-        # Try to extract just the year
-        year_match = re.search(r'\d{4}', cleaned_date_str)
-        if year_match:
-            year = int(year_match.group())
-            if 1800 <= year <= 2000:
-                return datetime(year, 1, 1), is_uncertain, uncertainty_type
+        clean_date runs once per distinct value; the results are spread back
+        over the rows.
         
-        # Try pandas parsing for more flexible date formats
-        try:
-            parsed_date = pd.to_datetime(cleaned_date_str, errors='coerce')
-            if pd.isna(parsed_date):
-                return None, is_uncertain, uncertainty_type
-            if isinstance(parsed_date, pd.Timestamp):
-                parsed_date = parsed_date.to_pydatetime()
-            if 1800 <= parsed_date.year <= 2000:
-                return parsed_date, is_uncertain, uncertainty_type
-        except (ValueError, TypeError):
-            pass
+        Args:
+            dates: Raw date values
+            
+        Returns:
+            pd.DataFrame: Object columns 'date', 'uncertain' and 'uncertainty_type',
+                one row per input value
+        """
+        codes, uniques = pd.factorize(dates)
         
-        return None, False, None
-
+        # Missing values get code -1, which picks the last entry
+        cleaned = [self._clean_date(value) for value in uniques]
+        self._log_failures('date', codes, uniques, [error for result, error in cleaned])
+        results = [result for result, error in cleaned] + [self.clean_date(None)]
+        columns = {}
+        for name, values in zip(('date', 'uncertain', 'uncertainty_type'), zip(*results)):
+            columns[name] = pd.Series(np.array(values, dtype=object)[codes], index=dates.index, dtype=object)
+        return pd.DataFrame(columns, index=dates.index)
+    
     def clean_name(self, name: str) -> Optional[str]:
         """Clean and standardize names."""
         if pd.isna(name):
             return None
             
         # Remove special characters but preserve spaces, hyphens, and periods
-        cleaned = re.sub(r'[^\w\s\-\.]', '', str(name))
+        name = str(name)
+        cleaned = name.translate(_NAME_DELETE_TABLE) if name.isascii() else _NAME_STRIP_RE.sub('', name)
         return cleaned.strip() if cleaned else None
 
+    def clean_name_series(self, names: pd.Series) -> pd.Series:
+        """
+        Clean a whole column of names in one vectorized pass, giving the same results as clean_name.
+        
+        Args:
+            names: Raw name values
+            
+        Returns:
+            pd.Series: Cleaned names as objects, None where missing or nothing is left
+        """
+        cleaned = names.astype('string').str.replace(_NAME_STRIP_RE, '', regex=True)
+        stripped = cleaned.str.strip().astype(object)
+        return stripped.where(cleaned.fillna('') != '', None)
+
     def clean_year(self, year: Any) -> Optional[int]:
         """
         Clean and standardize year values, handling various formats and approximations.
@@ -137,95 +295,97 @@ class DataProcessor:
         Returns:
             Optional[int]: The cleaned year or None if invalid
         """
+        year_int, error = self._clean_year(year)
+        if isinstance(error, Exception):
+            self.logger.warning(f"Error parsing year '{year}': {str(error)}")
+        if error:
+            self.logger.warning(f"Could not parse year: {year}")
+        return year_int
+
+    def _clean_year(self, year: Any) -> Tuple[Optional[int], Any]:
+        """
+        Clean a year like clean_year, returning why it failed instead of logging it.
+        
+        The second value is None when the year was handled, True when the text
+        was not recognized, or the exception raised while parsing it.
+        """
         if pd.isna(year):
-            return None
+            return None, None
         
         try:
             # Handle numeric types directly first
             if isinstance(year, (int, float)):
                 if pd.isna(year):
-                    return None
+                    return None, None
                 # Check for infinity and NaN
                 if year == float('inf') or year == float('-inf') or year != year:  # NaN check
-                    return None
+                    return None, None
                 # Convert to float and check if it's a whole number
                 year_float = float(year)
                 if year_float.is_integer():
                     year_int = int(year_float)
                     if 1800 <= year_int <= 2000:
-                        return year_int
-                return None
+                        return year_int, None
+                return None, None
             
             # Convert to string for consistent handling
-            year_str = str(year).strip().lower()
-            
-            # Handle empty or invalid values
-            if not year_str or year_str == 'nan' or year_str in ['inf', '-inf', 'infinity', '-infinity']:
-                return None
-            
-            # Handle age-based entries
-            if 'age' in year_str:
-                # Try to extract year from combined entries
-                year_match = re.search(r'\d{4}', year_str)
-                if year_match:
-                    year_int = int(year_match.group())
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                
-                # If no year found, try to calculate from age
-                age_match = re.search(r'age\s*(\d+)', year_str)
-                if age_match:
-                    age = int(age_match.group(1))
-                    # Assume age is from 1900 census
-                    estimated_year = 1900 - age
-                    if 1800 <= estimated_year <= 2000:
-                        self.logger.debug(f"Estimated birth year {estimated_year} from age {age}")
-                        return estimated_year
-                return None
-            
-            # Handle "about" or "c." approximations
-            if 'about' in year_str or 'c.' in year_str:
-                year_match = re.search(r'\d{4}', year_str)
-                if year_match:
-                    year_int = int(year_match.group())
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                return None
-            
-            # Handle ranges
-            if ' or ' in year_str:
-                years = year_str.split(' or ')
-                year_match = re.search(r'\d{4}', years[0])
-                if year_match:
-                    year_int = int(year_match.group())
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                return None
-            
-            # Handle year ranges with slash
-            if '/' in year_str:
-                base_year = year_str.split('/')[0]
-                if re.match(r'\d{4}', base_year):
-                    year_int = int(base_year)
-                    if 1800 <= year_int <= 2000:
-                        return year_int
-                return None
-            
-            # Handle full dates
-            if re.match(r'\d{4}-\d{2}-\d{2}', year_str):
-                year_int = int(year_str.split('-')[0])
-                if 1800 <= year_int <= 2000:
-                    return year_int
-                return None
-            
-            # Handle simple year format (including floats like "1890.0")
-            if re.match(r'\d{4}(?:\.0)?$', year_str):
-                year_int = int(float(year_str))
-                if 1800 <= year_int <= 2000:
-                    return year_int
+            year_int, recognized = _clean_year_text(str(year).strip().lower())
+            if recognized:
+                return year_int, None
             
         except (ValueError, AttributeError, TypeError) as e:
-            self.logger.warning(f"Error parsing year '{year}': {str(e)}")
+            return None, e
+        
+        return None, True
+
+    def clean_year_series(self, years: pd.Series) -> pd.Series:
+        """
+        Clean a whole column of year values, giving the same results as clean_year.
+        
+        Plain numeric years (e.g. 1874, 1874.0, "1874") are converted in one
+        vectorized pass; clean_year runs once per distinct remaining value.
         
-        self.logger.warning(f"Could not parse year: {year}")
-        return None
+        Args:
+            years: Raw year values
+            
+        Returns:
+            pd.Series: Cleaned years as Int64, NA where invalid
+        """
+        if pd.api.types.is_numeric_dtype(years) and not pd.api.types.is_bool_dtype(years):
+            numeric = years.where(years % 1 == 0)
+        else:
+            text = years.astype('string').str.strip()
+            plain = text.str.fullmatch(_PLAIN_YEAR_RE).fillna(False).astype(bool)
+            numeric = pd.to_numeric(text.where(plain), errors='coerce')
+        cleaned = numeric.where(numeric.between(1800, 2000)).astype('Int64')
+        
+        # Only values that are not plain years go through clean_year, once each
+        rest = years.notna() & numeric.isna()
+        if rest.any():
+            codes, uniques = pd.factorize(years[rest])
+            results = [self._clean_year(value) for value in uniques]
+            self._log_failures('year', codes, uniques, [error for year, error in results])
+            lookup = pd.array([year for year, error in results], dtype='Int64')
+            cleaned[rest] = lookup[codes]
+        return cleaned
+
+    def _log_failures(self, kind: str, codes: np.ndarray, uniques: Any, errors: list) -> None:
+        """
+        Log one summary warning per kind of failure for a factorized column.
+        
+        Args:
+            kind: What was being parsed, e.g. 'year'
+            codes: Factorize codes of the column's rows
+            uniques: The distinct values the codes refer to
+            errors: The failure for each distinct value, None where it was handled
+        """
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        failures = {}
+        for value, error, count in zip(uniques, errors, counts):
+            if error is None:
+                continue
+            reason = type(error).__name__ if isinstance(error, Exception) else 'unrecognized'
+            rows, example = failures.get(reason, (0, value))
+            failures[reason] = (rows + count, example)
+        for reason, (rows, example) in failures.items():
+            self.logger.warning(f"Could not parse {kind} in {rows} rows ({reason}), e.g. '{example}'")
@@ -2,17 +2,75 @@
 Database management utilities for PostgreSQL operations.
 """
 
+import csv
+import io
 import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_values
 import logging
-from typing import Dict, Any, List
+from collections import namedtuple
+from itertools import islice
+from typing import Iterable, List, Optional
 from pathlib import Path
 
+# Rows per multi-row INSERT statement
+INSERT_PAGE_SIZE = 1000
+
+# Insert column order for each table
+LINCOLN_COLUMNS = (
+    'census_record_1900', 'indian_name', 'family_name', 'english_given_name',
+    'alias', 'sex', 'year_of_birth', 'arrival_at_lincoln', 'departure_from_lincoln',
+    'nation', 'band', 'agency', 'trade', 'source', 'comments', 'cause_of_death',
+    'cemetery_burial', 'relevant_links'
+)
+
+ORPHANS_COLUMNS = (
+    'family_name', 'given_name', 'aliases', 'birth_date', 'arrival', 'departure',
+    'scholarships', 'assignments', 'situation_1878', 'assignment_scholarship_year',
+    'references', 'comments', 'birth_date_original_text', 'birth_date_uncertain',
+    'arrival_original_text', 'arrival_uncertain', 'arrival_at_lincoln',
+    'departure_original_text', 'departure_uncertain', 'departure_at_lincoln',
+    'departure_from_lincoln'
+)
+
+# Secondary indexes, built without blocking writes once a load has finished
+LINCOLN_INDEXES = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_lincoln_family_name ON lincoln_students(family_name)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_lincoln_year_of_birth ON lincoln_students(year_of_birth)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_lincoln_nation ON lincoln_students(nation)"
+)
+
+ORPHANS_INDEXES = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orphans_family_name ON civil_war_orphans(family_name)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orphans_birth_date ON civil_war_orphans(birth_date)"
+)
+
+# Cleaned rows in insert column order; fields not given default to None
+LincolnRecord = namedtuple('LincolnRecord', LINCOLN_COLUMNS, defaults=(None,) * len(LINCOLN_COLUMNS))
+OrphansRecord = namedtuple('OrphansRecord', ORPHANS_COLUMNS, defaults=(None,) * len(ORPHANS_COLUMNS))
+
+def _relax_commit(cursor) -> None:
+    """Let the current transaction commit without waiting for its WAL flush; a rerunnable bulk load can afford that."""
+    cursor.execute("SET LOCAL synchronous_commit TO OFF")
+
 class DatabaseManager:
-    """Handles database connection and schema operations."""
+    """
+    Handles database connection and schema operations.
+    
+    One connection is opened on first use and shared by every schema and load
+    call until close(); the manager can also be used as a context manager.
+    """
     
     def __init__(self, connection_string: str, logger: logging.Logger):
         self.connection_string = connection_string
         self.logger = logger
+        self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def create_connection(self):
         """Create and return a database connection."""
@@ -22,9 +80,31 @@ class DatabaseManager:
             self.logger.error(f"Failed to connect to database: {str(e)}")
             raise
     
-    def create_lincoln_schema(self) -> None:
-        """Create the Lincoln student database schema if it doesn't exist."""
-        schema_sql = """
+    def _get_conn(self):
+        """Return the shared connection, opening it on first use or after it was closed."""
+        if self._conn is None or self._conn.closed:
+            self._conn = self.create_connection()
+        return self._conn
+    
+    def commit(self) -> None:
+        """Commit the shared connection's open transaction."""
+        if self._conn is not None:
+            self._conn.commit()
+    
+    def rollback(self) -> None:
+        """Roll back the shared connection's open transaction."""
+        if self._conn is not None:
+            self._conn.rollback()
+    
+    def close(self) -> None:
+        """Close the shared connection, if one is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def create_lincoln_table(self) -> None:
+        """Create the Lincoln student table if it doesn't exist, without its secondary indexes."""
+        table_sql = """
         CREATE TABLE IF NOT EXISTS lincoln_students (
             id SERIAL PRIMARY KEY,
             census_record_1900 VARCHAR(100),
@@ -48,25 +128,35 @@ class DatabaseManager:
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
-        
-        CREATE INDEX IF NOT EXISTS idx_lincoln_family_name ON lincoln_students(family_name);
-        CREATE INDEX IF NOT EXISTS idx_lincoln_year_of_birth ON lincoln_students(year_of_birth);
-        CREATE INDEX IF NOT EXISTS idx_lincoln_nation ON lincoln_students(nation);
         """
         
         try:
-            with self.create_connection() as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(schema_sql)
+                    cursor.execute(table_sql)
                 conn.commit()
-            self.logger.info("Lincoln students schema created successfully")
+            self.logger.info("Lincoln students table created successfully")
         except Exception as e:
-            self.logger.error(f"Error creating Lincoln schema: {str(e)}")
+            self.logger.error(f"Error creating Lincoln table: {str(e)}")
             raise
     
-    def create_orphans_schema(self) -> None:
-        """Create the civil war orphans database schema if it doesn't exist."""
-        schema_sql = """
+    def create_lincoln_indexes(self) -> None:
+        """Build the Lincoln student indexes; run after bulk loading so each index is built once."""
+        try:
+            self._create_indexes(LINCOLN_INDEXES)
+            self.logger.info("Lincoln students indexes created successfully")
+        except Exception as e:
+            self.logger.error(f"Error creating Lincoln indexes: {str(e)}")
+            raise
+    
+    def create_lincoln_schema(self) -> None:
+        """Create the Lincoln student table and its indexes if they don't exist."""
+        self.create_lincoln_table()
+        self.create_lincoln_indexes()
+    
+    def create_orphans_table(self) -> None:
+        """Create the civil war orphans table if it doesn't exist, without its secondary indexes."""
+        table_sql = """
         CREATE TABLE IF NOT EXISTS civil_war_orphans (
             id SERIAL PRIMARY KEY,
             family_name VARCHAR(200),
@@ -79,7 +169,7 @@ class DatabaseManager:
             assignments VARCHAR(500),
             situation_1878 VARCHAR(500),
             assignment_scholarship_year INTEGER,
-            references TEXT,
+            "references" TEXT,  -- Reserved word, so always quoted
             comments TEXT,
             birth_date_original_text TEXT,
             birth_date_uncertain BOOLEAN,
@@ -93,108 +183,193 @@ class DatabaseManager:
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
-        
-        CREATE INDEX IF NOT EXISTS idx_orphans_family_name ON civil_war_orphans(family_name);
-        CREATE INDEX IF NOT EXISTS idx_orphans_birth_date ON civil_war_orphans(birth_date);
         """
         
         try:
-            with self.create_connection() as conn:
+            with self._get_conn() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(schema_sql)
+                    cursor.execute(table_sql)
                 conn.commit()
-            self.logger.info("Civil war orphans schema created successfully")
+            self.logger.info("Civil war orphans table created successfully")
         except Exception as e:
-            self.logger.error(f"Error creating orphans schema: {str(e)}")
+            self.logger.error(f"Error creating orphans table: {str(e)}")
             raise
     
-    def insert_lincoln_records(self, records: List[Dict[str, Any]]) -> None:
-        """Insert Lincoln student records into the database."""
+    def create_orphans_indexes(self) -> None:
+        """Build the civil war orphans indexes; run after bulk loading so each index is built once."""
+        try:
+            self._create_indexes(ORPHANS_INDEXES)
+            self.logger.info("Civil war orphans indexes created successfully")
+        except Exception as e:
+            self.logger.error(f"Error creating orphans indexes: {str(e)}")
+            raise
+    
+    def create_orphans_schema(self) -> None:
+        """Create the civil war orphans table and its indexes if they don't exist."""
+        self.create_orphans_table()
+        self.create_orphans_indexes()
+    
+    def insert_lincoln_records(self, records: Iterable[tuple], commit_frequency: Optional[int] = None) -> None:
+        """
+        Insert Lincoln student records into the database.
+        
+        Args:
+            records: Cleaned rows in LINCOLN_COLUMNS order, such as LincolnRecords; any
+                iterable, so a generator is streamed a page at a time
+            commit_frequency: Records per transaction; by default all records are committed once at the end
+        """
         insert_sql = """
         INSERT INTO lincoln_students (
             census_record_1900, indian_name, family_name, english_given_name,
             alias, sex, year_of_birth, arrival_at_lincoln, departure_from_lincoln,
             nation, band, agency, trade, source, comments, cause_of_death,
             cemetery_burial, relevant_links
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
+        ) VALUES %s
         """
         
         try:
-            with self.create_connection() as conn:
-                with conn.cursor() as cursor:
-                    for record in records:
-                        cursor.execute(insert_sql, (
-                            record.get('census_record_1900'),
-                            record.get('indian_name'),
-                            record.get('family_name'),
-                            record.get('english_given_name'),
-                            record.get('alias'),
-                            record.get('sex'),
-                            record.get('year_of_birth'),
-                            record.get('arrival_at_lincoln'),
-                            record.get('departure_from_lincoln'),
-                            record.get('nation'),
-                            record.get('band'),
-                            record.get('agency'),
-                            record.get('trade'),
-                            record.get('source'),
-                            record.get('comments'),
-                            record.get('cause_of_death'),
-                            record.get('cemetery_burial'),
-                            record.get('relevant_links')
-                        ))
-                conn.commit()
-            self.logger.info(f"Successfully inserted {len(records)} Lincoln student records")
+            inserted = self._insert_rows(insert_sql, records, commit_frequency)
+            self.logger.info(f"Successfully inserted {inserted} Lincoln student records")
         except Exception as e:
             self.logger.error(f"Error inserting Lincoln records: {str(e)}")
             raise
     
-    def insert_orphans_records(self, records: List[Dict[str, Any]]) -> None:
-        """Insert civil war orphans records into the database."""
+    def insert_orphans_records(self, records: Iterable[tuple], commit_frequency: Optional[int] = None) -> None:
+        """
+        Insert civil war orphans records into the database.
+        
+        Args:
+            records: Cleaned rows in ORPHANS_COLUMNS order, such as OrphansRecords; any
+                iterable, so a generator is streamed a page at a time
+            commit_frequency: Records per transaction; by default all records are committed once at the end
+        """
         insert_sql = """
         INSERT INTO civil_war_orphans (
             family_name, given_name, aliases, birth_date, arrival, departure,
             scholarships, assignments, situation_1878, assignment_scholarship_year,
-            references, comments, birth_date_original_text, birth_date_uncertain,
+            "references", comments, birth_date_original_text, birth_date_uncertain,
             arrival_original_text, arrival_uncertain, arrival_at_lincoln,
             departure_original_text, departure_uncertain, departure_at_lincoln,
             departure_from_lincoln
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
+        ) VALUES %s
         """
         
         try:
-            with self.create_connection() as conn:
-                with conn.cursor() as cursor:
-                    for record in records:
-                        cursor.execute(insert_sql, (
-                            record.get('family_name'),
-                            record.get('given_name'),
-                            record.get('aliases'),
-                            record.get('birth_date'),
-                            record.get('arrival'),
-                            record.get('departure'),
-                            record.get('scholarships'),
-                            record.get('assignments'),
-                            record.get('situation_1878'),
-                            record.get('assignment_scholarship_year'),
-                            record.get('references'),
-                            record.get('comments'),
-                            record.get('birth_date_original_text'),
-                            record.get('birth_date_uncertain'),
-                            record.get('arrival_original_text'),
-                            record.get('arrival_uncertain'),
-                            record.get('arrival_at_lincoln'),
-                            record.get('departure_original_text'),
-                            record.get('departure_uncertain'),
-                            record.get('departure_at_lincoln'),
-                            record.get('departure_from_lincoln')
-                        ))
-                conn.commit()
-            self.logger.info(f"Successfully inserted {len(records)} civil war orphans records")
+            inserted = self._insert_rows(insert_sql, records, commit_frequency)
+            self.logger.info(f"Successfully inserted {inserted} civil war orphans records")
         except Exception as e:
             self.logger.error(f"Error inserting orphans records: {str(e)}")
             raise
+    
+    def copy_lincoln_records(self, records: List[tuple], commit: bool = True) -> None:
+        """
+        Bulk load Lincoln student records with COPY, falling back to INSERTs.
+        
+        Args:
+            records: Cleaned rows in LINCOLN_COLUMNS order, such as LincolnRecords
+            commit: Commit after the load; pass False to load several batches in one transaction
+                and commit() at the end (the INSERT fallback still commits as it goes)
+        """
+        try:
+            self._copy_records('lincoln_students', LINCOLN_COLUMNS, records, commit)
+            self.logger.info(f"Successfully copied {len(records)} Lincoln student records")
+        except (psycopg2.errors.InsufficientPrivilege, psycopg2.errors.FeatureNotSupported) as e:
+            self.logger.warning(f"COPY unavailable, falling back to INSERT: {str(e)}")
+            self.insert_lincoln_records(records)
+        except Exception as e:
+            self.logger.error(f"Error copying Lincoln records: {str(e)}")
+            raise
+    
+    def copy_orphans_records(self, records: List[tuple], commit: bool = True) -> None:
+        """
+        Bulk load civil war orphans records with COPY, falling back to INSERTs.
+        
+        Args:
+            records: Cleaned rows in ORPHANS_COLUMNS order, such as OrphansRecords
+            commit: Commit after the load; pass False to load several batches in one transaction
+                and commit() at the end (the INSERT fallback still commits as it goes)
+        """
+        try:
+            self._copy_records('civil_war_orphans', ORPHANS_COLUMNS, records, commit)
+            self.logger.info(f"Successfully copied {len(records)} civil war orphans records")
+        except (psycopg2.errors.InsufficientPrivilege, psycopg2.errors.FeatureNotSupported) as e:
+            self.logger.warning(f"COPY unavailable, falling back to INSERT: {str(e)}")
+            self.insert_orphans_records(records)
+        except Exception as e:
+            self.logger.error(f"Error copying orphans records: {str(e)}")
+            raise
+    
+    def _create_indexes(self, statements: tuple) -> None:
+        """Run CREATE INDEX CONCURRENTLY statements, which cannot run inside a transaction block."""
+        conn = self.create_connection()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+        finally:
+            conn.close()
+    
+    def _insert_rows(self, insert_sql: str, rows: Iterable[tuple], commit_frequency: Optional[int]) -> int:
+        """
+        Send rows as multi-row INSERTs, committing every commit_frequency rows.
+        
+        Rows are taken from the iterable a batch at a time, so at most one
+        transaction's worth (or one page, without a commit frequency) is held
+        in memory. Returns the number of rows sent.
+        """
+        rows = iter(rows)
+        batch_size = commit_frequency or INSERT_PAGE_SIZE
+        inserted = 0
+        
+        with self._get_conn() as conn:
+            with conn.cursor() as cursor:
+                in_transaction = False
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    if not in_transaction:
+                        _relax_commit(cursor)
+                        in_transaction = True
+                    # Fold the rows into multi-row INSERTs, one round-trip per page
+                    execute_values(cursor, insert_sql, batch, page_size=INSERT_PAGE_SIZE)
+                    inserted += len(batch)
+                    if commit_frequency:
+                        conn.commit()
+                        in_transaction = False
+            conn.commit()
+        return inserted
+    
+    def _copy_records(self, table: str, columns: tuple, records: List[tuple], commit: bool = True) -> None:
+        """Send records to a table in a single COPY ... FROM STDIN, committing unless told not to."""
+        # Write the rows once as in-memory CSV, with nulls as \N
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for record in records:
+            writer.writerow(['\\N' if value is None else value for value in record])
+        buffer.seek(0)
+        
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')").format(
+            sql.Identifier(table),
+            sql.SQL(', ').join(map(sql.Identifier, columns))
+        )
+        
+        conn = self._get_conn()
+        try:
+            with conn.cursor() as cursor:
+                _relax_commit(cursor)
+                # A failed COPY undoes only itself, so earlier batches in the transaction survive a fallback
+                cursor.execute("SAVEPOINT copy_records")
+                try:
+                    cursor.copy_expert(copy_sql, buffer)
+                except psycopg2.Error:
+                    cursor.execute("ROLLBACK TO SAVEPOINT copy_records")
+                    raise
+                cursor.execute("RELEASE SAVEPOINT copy_records")
+            if commit:
+                conn.commit()
+        except Exception:
+            if commit:
+                conn.rollback()
+            raise
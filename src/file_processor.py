@@ -2,41 +2,178 @@
 File processing utilities for reading and parsing data files.
 """
 
+import codecs
+import csv
+import os
+import stat
+from collections import OrderedDict
+from functools import lru_cache
 import pandas as pd
 import chardet
 import logging
-from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Iterable, Iterator, Tuple
+
+# Leading bytes sampled for encoding detection
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Leading characters sampled for delimiter sniffing, and the delimiters considered
+DELIMITER_SAMPLE_SIZE = 64 * 1024
+CSV_DELIMITERS = [',', ';', '\t', '|']
+
+# Rows per DataFrame yielded by FileProcessor.iter_chunks
+CHUNK_ROWS = 50_000
+
+# File versions whose detected encoding and delimiter are remembered, least recently used dropped first
+FORMAT_CACHE_SIZE = 32
+
+# Byte order marks and the encodings they identify (UTF-32 before UTF-16, which shares its prefix)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+)
+
+# Known header formats, mapping each source column to its database column
+COLUMN_MAPPINGS = {
+    # Format 1: Spaces and proper capitalization
+    'spaced': {
+        'Census Record 1900': 'census_record_1900',
+        'Indian Name': 'indian_name',
+        'Tribal Name': 'indian_name',
+        'Family Name': 'family_name',
+        'English given name': 'english_given_name',
+        'Alias': 'alias',
+        'Sex': 'sex',
+        'Year of birth': 'year_of_birth',
+        'Arrival at Lincoln': 'arrival_at_lincoln',
+        'Departure from Lincoln': 'departure_from_lincoln',
+        'Nation': 'nation',
+        'Band': 'band',
+        'Agency': 'agency',
+        'Trade': 'trade',
+        'Source': 'source',
+        'Comments': 'comments',
+        'Cause of Death': 'cause_of_death',
+        'Cemetery / Burial': 'cemetery_burial',
+        'Cemetery / Burial with protective quotes': 'cemetery_burial',
+        'Relevant Links': 'relevant_links'
+    },
+    # Format 2: CamelCase without spaces
+    'camel': {
+        'censusRecord1900': 'census_record_1900',
+        'tribalName': 'indian_name',
+        'familyName': 'family_name',
+        'englishGivenName': 'english_given_name',
+        'alias': 'alias',
+        'sex': 'sex',
+        'yearOfBirth': 'year_of_birth',
+        'arrivalAtLincoln': 'arrival_at_lincoln',
+        'departureFromLincoln': 'departure_from_lincoln',
+        'nation': 'nation',
+        'band': 'band',
+        'agency': 'agency',
+        'trade': 'trade',
+        'source': 'source',
+        'comments': 'comments',
+        'causeOfDeath': 'cause_of_death',
+        'cemeteryBurial': 'cemetery_burial',
+        'relevantLinks': 'relevant_links'
+    },
+    # Format 3: Underscore separated
+    'underscore': {
+        'census_record_1900': 'census_record_1900',
+        'indian_name': 'indian_name',
+        'family_name': 'family_name',
+        'english_given_name': 'english_given_name',
+        'alias': 'alias',
+        'sex': 'sex',
+        'year_of_birth': 'year_of_birth',
+        'arrival_at_lincoln': 'arrival_at_lincoln',
+        'departure_from_lincoln': 'departure_from_lincoln',
+        'nation': 'nation',
+        'band': 'band',
+        'agency': 'agency',
+        'trade': 'trade',
+        'source': 'source',
+        'comments': 'comments',
+        'cause_of_death': 'cause_of_death',
+        'cemetery_burial': 'cemetery_burial',
+        'relevant_links': 'relevant_links'
+    }
+}
+
+# Each format keyed by lowercased column name, with its key set precomputed for scoring
+_MAPPINGS = {
+    name: {column.lower(): target for column, target in mapping.items()}
+    for name, mapping in COLUMN_MAPPINGS.items()
+}
+_MAPPING_KEYS = {name: frozenset(mapping) for name, mapping in _MAPPINGS.items()}
+
+@lru_cache(maxsize=16)
+def _best_mapping(columns: tuple) -> Tuple[str, int]:
+    """Score the formats against lowercased column names; cached per header. The first format wins a tie."""
+    cols = frozenset(columns)
+    format_name = max(_MAPPINGS, key=lambda name: len(cols & _MAPPING_KEYS[name]))
+    return format_name, len(cols & _MAPPING_KEYS[format_name])
+
+def _detect_encoding(raw_data: bytes) -> str:
+    """Detect the encoding of a sample of a file's leading bytes."""
+    # Fast paths: a byte order mark, or plain ASCII (read as UTF-8 in case
+    # non-ASCII text follows the sample)
+    for bom, encoding in _BOM_ENCODINGS:
+        if raw_data.startswith(bom):
+            return encoding
+    if raw_data.isascii():
+        return 'utf-8'
+    
+    return chardet.detect(raw_data)['encoding'] or 'utf-8'
 
 class FileProcessor:
     """Handles file reading and format detection."""
     
     def __init__(self, logger: logging.Logger):
         self.logger = logger
+        # Detected encodings and sniffed delimiters of recently read file versions,
+        # so a file read more than once (e.g. header, then rows) is only sampled once
+        self._encodings: OrderedDict = OrderedDict()
+        self._delimiters: OrderedDict = OrderedDict()
     
     def detect_encoding(self, file_path: str) -> str:
-        """Detect the encoding of a file."""
+        """Detect the encoding of a file from a sample of its leading bytes."""
         try:
-            with open(file_path, 'rb') as file:
-                raw_data = file.read()
-                result = chardet.detect(raw_data)
-                return result['encoding']
+            def detect():
+                with open(file_path, 'rb') as file:
+                    return _detect_encoding(file.read(ENCODING_SAMPLE_SIZE))
+            return self._memoized(self._encodings, self._file_version(file_path), detect)
         except Exception as e:
             self.logger.error(f"Error detecting encoding for {file_path}: {str(e)}")
             return 'utf-8'  # Default to UTF-8
     
-    def read_file(self, file_path: str) -> pd.DataFrame:
-        """Read a data file and return a DataFrame."""
+    def read_file(self, file_path: str, columns: Optional[Iterable[str]] = None, nrows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Read a data file and return a DataFrame.
+        
+        Args:
+            file_path: Path to the data file
+            columns: Only read columns whose (stripped) header is one of these; all columns if not given
+            nrows: Only read this many rows (0 reads just the header)
+        """
         try:
+            # Select columns at parse time
+            usecols = self._usecols(columns)
+            
             # Detect encoding
             encoding = self.detect_encoding(file_path)
             self.logger.info(f"Detected encoding: {encoding} for {file_path}")
             
             # Try to read the file
+            file_path = os.fspath(file_path)
             if file_path.endswith('.csv'):
-                return self._read_csv_file(file_path, encoding)
+                return self._read_csv_file(file_path, encoding, usecols, nrows)
             elif file_path.endswith(('.xlsx', '.xls')):
-                return self._read_excel_file(file_path)
+                return self._read_excel_file(file_path, usecols, nrows)
             else:
                 raise ValueError(f"Unsupported file format: {file_path}")
                 
@@ -44,14 +181,80 @@ class FileProcessor:
             self.logger.error(f"Error reading file {file_path}: {str(e)}")
             raise
     
-    def _read_csv_file(self, file_path: str, encoding: str) -> pd.DataFrame:
+    def iter_chunks(self, file_path: str, chunksize: int = CHUNK_ROWS, columns: Optional[Iterable[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read a data file as a sequence of DataFrames of at most chunksize rows.
+        
+        CSV files are streamed, so memory use is bounded by the chunk size;
+        Excel files are read whole and yielded as a single chunk.
+        
+        Args:
+            file_path: Path to the data file
+            chunksize: Rows per chunk
+            columns: Only read columns whose (stripped) header is one of these; all columns if not given
+        """
+        try:
+            usecols = self._usecols(columns)
+            
+            file_path = os.fspath(file_path)
+            if file_path.endswith(('.xlsx', '.xls')):
+                yield self._read_excel_file(file_path, usecols)
+                return
+            if not file_path.endswith('.csv'):
+                raise ValueError(f"Unsupported file format: {file_path}")
+            
+            encoding = self.detect_encoding(file_path)
+            self.logger.info(f"Detected encoding: {encoding} for {file_path}")
+            options = dict(encoding=encoding, engine='c', dtype=str, usecols=usecols)
+            
+            # Settle the delimiter on the header, then stream the rows with it
+            delimiter = self._sniff_delimiter(file_path, encoding)
+            if not delimiter:
+                for candidate in CSV_DELIMITERS:
+                    try:
+                        if len(pd.read_csv(file_path, delimiter=candidate, nrows=0, **options).columns) > 1:
+                            delimiter = candidate
+                            break
+                    except Exception:
+                        continue
+            
+            with pd.read_csv(file_path, delimiter=delimiter, chunksize=chunksize, **options) as reader:
+                yield from reader
+                
+        except Exception as e:
+            self.logger.error(f"Error reading file {file_path}: {str(e)}")
+            raise
+    
+    def _usecols(self, columns: Optional[Iterable[str]]):
+        """Build a usecols filter for the given columns; headers are compared stripped, as get_column_mapping does."""
+        if columns is None:
+            return None
+        wanted = frozenset(columns)
+        
+        def usecols(col):
+            return str(col).strip() in wanted
+        return usecols
+    
+    def _read_csv_file(self, file_path: str, encoding: str, usecols=None, nrows: Optional[int] = None) -> pd.DataFrame:
         """Read a CSV file with automatic delimiter detection."""
-        # Try common delimiters
-        delimiters = [',', ';', '\t', '|']
+        # Values are read as text with the C parser, skipping type inference
+        options = dict(encoding=encoding, engine='c', dtype=str, low_memory=False, usecols=usecols, nrows=nrows)
+        
+        # Sniff the delimiter from the leading text so the file is parsed once
+        delimiter = self._sniff_delimiter(file_path, encoding)
+        if delimiter:
+            try:
+                df = pd.read_csv(file_path, delimiter=delimiter, **options)
+                if len(df.columns) > 1:
+                    self.logger.info(f"Successfully read CSV with delimiter: '{delimiter}'")
+                    return df
+            except Exception:
+                pass
         
-        for delimiter in delimiters:
+        # Otherwise try common delimiters
+        for delimiter in CSV_DELIMITERS:
             try:
-                df = pd.read_csv(file_path, encoding=encoding, delimiter=delimiter)
+                df = pd.read_csv(file_path, delimiter=delimiter, **options)
                 if len(df.columns) > 1:  # Successfully parsed with multiple columns
                     self.logger.info(f"Successfully read CSV with delimiter: '{delimiter}'")
                     return df
@@ -60,17 +263,48 @@ class FileProcessor:
         
         # If no delimiter worked, try without specifying delimiter
         try:
-            df = pd.read_csv(file_path, encoding=encoding)
+            df = pd.read_csv(file_path, **options)
             self.logger.info("Successfully read CSV with auto-detected delimiter")
             return df
         except Exception as e:
             self.logger.error(f"Failed to read CSV file: {str(e)}")
             raise
     
-    def _read_excel_file(self, file_path: str) -> pd.DataFrame:
+    def _sniff_delimiter(self, file_path: str, encoding: str) -> Optional[str]:
+        """Guess the CSV delimiter from a sample of the file's text, or None if unclear."""
+        try:
+            def sniff():
+                with open(file_path, 'r', encoding=encoding, newline='') as file:
+                    sample = file.read(DELIMITER_SAMPLE_SIZE)
+                try:
+                    return csv.Sniffer().sniff(sample, delimiters=''.join(CSV_DELIMITERS)).delimiter
+                except csv.Error:
+                    return None
+            return self._memoized(self._delimiters, self._file_version(file_path) + (encoding,), sniff)
+        except (OSError, UnicodeDecodeError, LookupError, TypeError):
+            return None
+    
+    @staticmethod
+    def _memoized(cache: OrderedDict, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Look key up in a memo bounded to FORMAT_CACHE_SIZE entries, computing it on a miss."""
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        value = cache[key] = compute()
+        if len(cache) > FORMAT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+    
+    @staticmethod
+    def _file_version(file_path: str) -> tuple:
+        """Identify a file's current contents by its path, size and modification time."""
+        file_stat = os.stat(file_path)
+        return (os.fspath(file_path), file_stat.st_size, file_stat.st_mtime_ns)
+    
+    def _read_excel_file(self, file_path: str, usecols=None, nrows: Optional[int] = None) -> pd.DataFrame:
         """Read an Excel file."""
         try:
-            df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path, usecols=usecols, nrows=nrows)
             self.logger.info("Successfully read Excel file")
             return df
         except Exception as e:
@@ -79,107 +313,33 @@ class FileProcessor:
     
     def get_column_mapping(self, df: pd.DataFrame) -> Dict[str, str]:
         """Get the appropriate column mapping based on the DataFrame columns."""
-        # Define column mappings for different formats
-        column_mappings = {
-            # Format 1: Spaces and proper capitalization
-            'spaced': {
-                'Census Record 1900': 'census_record_1900',
-                'Indian Name': 'indian_name',
-                'Tribal Name': 'indian_name',
-                'Family Name': 'family_name',
-                'English given name': 'english_given_name',
-                'Alias': 'alias',
-                'Sex': 'sex',
-                'Year of birth': 'year_of_birth',
-                'Arrival at Lincoln': 'arrival_at_lincoln',
-                'Departure from Lincoln': 'departure_from_lincoln',
-                'Nation': 'nation',
-                'Band': 'band',
-                'Agency': 'agency',
-                'Trade': 'trade',
-                'Source': 'source',
-                'Comments': 'comments',
-                'Cause of Death': 'cause_of_death',
-                'Cemetery / Burial': 'cemetery_burial',
-                'Cemetery / Burial with protective quotes': 'cemetery_burial',
-                'Relevant Links': 'relevant_links'
-            },
-            # Format 2: CamelCase without spaces
-            'camel': {
-                'censusRecord1900': 'census_record_1900',
-                'tribalName': 'indian_name',
-                'familyName': 'family_name',
-                'englishGivenName': 'english_given_name',
-                'alias': 'alias',
-                'sex': 'sex',
-                'yearOfBirth': 'year_of_birth',
-                'arrivalAtLincoln': 'arrival_at_lincoln',
-                'departureFromLincoln': 'departure_from_lincoln',
-                'nation': 'nation',
-                'band': 'band',
-                'agency': 'agency',
-                'trade': 'trade',
-                'source': 'source',
-                'comments': 'comments',
-                'causeOfDeath': 'cause_of_death',
-                'cemeteryBurial': 'cemetery_burial',
-                'relevantLinks': 'relevant_links'
-            },
-            # Format 3: Underscore separated
-            'underscore': {
-                'census_record_1900': 'census_record_1900',
-                'indian_name': 'indian_name',
-                'family_name': 'family_name',
-                'english_given_name': 'english_given_name',
-                'alias': 'alias',
-                'sex': 'sex',
-                'year_of_birth': 'year_of_birth',
-                'arrival_at_lincoln': 'arrival_at_lincoln',
-                'departure_from_lincoln': 'departure_from_lincoln',
-                'nation': 'nation',
-                'band': 'band',
-                'agency': 'agency',
-                'trade': 'trade',
-                'source': 'source',
-                'comments': 'comments',
-                'cause_of_death': 'cause_of_death',
-                'cemetery_burial': 'cemetery_burial',
-                'relevant_links': 'relevant_links'
-            }
-        }
-        
-        # Strip trailing spaces and convert to lowercase for comparison
+        # Strip trailing spaces and compare lowercased names against each format
         df.columns = df.columns.str.strip()
-        
-        # Find the best matching format
-        best_match = None
-        best_score = 0
-        
-        for format_name, mapping in column_mappings.items():
-            score = sum(1 for col in df.columns if col in mapping)
-            if score > best_score:
-                best_score = score
-                best_match = mapping
-        
-        if best_match:
+        columns = {col.lower(): col for col in df.columns}
+        format_name, best_score = _best_mapping(tuple(columns))
+
+        if best_score:
             self.logger.info(f"Using column mapping format with {best_score} matches")
-            return best_match
+            mapping = _MAPPINGS[format_name]
+            return {columns[key]: mapping[key] for key in columns if key in mapping}
         else:
             self.logger.warning("No column mapping found, using original column names")
             return {col: col for col in df.columns}
     
     def validate_file_exists(self, file_path: str) -> bool:
         """Validate that the file exists and is readable."""
-        path = Path(file_path)
-        if not path.exists():
+        # One stat call answers existence, file type and size
+        try:
+            file_stat = os.stat(file_path)
+        except (OSError, ValueError):
             self.logger.error(f"File not found: {file_path}")
             return False
         
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             self.logger.error(f"Path is not a file: {file_path}")
             return False
         
-        if not path.stat().st_size > 0:
+        if not file_stat.st_size > 0:
             self.logger.error(f"File is empty: {file_path}")
             return False
         
@@ -2,15 +2,59 @@
 Lincoln School Data Importer - Clean Architecture Implementation
 """
 
+import os
 import pandas as pd
-from typing import Dict, Any, List
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice, repeat
+from multiprocessing import parent_process
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 import logging
 
 from .data_processor import DataProcessor
-from .database_manager import DatabaseManager
+from .database_manager import DatabaseManager, LincolnRecord, OrphansRecord
 from .file_processor import FileProcessor
 from .logger import LoggerFactory
 
+# Text columns stored as strings, with the widths they are truncated to
+LINCOLN_STR_LIMITS = {
+    'census_record_1900': 100,
+    'alias': 200,
+    'sex': 1,
+    'nation': 200,
+    'band': 200,
+    'agency': 200,
+    'trade': 200,
+    'source': 500,
+    'comments': 1000,
+    'cause_of_death': 500,
+    'cemetery_burial': 500,
+    'relevant_links': 1000
+}
+
+ORPHANS_STR_LIMITS = {
+    'aliases': 500,
+    'scholarships': 500,
+    'assignments': 500,
+    'situation_1878': 500,
+    'references': 1000,
+    'comments': 1000
+}
+
+def _read_lincoln_file(file_path: str, db_connection_string: str) -> List[LincolnRecord]:
+    """Read and clean one Lincoln student file in a worker process."""
+    # Bound methods cannot be sent to workers, so each worker builds its own importer
+    return LincolnImporter(db_connection_string).read_lincoln_file(file_path)
+
+def _clean_lincoln_chunk(df: pd.DataFrame, column_mapping: Dict[str, str], db_connection_string: str) -> List[LincolnRecord]:
+    """Clean one row chunk of a Lincoln student file in a worker process."""
+    return LincolnImporter(db_connection_string)._process_lincoln_data(df, column_mapping)
+
+def _clean_orphans_chunk(df: pd.DataFrame, db_connection_string: str) -> List[OrphansRecord]:
+    """Clean one row chunk of an orphans file in a worker process."""
+    return LincolnImporter(db_connection_string)._process_orphans_data(df)
+
 class LincolnImporter:
     """
     Main importer class for Lincoln School data.
@@ -34,11 +78,30 @@ class LincolnImporter:
             'logs/import.log'
         )
         
-        # Initialize components
-        self.file_processor = FileProcessor(self.logger)
-        self.data_processor = DataProcessor(self.logger)
+        # Initialize components; the file and data processors are shared by
+        # importers with the same logger (the file processor's bounded memo of
+        # file formats with them), while the database manager owns this
+        # importer's connection
+        self.file_processor = self._get_file_processor(self.logger)
+        self.data_processor = self._get_data_processor(self.logger)
         self.db_manager = DatabaseManager(db_connection_string, self.logger)
     
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _get_file_processor(logger: logging.Logger) -> FileProcessor:
+        """The FileProcessor shared by importers logging to logger."""
+        return FileProcessor(logger)
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _get_data_processor(logger: logging.Logger) -> DataProcessor:
+        """The DataProcessor shared by importers logging to logger."""
+        return DataProcessor(logger)
+    
+    def close(self) -> None:
+        """Close the database connection shared by the imports."""
+        self.db_manager.close()
+    
     def import_lincoln_data(self, file_path: str) -> None:
         """
         Import Lincoln student data from a file.
@@ -53,25 +116,89 @@ class LincolnImporter:
             if not self.file_processor.validate_file_exists(file_path):
                 raise FileNotFoundError(f"File not found or invalid: {file_path}")
             
-            # Create database schema
-            self.db_manager.create_lincoln_schema()
+            # Create the table; its indexes are built once the rows are loaded
+            self.db_manager.create_lincoln_table()
+            
+            # Pick the column mapping from the header, then read only the mapped columns
+            header = self.file_processor.read_file(file_path, nrows=0)
+            column_mapping = self.file_processor.get_column_mapping(header)
+            
+            # Clean the file a chunk at a time and load each chunk as it is
+            # cleaned, committing once at the end
+            chunks = self.file_processor.iter_chunks(file_path, columns=column_mapping)
+            total_records = 0
+            for cleaned_records in self._clean_chunks(
+                self._strip_columns(chunks), self._process_lincoln_data, _clean_lincoln_chunk, column_mapping
+            ):
+                self.db_manager.copy_lincoln_records(cleaned_records, commit=False)
+                total_records += len(cleaned_records)
+            self.db_manager.commit()
+            self.db_manager.create_lincoln_indexes()
+            
+            self.logger.info(f"Lincoln data import completed successfully: {total_records} records")
             
-            # Read and process file
-            df = self.file_processor.read_file(file_path)
-            column_mapping = self.file_processor.get_column_mapping(df)
+        except Exception as e:
+            self.db_manager.rollback()
+            self.logger.error(f"Lincoln data import failed: {str(e)}")
+            raise
+    
+    def import_many(self, file_paths: List[str]) -> None:
+        """
+        Import Lincoln student data from several files, one worker process per file.
+        
+        The files are read and cleaned in parallel, then loaded in one transaction.
+        
+        Args:
+            file_paths: Paths to the data files
+        """
+        try:
+            self.logger.info(f"Starting Lincoln data import from {len(file_paths)} files")
             
-            # Clean and validate data
-            cleaned_records = self._process_lincoln_data(df, column_mapping)
+            max_workers = min(len(file_paths), os.cpu_count() or 1)
+            if max_workers <= 1:
+                cleaned = [self.read_lincoln_file(file_path) for file_path in file_paths]
+            else:
+                self.logger.info(f"Cleaning {len(file_paths)} files with {max_workers} worker processes")
+                with LoggerFactory.forward_from_workers(self.logger) as (initializer, initargs), \
+                        ProcessPoolExecutor(max_workers, initializer=initializer, initargs=initargs) as executor:
+                    cleaned = list(executor.map(
+                        _read_lincoln_file, file_paths, repeat(self.db_manager.connection_string)
+                    ))
+            records = [record for file_records in cleaned for record in file_records]
             
-            # Import to database
-            self.db_manager.insert_lincoln_records(cleaned_records)
+            self.db_manager.create_lincoln_table()
+            self.db_manager.copy_lincoln_records(records, commit=False)
+            self.db_manager.commit()
+            self.db_manager.create_lincoln_indexes()
             
-            self.logger.info("Lincoln data import completed successfully")
+            self.logger.info(f"Lincoln data import completed successfully: {len(records)} records")
             
         except Exception as e:
+            self.db_manager.rollback()
             self.logger.error(f"Lincoln data import failed: {str(e)}")
             raise
     
+    def read_lincoln_file(self, file_path: str) -> List[LincolnRecord]:
+        """
+        Read and clean a Lincoln student file without loading it.
+        
+        Args:
+            file_path: Path to the data file
+            
+        Returns:
+            List of cleaned records
+        """
+        if not self.file_processor.validate_file_exists(file_path):
+            raise FileNotFoundError(f"File not found or invalid: {file_path}")
+        
+        header = self.file_processor.read_file(file_path, nrows=0)
+        column_mapping = self.file_processor.get_column_mapping(header)
+        
+        records = []
+        for df in self._strip_columns(self.file_processor.iter_chunks(file_path, columns=column_mapping)):
+            records.extend(self._process_lincoln_data(df, column_mapping))
+        return records
+    
     def import_orphans_data(self, file_path: str) -> None:
         """
         Import civil war orphans data from a file.
@@ -86,25 +213,72 @@ class LincolnImporter:
             if not self.file_processor.validate_file_exists(file_path):
                 raise FileNotFoundError(f"File not found or invalid: {file_path}")
             
-            # Create database schema
-            self.db_manager.create_orphans_schema()
+            # Create the table; its indexes are built once the rows are loaded
+            self.db_manager.create_orphans_table()
             
-            # Read and process file
-            df = self.file_processor.read_file(file_path)
+            # Clean the file a chunk at a time and load each chunk as it is
+            # cleaned, committing once at the end
+            chunks = self.file_processor.iter_chunks(file_path)
+            total_records = 0
+            for cleaned_records in self._clean_chunks(chunks, self._process_orphans_data, _clean_orphans_chunk):
+                self.db_manager.copy_orphans_records(cleaned_records, commit=False)
+                total_records += len(cleaned_records)
+            self.db_manager.commit()
+            self.db_manager.create_orphans_indexes()
             
-            # Clean and validate data
-            cleaned_records = self._process_orphans_data(df)
-            
-            # Import to database
-            self.db_manager.insert_orphans_records(cleaned_records)
-            
-            self.logger.info("Orphans data import completed successfully")
+            self.logger.info(f"Orphans data import completed successfully: {total_records} records")
             
         except Exception as e:
+            self.db_manager.rollback()
             self.logger.error(f"Orphans data import failed: {str(e)}")
             raise
     
-    def _process_lincoln_data(self, df: pd.DataFrame, column_mapping: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _clean_chunks(self, chunks: Iterable[pd.DataFrame], process: Callable, clean_chunk: Callable, *args) -> Iterator[list]:
+        """
+        Clean row chunks in worker processes, yielding each chunk's records in file order.
+        
+        Chunks are cleaned independently, so while one chunk is being loaded the
+        following ones are cleaned in parallel; at most one chunk per worker waits
+        ahead of the loader. The pool is sized to the chunks read ahead, up to one
+        per CPU; a single chunk, one CPU, or running inside a worker means the
+        chunks are cleaned in this process.
+        
+        Args:
+            chunks: Raw row chunks
+            process: Method cleaning one chunk in this process
+            clean_chunk: Module-level function cleaning one chunk in a worker
+            *args: Extra arguments passed to both after the chunk
+            
+        Returns:
+            Iterator over each chunk's cleaned records
+        """
+        chunks = iter(chunks)
+        max_workers = os.cpu_count() or 1
+        head = [] if parent_process() is not None else list(islice(chunks, max_workers))
+        if len(head) <= 1:
+            for df in chain(head, chunks):
+                yield process(df, *args)
+            return
+        
+        max_workers = len(head)
+        with LoggerFactory.forward_from_workers(self.logger) as (initializer, initargs), \
+                ProcessPoolExecutor(max_workers, initializer=initializer, initargs=initargs) as executor:
+            pending = deque()
+            for df in chain(head, chunks):
+                pending.append(executor.submit(clean_chunk, df, *args, self.db_manager.connection_string))
+                if len(pending) > max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    @staticmethod
+    def _strip_columns(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Strip surrounding whitespace from each chunk's column names."""
+        for df in chunks:
+            df.columns = df.columns.str.strip()
+            yield df
+    
+    def _process_lincoln_data(self, df: pd.DataFrame, column_mapping: Dict[str, str]) -> List[LincolnRecord]:
         """
         Process Lincoln student data.
         
@@ -119,60 +293,24 @@ class LincolnImporter:
         df = df.rename(columns=column_mapping)
         
         # Remove unnamed columns
-        df = df.loc[:, ~df.columns.str.contains('^Unnamed:', na=False)].copy()
-        
-        cleaned_records = []
-        
-        for _, row in df.iterrows():
-            try:
-                # Clean year of birth
-                year_of_birth = self.data_processor.clean_year(row.get('year_of_birth'))
-                
-                # Clean dates
-                arrival_date, arrival_uncertain, arrival_type = self.data_processor.clean_date(
-                    row.get('arrival_at_lincoln')
-                )
-                departure_date, departure_uncertain, departure_type = self.data_processor.clean_date(
-                    row.get('departure_from_lincoln')
-                )
-                
-                # Clean names
-                family_name = self.data_processor.clean_name(row.get('family_name'))
-                english_given_name = self.data_processor.clean_name(row.get('english_given_name'))
-                indian_name = self.data_processor.clean_name(row.get('indian_name'))
-                
-                # Create cleaned record
-                record = {
-                    'census_record_1900': str(row.get('census_record_1900', ''))[:100],
-                    'indian_name': str(indian_name)[:500] if indian_name else None,
-                    'family_name': str(family_name)[:200] if family_name else None,
-                    'english_given_name': str(english_given_name)[:200] if english_given_name else None,
-                    'alias': str(row.get('alias', ''))[:200],
-                    'sex': str(row.get('sex', ''))[:1],
-                    'year_of_birth': year_of_birth,
-                    'arrival_at_lincoln': arrival_date,
-                    'departure_from_lincoln': departure_date,
-                    'nation': str(row.get('nation', ''))[:200],
-                    'band': str(row.get('band', ''))[:200],
-                    'agency': str(row.get('agency', ''))[:200],
-                    'trade': str(row.get('trade', ''))[:200],
-                    'source': str(row.get('source', ''))[:500],
-                    'comments': str(row.get('comments', ''))[:1000],
-                    'cause_of_death': str(row.get('cause_of_death', ''))[:500],
-                    'cemetery_burial': str(row.get('cemetery_burial', ''))[:500],
-                    'relevant_links': str(row.get('relevant_links', ''))[:1000]
-                }
-                
-                cleaned_records.append(record)
-                
-            except Exception as e:
-                self.logger.warning(f"Error processing row: {str(e)}")
-                continue
-        
-        self.logger.info(f"Processed {len(cleaned_records)} Lincoln student records")
-        return cleaned_records
-    
-    def _process_orphans_data(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        df = df.loc[:, ~df.columns.str.startswith('Unnamed:', na=False)]
+        
+        # Clean and truncate whole columns at once, then assemble the table's columns
+        arrival_dates = self._clean_dates(df, 'arrival_at_lincoln')
+        departure_dates = self._clean_dates(df, 'departure_from_lincoln')
+        records = pd.DataFrame({
+            **{column: self._text(df, column, width) for column, width in LINCOLN_STR_LIMITS.items()},
+            'indian_name': self._clean_names(df, 'indian_name', 500),
+            'family_name': self._clean_names(df, 'family_name', 200),
+            'english_given_name': self._clean_names(df, 'english_given_name', 200),
+            'year_of_birth': self._clean_years(df, 'year_of_birth'),
+            'arrival_at_lincoln': arrival_dates['date'],
+            'departure_from_lincoln': departure_dates['date']
+        }, index=df.index)
+        
+        return self._to_records(records, LincolnRecord, 'Lincoln student')
+    
+    def _process_orphans_data(self, df: pd.DataFrame) -> List[OrphansRecord]:
         """
         Process civil war orphans data.
         
@@ -182,57 +320,66 @@ class LincolnImporter:
         Returns:
             List of cleaned records
         """
-        cleaned_records = []
-        
-        for _, row in df.iterrows():
-            try:
-                # Clean dates
-                birth_date, birth_uncertain, birth_type = self.data_processor.clean_date(
-                    row.get('birth_date')
-                )
-                arrival_date, arrival_uncertain, arrival_type = self.data_processor.clean_date(
-                    row.get('arrival')
-                )
-                departure_date, departure_uncertain, departure_type = self.data_processor.clean_date(
-                    row.get('departure')
-                )
-                
-                # Clean names
-                family_name = self.data_processor.clean_name(row.get('family_name'))
-                given_name = self.data_processor.clean_name(row.get('given_name'))
-                
-                # Create cleaned record
-                record = {
-                    'family_name': str(family_name)[:200] if family_name else None,
-                    'given_name': str(given_name)[:200] if given_name else None,
-                    'aliases': str(row.get('aliases', ''))[:500],
-                    'birth_date': birth_date,
-                    'arrival': arrival_date,
-                    'departure': departure_date,
-                    'scholarships': str(row.get('scholarships', ''))[:500],
-                    'assignments': str(row.get('assignments', ''))[:500],
-                    'situation_1878': str(row.get('situation_1878', ''))[:500],
-                    'assignment_scholarship_year': self.data_processor.clean_year(
-                        row.get('assignment_scholarship_year')
-                    ),
-                    'references': str(row.get('references', ''))[:1000],
-                    'comments': str(row.get('comments', ''))[:1000],
-                    'birth_date_original_text': str(row.get('birth_date', '')),
-                    'birth_date_uncertain': birth_uncertain,
-                    'arrival_original_text': str(row.get('arrival', '')),
-                    'arrival_uncertain': arrival_uncertain,
-                    'arrival_at_lincoln': arrival_date,
-                    'departure_original_text': str(row.get('departure', '')),
-                    'departure_uncertain': departure_uncertain,
-                    'departure_at_lincoln': departure_date,
-                    'departure_from_lincoln': departure_date
-                }
-                
-                cleaned_records.append(record)
-                
-            except Exception as e:
-                self.logger.warning(f"Error processing orphans row: {str(e)}")
-                continue
-        
-        self.logger.info(f"Processed {len(cleaned_records)} orphans records")
-        return cleaned_records
+        # Clean and truncate whole columns at once, then assemble the table's columns
+        birth_dates = self._clean_dates(df, 'birth_date')
+        arrival_dates = self._clean_dates(df, 'arrival')
+        departure_dates = self._clean_dates(df, 'departure')
+        records = pd.DataFrame({
+            **{column: self._text(df, column, width) for column, width in ORPHANS_STR_LIMITS.items()},
+            'family_name': self._clean_names(df, 'family_name', 200),
+            'given_name': self._clean_names(df, 'given_name', 200),
+            'birth_date': birth_dates['date'],
+            'arrival': arrival_dates['date'],
+            'departure': departure_dates['date'],
+            'assignment_scholarship_year': self._clean_years(df, 'assignment_scholarship_year'),
+            'birth_date_original_text': self._text(df, 'birth_date'),
+            'birth_date_uncertain': birth_dates['uncertain'],
+            'arrival_original_text': self._text(df, 'arrival'),
+            'arrival_uncertain': arrival_dates['uncertain'],
+            'arrival_at_lincoln': arrival_dates['date'],
+            'departure_original_text': self._text(df, 'departure'),
+            'departure_uncertain': departure_dates['uncertain'],
+            'departure_at_lincoln': departure_dates['date'],
+            'departure_from_lincoln': departure_dates['date']
+        }, index=df.index)
+        
+        return self._to_records(records, OrphansRecord, 'orphans')
+    
+    def _clean_years(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """Clean a year column in one pass, as Python ints with None for missing or invalid years."""
+        if column not in df.columns:
+            return pd.Series([None] * len(df), index=df.index, dtype=object)
+        years = self.data_processor.clean_year_series(df[column]).astype(object)
+        return years.where(years.notna(), None)
+    
+    def _clean_dates(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """Clean a date column in one pass, into 'date', 'uncertain' and 'uncertainty_type' columns."""
+        if column in df.columns:
+            dates = df[column]
+        else:
+            dates = pd.Series([None] * len(df), index=df.index, dtype=object)
+        return self.data_processor.clean_date_series(dates)
+    
+    def _clean_names(self, df: pd.DataFrame, column: str, width: int) -> pd.Series:
+        """Clean a name column in one pass, cut to width, with None for missing or empty names."""
+        if column not in df.columns:
+            return pd.Series([None] * len(df), index=df.index, dtype=object)
+        names = self.data_processor.clean_name_series(df[column])
+        return names.str.slice(0, width).where(names.notna() & (names != ''), None)
+    
+    def _text(self, df: pd.DataFrame, column: str, width: Optional[int] = None) -> pd.Series:
+        """A column as str(value)[:width] per value, or '' per row if the column is missing."""
+        if column not in df.columns:
+            return pd.Series([''] * len(df), index=df.index, dtype=object)
+        return df[column].astype(str).str.slice(0, width)
+    
+    def _to_records(self, records: pd.DataFrame, record_type: type, label: str) -> list:
+        """Turn cleaned columns into record_type tuples in table column order, logging a summary."""
+        records = records[list(record_type._fields)]
+        
+        empty = records.isna().sum()
+        if empty.any():
+            self.logger.debug(f"Empty values per column: {empty[empty > 0].to_dict()}")
+        self.logger.info(f"Processed {len(records)} {label} records")
+        
+        return list(map(record_type._make, records.itertuples(index=False, name=None)))
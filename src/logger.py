@@ -3,8 +3,24 @@ Logging configuration utilities.
 """
 
 import logging
+import multiprocessing
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+# The (log_level, log_file) each logger was last configured with, by name
+_LOGGER_CONFIG: Dict[str, Tuple[str, Optional[str]]] = {}
+
+# Loggers of a worker process that forward their records to the parent process
+_FORWARDED = set()
+
+# Log file rotation size and number of rotated files kept
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+# Records buffered before the log file is written; errors are written at once
+LOG_BUFFER_CAPACITY = 1000
 
 class LoggerFactory:
     """Factory for creating configured loggers."""
@@ -14,6 +30,9 @@ class LoggerFactory:
         """
         Create a configured logger.
         
+        Asking again for a logger with the same settings returns it as it is,
+        without rebuilding its handlers.
+        
         Args:
             name: Logger name
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -23,9 +42,18 @@ class LoggerFactory:
             Configured logger instance
         """
         logger = logging.getLogger(name)
+        config = (log_level.upper(), log_file)
+        if _LOGGER_CONFIG.get(name) == config or name in _FORWARDED:
+            return logger
+        
         logger.setLevel(getattr(logging, log_level.upper()))
         
         # Clear existing handlers to avoid duplicates
+        for handler in logger.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target:
+                target.close()
         logger.handlers.clear()
         
         # Create logs directory if it doesn't exist
@@ -43,11 +71,55 @@ class LoggerFactory:
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
         
-        # File handler (if specified)
+        # File handler (if specified), rotated by size and written in batches;
+        # logging.shutdown flushes the buffer at exit
         if log_file:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.DEBUG)
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS
+            )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            buffered_handler = MemoryHandler(
+                LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+            )
+            buffered_handler.setLevel(logging.DEBUG)
+            logger.addHandler(buffered_handler)
         
+        _LOGGER_CONFIG[name] = config
         return logger
+    
+    @staticmethod
+    def flush(logger: logging.Logger) -> None:
+        """Write out any buffered records of a logger."""
+        for handler in logger.handlers:
+            handler.flush()
+    
+    @staticmethod
+    @contextmanager
+    def forward_from_workers(logger: logging.Logger) -> Iterator[Tuple[Callable, tuple]]:
+        """
+        Have worker processes log through this process's handlers for logger.
+        
+        Only this process then writes (and rotates) the log file. Yields the
+        initializer and initargs to start each worker with; the workers must
+        have finished before the block exits.
+        
+        Args:
+            logger: Logger whose records the workers send back
+        """
+        queue = multiprocessing.Queue()
+        listener = QueueListener(queue, *logger.handlers, respect_handler_level=True)
+        listener.start()
+        try:
+            yield _forward_to_parent, (logger.name, logger.level, queue)
+        finally:
+            listener.stop()
+            queue.close()
+
+def _forward_to_parent(name: str, level: int, queue) -> None:
+    """Worker initializer: send the named logger's records to the parent through queue."""
+    logger = logging.getLogger(name)
+    # Drop the handlers inherited from the parent unflushed, so buffered records
+    # are not written twice and the worker never touches the log file
+    logger.handlers = [QueueHandler(queue)]
+    logger.setLevel(level)
+    _FORWARDED.add(name)
@@ -2,13 +2,27 @@
 Tests for the data importer module.
 """
 
+import codecs
+import tempfile
 import unittest
+from unittest.mock import MagicMock, patch
 from datetime import datetime
+from pathlib import Path
+import pandas as pd
+import psycopg2
+import pytest
 from data_importer import DataImporter
+from orphans_loader import bulk_load
+
+@pytest.fixture(scope='module')
+def importer():
+	# One importer shared by the module's pytest-style tests; no DB needed
+	return DataImporter(db_connection_string='')
 
 class TestDataImporter(unittest.TestCase):
-	def setUp(self):
-		self.importer = DataImporter(db_connection_string='')  # No DB needed for these tests
+	@classmethod
+	def setUpClass(cls):
+		cls.importer = DataImporter(db_connection_string='')  # No DB needed for these tests
 
 	def test_clean_year_valid(self):
 		self.assertEqual(self.importer.clean_year('1890'), 1890)
@@ -50,33 +64,160 @@ class TestDataImporter(unittest.TestCase):
 		self.assertFalse(uncertain)
 		self.assertIsNone(typ)
 
-def test_clean_date(importer):
-    # Test various date formats
-    assert importer.clean_date('2023-01-01') == datetime(2023, 1, 1)
-    assert importer.clean_date('2023/01/01') == datetime(2023, 1, 1)
-    assert importer.clean_date('01/01/2023') == datetime(2023, 1, 1)
-    assert importer.clean_date('2023-01-01; 2023-01-02') == datetime(2023, 1, 1)
-    assert importer.clean_date(None) is None
-    assert importer.clean_date('invalid') is None
-
-def test_clean_name(importer):
-    # Test name cleaning
-    assert importer.clean_name('John Doe') == 'John Doe'
-    assert importer.clean_name('John-Doe') == 'John-Doe'
-    assert importer.clean_name('John.Doe') == 'John.Doe'
-    assert importer.clean_name('John@Doe') == 'JohnDoe'
-    assert importer.clean_name(None) is None
-    assert importer.clean_name('') is None
-
-def test_clean_year(importer):
-    # Test year cleaning
-    assert importer.clean_year('1870') == 1870
-    assert importer.clean_year(1870) == 1870
+	def test_detect_encoding_fast_paths(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			path = Path(tmp) / 'sample.csv'
+			path.write_bytes(codecs.BOM_UTF8 + 'Name\nÉmile\n'.encode('utf-8'))
+			self.assertEqual(self.importer.detect_encoding(str(path)), 'utf-8-sig')
+			path.write_bytes('Name\nMary\n'.encode('utf-16'))
+			self.assertEqual(self.importer.detect_encoding(str(path)), 'utf-16')
+			path.write_bytes(b'Name\nMary\n')
+			self.assertEqual(self.importer.detect_encoding(str(path)), 'utf-8')
+			path.write_bytes(b'')
+			self.assertEqual(self.importer.detect_encoding(str(path)), 'utf-8')
+
+	def test_detect_delimiter(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			path = Path(tmp) / 'sample.csv'
+			path.write_text('"Name"|"Source"\n"Mary"|"LI, 1895"\n"Maggie"|"LI, 1895, LI, 1896"\n')
+			self.assertEqual(self.importer.detect_delimiter(str(path)), '|')
+			path.write_text('Name,Source\nMary,"LI | 1895"\nMaggie,LI 1896\n')
+			self.assertEqual(self.importer.detect_delimiter(str(path)), ',')
+			self.assertEqual(self.importer.detect_delimiter(str(path), b'a\tb\nc\td\n'), '\t')
+
+	def test_clean_name_column(self):
+		values = pd.Series(['John@Doe', ' Mary-Ann ', '@', None, 'Émile'])
+		cleaned = self.importer._clean_name_column(values)
+
+		self.assertEqual(cleaned.iloc[[0, 1, 4]].tolist(), ['JohnDoe', 'Mary-Ann', 'Émile'])
+		self.assertTrue(cleaned.iloc[2:4].isna().all())
+
+	def test_clean_category_column(self):
+		values = pd.Series(['f', ' F', '  ', None, 'm'])
+		cleaned = self.importer._clean_category_column(values, upper=True)
+
+		self.assertIsInstance(cleaned.dtype, pd.CategoricalDtype)
+		self.assertEqual(list(cleaned.cat.categories), ['F', 'M'])
+		self.assertEqual(cleaned.tolist()[:2], ['F', 'F'])
+		self.assertTrue(cleaned.iloc[2:4].isna().all())
+
+	@patch('data_importer.psycopg2.connect')
+	def test_copy_dataframe(self, mock_connect):
+		df = pd.DataFrame({'family_name': ['Smith', None], 'year_of_birth': [1890, 1891]})
+		self.importer.copy_dataframe(df, 'students')
+
+		cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+		cursor.copy_expert.assert_called_once()
+		buffer = cursor.copy_expert.call_args[0][1]
+		self.assertEqual(buffer.getvalue(), 'Smith,1890\n\\N,1891\n')
+		mock_connect.return_value.close.assert_called_once()
+
+	@patch('data_importer.psycopg2.connect')
+	def test_copy_dataframe_on_shared_connection(self, mock_connect):
+		conn = MagicMock()
+		df = pd.DataFrame({'family_name': ['Smith'], 'year_of_birth': [1890]})
+		self.importer.copy_dataframe(df, 'students', conn)
+
+		mock_connect.assert_not_called()
+		conn.cursor.return_value.__enter__.return_value.copy_expert.assert_called_once()
+		conn.commit.assert_called_once()
+		conn.close.assert_not_called()
+
+	def test_bulk_load_maps_and_truncates(self):
+		conn = MagicMock()
+		df = pd.DataFrame({'situation,_1878': ['Farmhand', None], 'birth_date': ['1870', '1871']})
+		loaded = bulk_load(conn, 'civil_war_orphans_raw', df,
+			{'situation_1878': 'situation,_1878', 'birth_date_clean': 'birth_date', 'comments': 'comments'},
+			{'situation_1878': 4})
+
+		self.assertEqual(loaded, 2)
+		cursor = conn.cursor.return_value.__enter__.return_value
+		buffer = cursor.copy_expert.call_args[0][1]
+		self.assertEqual(buffer.getvalue(), 'Farm,1870,\\N\n\\N,1871,\\N\n')
+		conn.commit.assert_not_called()
+
+	@patch('data_importer.execute_values')
+	@patch('data_importer.psycopg2.connect')
+	def test_copy_dataframe_falls_back_to_insert(self, mock_connect, mock_execute_values):
+		conn = mock_connect.return_value
+		cursor = conn.cursor.return_value.__enter__.return_value
+		cursor.copy_expert.side_effect = psycopg2.errors.InsufficientPrivilege()
+		df = pd.DataFrame({'family_name': ['Smith', None], 'year_of_birth': [1890, 1891]})
+		self.importer.copy_dataframe(df, 'students')
+
+		conn.rollback.assert_called_once()
+		rows = list(mock_execute_values.call_args[0][2])
+		self.assertEqual(rows, [('Smith', 1890), (None, 1891)])
+		self.assertEqual(mock_execute_values.call_args[1]['page_size'], 1000)
+
+	@patch('data_importer.execute_batch')
+	def test_insert_dataframe_per_row(self, mock_execute_batch):
+		conn = MagicMock()
+		df = pd.DataFrame({'family_name': ['Smith', None], 'year_of_birth': [1890, 1891]})
+		self.importer.insert_dataframe(conn, df, 'students', per_row=True)
+
+		rows = list(mock_execute_batch.call_args[0][2])
+		self.assertEqual(rows, [('Smith', 1890), (None, 1891)])
+		self.assertEqual(mock_execute_batch.call_args[1]['page_size'], 1000)
+
+	def test_clean_files(self):
+		file_paths = ['data/UTF-8Partial_Data.csv', 'data/Most_Data.csv']
+		frames = self.importer.clean_files(file_paths)
+
+		self.assertEqual(len(frames), 2)
+		for file_path, df in zip(file_paths, frames):
+			pd.testing.assert_frame_equal(df, self.importer.process_file(file_path))
+
+	def test_clean_dataframe_in_chunks(self):
+		file_path = 'data/Most_Data.csv'
+		raw = self.importer.read_csv_file(file_path, self.importer.detect_encoding(file_path), '|')
+		expected = self.importer.validate_and_clean_dataframe(raw.copy(), file_path)
+		with patch('data_importer.CLEAN_CHUNK_ROWS', 100), patch('data_importer.os.cpu_count', return_value=2):
+			df = self.importer.clean_dataframe(raw.copy(), file_path)
+
+		# Category order may differ between chunks; the values may not
+		pd.testing.assert_frame_equal(df, expected, check_categorical=False)
+		self.assertIsInstance(df['nation'].dtype, pd.CategoricalDtype)
+
+@pytest.mark.parametrize('value, expected', [
+    # Various date formats; clean_date returns (date, is_uncertain, uncertainty_type)
+    ('1890-01-01', datetime(1890, 1, 1)),
+    ('1890/01/01', datetime(1890, 1, 1)),
+    ('01/01/1890', datetime(1890, 1, 1)),
+    ('1890-02- 3', datetime(1890, 2, 3)),  # Space-padded day
+    ('2/ 3/1890', datetime(1890, 2, 3)),
+    ('1890-01-01; 1890-01-02', datetime(1890, 1, 1)),
+    ('2023-01-01', None),  # Outside the school's years
+    (None, None),
+    ('invalid', None),
+])
+def test_clean_date(importer, value, expected):
+    assert importer.clean_date(value)[0] == expected
+
+@pytest.mark.parametrize('value, expected', [
+    ('John Doe', 'John Doe'),
+    ('John-Doe', 'John-Doe'),
+    ('John.Doe', 'John.Doe'),
+    ('John@Doe', 'JohnDoe'),
+    (None, None),
+    ('', None),
+])
+def test_clean_name(importer, value, expected):
+    assert importer.clean_name(value) == expected
+
+@pytest.mark.parametrize('value, expected', [
+    ('1870', 1870),
+    (1870, 1870),
+    ('invalid', None),
+    (None, None),
+    (3000, None),  # Future year
+    (1000, None),  # Too old
+])
+def test_clean_year(importer, value, expected):
+    assert importer.clean_year(value) == expected
+
+def test_clean_year_from_age(importer):
     assert importer.clean_year('age 20') is not None
-    assert importer.clean_year(None) is None
-    assert importer.clean_year('invalid') is None
-    assert importer.clean_year(3000) is None  # Future year
-    assert importer.clean_year(1000) is None  # Too old 
 
 if __name__ == '__main__':
 	unittest.main() 
\ No newline at end of file
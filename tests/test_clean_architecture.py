@@ -2,16 +2,22 @@
 Tests for the clean architecture implementation.
 """
 
+import codecs
+import os
+import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 from datetime import datetime
 import logging
+from pathlib import Path
 
 from src.lincoln_importer import LincolnImporter
 from src.data_processor import DataProcessor
 from src.file_processor import FileProcessor
-from src.database_manager import DatabaseManager
+from src.database_manager import DatabaseManager, LincolnRecord
+from src.logger import LoggerFactory
 
 class TestDataProcessor(unittest.TestCase):
     """Test the DataProcessor class."""
@@ -48,6 +54,22 @@ class TestDataProcessor(unittest.TestCase):
         self.assertIsNone(self.processor.clean_year(float('-inf')))
         self.assertIsNone(self.processor.clean_year(float('nan')))
     
+    def test_clean_year_series(self):
+        """Test that column cleaning matches clean_year value by value."""
+        values = pd.Series(['1890', '1890.0', ' 1890 ', '1890.5', 'about 1885', 'age 10', '1799', 'x', None])
+        cleaned = self.processor.clean_year_series(values)
+
+        self.assertEqual(str(cleaned.dtype), 'Int64')
+        for value, year in zip(values, cleaned):
+            expected = self.processor.clean_year(value)
+            self.assertEqual(None if pd.isna(year) else year, expected)
+
+    def test_clean_year_series_logs_one_summary(self):
+        """Test that unparseable years are reported once per column, not per value."""
+        self.processor.clean_year_series(pd.Series(['x', 'x', 'y', '1890', None]))
+
+        self.logger.warning.assert_called_once_with("Could not parse year in 3 rows (unrecognized), e.g. 'x'")
+
     def test_clean_date_valid(self):
         """Test cleaning valid date values."""
         result, uncertain, typ = self.processor.clean_date('1890-01-01')
@@ -62,15 +84,33 @@ class TestDataProcessor(unittest.TestCase):
         self.assertEqual(self.processor.clean_date(''), (None, False, None))
         self.assertEqual(self.processor.clean_date(None), (None, False, None))
     
+    def test_clean_date_series(self):
+        """Test that column cleaning matches clean_date value by value."""
+        values = pd.Series(['1890-01-01', 'about 1890', None, 'invalid', '1890-01-01; 1891-01-01'])
+        cleaned = self.processor.clean_date_series(values)
+
+        self.assertEqual(list(cleaned.columns), ['date', 'uncertain', 'uncertainty_type'])
+        self.assertEqual(list(cleaned.itertuples(index=False, name=None)),
+                         [self.processor.clean_date(value) for value in values])
+
     def test_clean_name(self):
         """Test cleaning name values."""
         self.assertEqual(self.processor.clean_name('John Doe'), 'John Doe')
         self.assertEqual(self.processor.clean_name('John-Doe'), 'John-Doe')
         self.assertEqual(self.processor.clean_name('John.Doe'), 'John.Doe')
         self.assertEqual(self.processor.clean_name('John@Doe'), 'JohnDoe')
+        self.assertEqual(self.processor.clean_name("O'Brien"), 'OBrien')
+        self.assertEqual(self.processor.clean_name('Émile@ Dubois'), 'Émile Dubois')
         self.assertIsNone(self.processor.clean_name(None))
         self.assertIsNone(self.processor.clean_name(''))
 
+    def test_clean_name_series(self):
+        """Test that column cleaning matches clean_name value by value."""
+        values = pd.Series(['John@Doe', ' Mary-Ann ', '@', ' ', '', None, 'Émile'])
+        cleaned = self.processor.clean_name_series(values)
+
+        self.assertEqual(cleaned.tolist(), [self.processor.clean_name(value) for value in values])
+
 class TestFileProcessor(unittest.TestCase):
     """Test the FileProcessor class."""
     
@@ -93,6 +133,61 @@ class TestFileProcessor(unittest.TestCase):
         import os
         os.remove('temp_test.txt')
     
+    def test_validate_file_exists_rejects_directories_and_empty_files(self):
+        """Test that directories and empty files fail validation."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertFalse(self.processor.validate_file_exists(tmp))
+            path = Path(tmp) / 'empty.csv'
+            path.touch()
+            self.assertFalse(self.processor.validate_file_exists(str(path)))
+
+    def test_detect_encoding(self):
+        """Test encoding detection fast paths."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'sample.csv'
+            path.write_bytes(codecs.BOM_UTF8 + 'Name\nÉmile\n'.encode('utf-8'))
+            self.assertEqual(self.processor.detect_encoding(str(path)), 'utf-8-sig')
+            path.write_bytes(b'Name\nMary\n')
+            self.assertEqual(self.processor.detect_encoding(str(path)), 'utf-8')
+
+    def test_iter_chunks(self):
+        """Test that a CSV is streamed in chunks of the requested size."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'sample.csv'
+            path.write_text('Family Name|Sex\nSmith|M\nDoe|F\nRoe|F\n')
+            chunks = list(self.processor.iter_chunks(str(path), chunksize=2, columns=['Family Name']))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(pd.concat(chunks)['Family Name'].tolist(), ['Smith', 'Doe', 'Roe'])
+        self.assertEqual(list(chunks[0].columns), ['Family Name'])
+
+    def test_file_is_sampled_once_per_version(self):
+        """Test that reading a header and then the rows detects the format once."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'sample.csv'
+            path.write_text('Family Name|Sex\nÉmile|M\n', encoding='latin-1')
+            with patch('src.file_processor.chardet.detect', return_value={'encoding': 'ISO-8859-1'}) as detect:
+                header = self.processor.read_file(path, nrows=0)
+                rows = pd.concat(self.processor.iter_chunks(path))
+                self.assertEqual(detect.call_count, 1)
+                
+                path.write_text('Family Name|Sex\nÉmile|M\nRoé|F\n', encoding='latin-1')
+                self.assertEqual(len(pd.concat(self.processor.iter_chunks(path))), 2)
+                self.assertEqual(detect.call_count, 2)
+
+        self.assertEqual(list(header.columns), ['Family Name', 'Sex'])
+        self.assertEqual(rows['Family Name'].tolist(), ['Émile'])
+
+    def test_format_memo_is_bounded(self):
+        """Test that only the most recently read file versions are remembered."""
+        with tempfile.TemporaryDirectory() as tmp, patch('src.file_processor.FORMAT_CACHE_SIZE', 2):
+            paths = [Path(tmp) / f'sample{i}.csv' for i in range(3)]
+            for path in paths:
+                path.write_text('Family Name|Sex\nSmith|M\n')
+                self.processor.detect_encoding(path)
+
+        self.assertEqual([version[0] for version in self.processor._encodings], [str(p) for p in paths[1:]])
+
     def test_get_column_mapping(self):
         """Test column mapping detection."""
         # Test with spaced format
@@ -107,6 +202,13 @@ class TestFileProcessor(unittest.TestCase):
         self.assertIn('english_given_name', mapping.values())
         self.assertIn('year_of_birth', mapping.values())
 
+    def test_get_column_mapping_ignores_case(self):
+        """Test that header capitalization does not affect the mapping."""
+        df = pd.DataFrame(columns=['FAMILY NAME', 'english Given Name ', 'Unknown'])
+
+        mapping = self.processor.get_column_mapping(df)
+        self.assertEqual(mapping, {'FAMILY NAME': 'family_name', 'english Given Name': 'english_given_name'})
+
 class TestDatabaseManager(unittest.TestCase):
     """Test the DatabaseManager class."""
     
@@ -125,11 +227,140 @@ class TestDatabaseManager(unittest.TestCase):
         mock_connect.assert_called_once_with('test_connection_string')
         self.assertEqual(result, mock_conn)
 
+    @patch('psycopg2.connect')
+    def test_connection_is_shared_until_closed(self, mock_connect):
+        """Test that schema and load calls reuse one connection."""
+        mock_connect.return_value.closed = 0
+
+        with self.db_manager as db_manager:
+            db_manager.create_lincoln_table()
+            db_manager.copy_lincoln_records([LincolnRecord(family_name='Smith')])
+
+        mock_connect.assert_called_once_with('test_connection_string')
+        mock_connect.return_value.close.assert_called_once()
+
+    @patch('psycopg2.connect')
+    def test_create_lincoln_indexes(self, mock_connect):
+        """Test that indexes are built concurrently on a separate autocommit connection."""
+        self.db_manager.create_lincoln_indexes()
+
+        conn = mock_connect.return_value
+        self.assertTrue(conn.autocommit)
+        statements = [call[0][0] for call in conn.cursor.return_value.__enter__.return_value.execute.call_args_list]
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(all(statement.startswith('CREATE INDEX CONCURRENTLY') for statement in statements))
+        conn.close.assert_called_once()
+
+    @patch('src.database_manager.execute_values')
+    @patch('psycopg2.connect')
+    def test_insert_lincoln_records(self, mock_connect, mock_execute_values):
+        """Test that records are inserted as multi-row pages in column order."""
+        self.db_manager.insert_lincoln_records([
+            LincolnRecord(family_name='Smith', year_of_birth=1890),
+            LincolnRecord(family_name='Doe', sex='F')
+        ])
+
+        rows = mock_execute_values.call_args[0][2]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][2], 'Smith')
+        self.assertEqual(rows[0][6], 1890)
+        self.assertEqual(rows[1][5], 'F')
+        self.assertEqual(mock_execute_values.call_args[1]['page_size'], 1000)
+
+    @patch('src.database_manager.execute_values')
+    @patch('psycopg2.connect')
+    def test_insert_lincoln_records_from_generator(self, mock_connect, mock_execute_values):
+        """Test that a generator of records is inserted a transaction at a time."""
+        records = (LincolnRecord(family_name=str(i)) for i in range(5))
+        self.db_manager.insert_lincoln_records(records, commit_frequency=2)
+
+        batches = [call.args[2] for call in mock_execute_values.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(batches[2][0].family_name, '4')
+
+        # synchronous_commit is relaxed once per transaction
+        conn = mock_connect.return_value.__enter__.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        self.assertEqual(cursor.execute.call_count, 3)
+
+    @patch('psycopg2.connect')
+    def test_copy_lincoln_records(self, mock_connect):
+        """Test that records are sent in a single COPY with nulls as \\N."""
+        self.db_manager.copy_lincoln_records([LincolnRecord(family_name='Smith, Jr.', year_of_birth=1890)])
+
+        cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.copy_expert.assert_called_once()
+        buffer = cursor.copy_expert.call_args[0][1]
+        self.assertTrue(buffer.getvalue().startswith('\\N,\\N,"Smith, Jr.",\\N,\\N,\\N,1890,\\N,'))
+        mock_connect.return_value.commit.assert_called_once()
+
+    @patch('psycopg2.connect')
+    def test_copy_lincoln_records_without_commit(self, mock_connect):
+        """Test that batches can be copied in one transaction and committed at the end."""
+        mock_connect.return_value.closed = 0
+        self.db_manager.copy_lincoln_records([LincolnRecord(family_name='Smith')], commit=False)
+        self.db_manager.copy_lincoln_records([LincolnRecord(family_name='Doe')], commit=False)
+        mock_connect.return_value.commit.assert_not_called()
+
+        self.db_manager.commit()
+        mock_connect.return_value.commit.assert_called_once()
+
+def _log_in_worker(message):
+    """Log a message from a worker process, as the importer's workers do."""
+    LoggerFactory.create_logger('TestLoggerFactoryWorkers', 'INFO', 'logs/unused.log').info(message)
+    return os.getpid()
+
+class TestLoggerFactory(unittest.TestCase):
+    """Test the LoggerFactory class."""
+    
+    def test_create_logger_reuses_configured_logger(self):
+        """Test that asking again with the same settings keeps the same handlers."""
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = str(Path(tmp) / 'logs' / 'test.log')
+            logger = LoggerFactory.create_logger('TestLoggerFactory', 'DEBUG', log_file)
+            handlers = list(logger.handlers)
+            
+            self.assertIs(LoggerFactory.create_logger('TestLoggerFactory', 'debug', log_file), logger)
+            self.assertEqual(logger.handlers, handlers)
+            
+            # File records are buffered until flushed
+            logger.debug('buffered')
+            self.assertEqual(Path(log_file).read_text(), '')
+            LoggerFactory.flush(logger)
+            self.assertIn('buffered', Path(log_file).read_text())
+            
+            LoggerFactory.create_logger('TestLoggerFactory', 'INFO', log_file)
+            self.assertEqual(logger.level, logging.INFO)
+            self.assertNotEqual(logger.handlers, handlers)
+            for handler in logger.handlers:
+                handler.close()
+    
+    def test_workers_log_through_parent_handlers(self):
+        """Test that worker processes' records are written by the parent's file handler."""
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = str(Path(tmp) / 'test.log')
+            logger = LoggerFactory.create_logger('TestLoggerFactoryWorkers', 'INFO', log_file)
+            
+            with LoggerFactory.forward_from_workers(logger) as (initializer, initargs), \
+                    ProcessPoolExecutor(2, initializer=initializer, initargs=initargs) as executor:
+                pids = list(executor.map(_log_in_worker, ['first', 'second']))
+            LoggerFactory.flush(logger)
+            
+            self.assertNotIn(os.getpid(), pids)
+            text = Path(log_file).read_text()
+            self.assertIn('first', text)
+            self.assertIn('second', text)
+            self.assertFalse(Path('logs/unused.log').exists())
+            for handler in logger.handlers:
+                handler.close()
+
 class TestLincolnImporter(unittest.TestCase):
     """Test the LincolnImporter class."""
     
-    def setUp(self):
-        self.importer = LincolnImporter('test_connection_string')
+    @classmethod
+    def setUpClass(cls):
+        # One importer shared by the tests; each test patches the components it replaces
+        cls.importer = LincolnImporter('test_connection_string', log_level='CRITICAL')
     
     def test_initialization(self):
         """Test importer initialization."""
@@ -138,35 +369,88 @@ class TestLincolnImporter(unittest.TestCase):
         self.assertIsNotNone(self.importer.data_processor)
         self.assertIsNotNone(self.importer.db_manager)
     
-    @patch('src.lincoln_importer.FileProcessor')
-    @patch('src.lincoln_importer.DatabaseManager')
-    def test_import_lincoln_data(self, mock_db_manager, mock_file_processor):
+    def test_processors_are_shared(self):
+        """Test that importers share their file and data processors but not their database manager."""
+        importer = LincolnImporter('test_connection_string', log_level='CRITICAL')
+        
+        self.assertIs(importer.file_processor, self.importer.file_processor)
+        self.assertIs(importer.data_processor, self.importer.data_processor)
+        self.assertIsNot(importer.db_manager, self.importer.db_manager)
+    
+    def test_import_lincoln_data(self):
         """Test Lincoln data import process."""
-        # Mock file processor
-        mock_file_processor.return_value.validate_file_exists.return_value = True
-        mock_file_processor.return_value.read_file.return_value = pd.DataFrame({
-            'family_name': ['Smith'],
-            'english_given_name': ['John'],
-            'year_of_birth': [1890]
-        })
-        mock_file_processor.return_value.get_column_mapping.return_value = {
-            'family_name': 'family_name',
-            'english_given_name': 'english_given_name',
-            'year_of_birth': 'year_of_birth'
-        }
+        with patch.object(self.importer, 'file_processor') as mock_file_processor, \
+                patch.object(self.importer, 'db_manager') as mock_db_manager:
+            # Mock file processor
+            mock_file_processor.validate_file_exists.return_value = True
+            mock_file_processor.iter_chunks.return_value = iter([pd.DataFrame({
+                'family_name': ['Smith'],
+                'english_given_name': ['John'],
+                'year_of_birth': [1890]
+            })])
+            mock_file_processor.get_column_mapping.return_value = {
+                'family_name': 'family_name',
+                'english_given_name': 'english_given_name',
+                'year_of_birth': 'year_of_birth'
+            }
+            
+            # Mock database manager
+            mock_db_manager.connection_string = 'test_connection_string'
+            mock_db_manager.create_lincoln_table.return_value = None
+            mock_db_manager.copy_lincoln_records.return_value = None
+            
+            # Test import
+            self.importer.import_lincoln_data('test_file.csv')
+        
+        # Verify calls
+        mock_file_processor.validate_file_exists.assert_called_once_with('test_file.csv')
+        mock_file_processor.iter_chunks.assert_called_once_with(
+            'test_file.csv', columns=mock_file_processor.get_column_mapping.return_value
+        )
+        mock_db_manager.create_lincoln_table.assert_called_once()
+        mock_db_manager.copy_lincoln_records.assert_called_once()
+        mock_db_manager.commit.assert_called_once()
+        mock_db_manager.create_lincoln_indexes.assert_called_once()
+    
+    def test_import_many(self):
+        """Test that files cleaned in worker processes load together, in order."""
+        file_path = 'data/Lincoln_student_data.csv'
+        expected = self.importer.read_lincoln_file(file_path)
+        
+        with patch.object(self.importer, 'db_manager', Mock(connection_string='test_connection_string')) as db_manager, \
+                patch('src.lincoln_importer.os.cpu_count', return_value=2):
+            self.importer.import_many([file_path, file_path])
         
-        # Mock database manager
-        mock_db_manager.return_value.create_lincoln_schema.return_value = None
-        mock_db_manager.return_value.insert_lincoln_records.return_value = None
+        db_manager.copy_lincoln_records.assert_called_once_with(expected + expected, commit=False)
+        db_manager.commit.assert_called_once()
+    
+    def test_import_lincoln_data_cleans_chunks_in_parallel(self):
+        """Test that chunks cleaned in worker processes load in file order."""
+        file_path = 'data/Lincoln_student_data.csv'
+        expected = self.importer.read_lincoln_file(file_path)
+        chunks = self.importer.file_processor.iter_chunks(file_path, chunksize=500)
         
-        # Test import
-        self.importer.import_lincoln_data('test_file.csv')
+        with patch.object(self.importer, 'db_manager', Mock(connection_string='test_connection_string')) as db_manager, \
+                patch.object(self.importer.file_processor, 'iter_chunks', return_value=chunks), \
+                patch('src.lincoln_importer.os.cpu_count', return_value=2):
+            self.importer.import_lincoln_data(file_path)
         
-        # Verify calls
-        mock_file_processor.return_value.validate_file_exists.assert_called_once_with('test_file.csv')
-        mock_file_processor.return_value.read_file.assert_called_once_with('test_file.csv')
-        mock_db_manager.return_value.create_lincoln_schema.assert_called_once()
-        mock_db_manager.return_value.insert_lincoln_records.assert_called_once()
+        loaded = [call.args[0] for call in db_manager.copy_lincoln_records.call_args_list]
+        self.assertGreater(len(loaded), 1)
+        self.assertEqual([record for records in loaded for record in records], expected)
+    
+    def test_import_lincoln_data_cleans_single_chunk_inline(self):
+        """Test that a file read in one chunk is cleaned without starting worker processes."""
+        file_path = 'data/Lincoln_student_data.csv'
+        expected = self.importer.read_lincoln_file(file_path)
+        
+        with patch.object(self.importer, 'db_manager', Mock(connection_string='test_connection_string')) as db_manager, \
+                patch('src.lincoln_importer.os.cpu_count', return_value=4), \
+                patch('src.lincoln_importer.ProcessPoolExecutor') as executor:
+            self.importer.import_lincoln_data(file_path)
+        
+        executor.assert_not_called()
+        db_manager.copy_lincoln_records.assert_called_once_with(expected, commit=False)
 
 if __name__ == '__main__':
     unittest.main()